@@ -0,0 +1,4 @@
+"""
+Standalone performance benchmarks. Run each module from the repository root,
+e.g. ``python -m benchmarks.bench_streaming``.
+"""
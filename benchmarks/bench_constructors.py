@@ -0,0 +1,64 @@
+"""
+Micro-benchmark constructing each model class from AP API dicts, with
+keyword arguments and with `from_dict`, in microseconds per object. Run
+from the repository root:
+
+    python -m benchmarks.bench_constructors [datafile]
+"""
+from __future__ import print_function
+import copy
+import json
+import sys
+import timeit
+
+from elex.api.models import CandidateReportingUnit, Race, ReportingUnit
+
+DATA_FILE = 'tests/data/20160301_super_tuesday.json'
+NUMBER = 20000
+REPEAT = 9
+
+
+def per_object(fn):
+    return min(timeit.repeat(fn, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main(datafile):
+    with open(datafile) as readfile:
+        payload = json.load(readfile)
+
+    race_dict = payload['races'][0]
+    unit_dict = dict(race_dict['reportingUnits'][-1])
+    candidate_dict = dict(unit_dict['candidates'][0])
+    candidate_dict['is_ballot_measure'] = False
+    unit_dict['candidates'] = []
+    race_only = dict(race_dict)
+    race_only['reportingUnits'] = []
+
+    race = Race(**copy.deepcopy(race_dict))
+    unit = race.reportingunits[-1]
+
+    print('{0:<24} {1:>10} {2:>12}'.format('class', 'kwargs us', 'from_dict us'))
+    for name, kwargs_fn, from_dict_fn in [
+        (
+            'CandidateReportingUnit',
+            lambda: CandidateReportingUnit(context=unit, **candidate_dict),
+            lambda: CandidateReportingUnit.from_dict(candidate_dict, unit),
+        ),
+        (
+            'ReportingUnit',
+            lambda: ReportingUnit(context=race, **unit_dict),
+            lambda: ReportingUnit.from_dict(unit_dict, race),
+        ),
+        (
+            'Race',
+            lambda: Race(**race_only),
+            lambda: Race.from_dict(race_only),
+        ),
+    ]:
+        print('{0:<24} {1:>10.2f} {2:>12.2f}'.format(
+            name, per_object(kwargs_fn), per_object(from_dict_fn)
+        ))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else DATA_FILE)
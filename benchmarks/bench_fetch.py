@@ -0,0 +1,61 @@
+"""
+Time fetching and parsing election results over HTTP against the local
+stand-in AP API server, for a first (200) request and for repeat polls
+answered with 304s. Run from the repository root:
+
+    python -m benchmarks.bench_fetch [electiondate ...]
+"""
+from __future__ import print_function
+import sys
+import time
+
+import elex
+import requests
+from cachecontrol import CacheControl
+from elex.api import Election
+from elex.cachecontrol_caches import MemoryCache
+from elex.cachecontrol_heuristics import EtagOnlyCache
+from elex.server import StandInServer
+
+ELECTION_DATES = ['2015-11-03', '2016-03-01']
+POLLS = 10
+LATENCY = 0.05
+
+
+def fetch(electiondate):
+    start = time.time()
+    election = Election(electiondate=electiondate)
+    count = len(election.results)
+    return (time.time() - start) * 1000, count, election._response.from_cache
+
+
+def main(election_dates):
+    server = StandInServer(latency=LATENCY).start()
+    elex.BASE_URL = server.base_url
+    elex.API_KEY = 'stand-in'
+
+    template = '{0:<12} {1:<6} {2:>8} {3:>10.1f} {4:>10.1f}'
+    print('{0:<12} {1:<6} {2:>8} {3:>10} {4:>10}'.format(
+        'date', 'poll', 'results', 'mean ms', 'max ms'
+    ))
+    try:
+        for electiondate in election_dates:
+            elex._cache = CacheControl(
+                requests.session(),
+                cache=MemoryCache(),
+                heuristic=EtagOnlyCache()
+            )
+            first, count, cached = fetch(electiondate)
+            print(template.format(electiondate, '200', count, first, first))
+
+            timings = [fetch(electiondate)[0] for i in range(POLLS)]
+            print(template.format(
+                electiondate, '304', count,
+                sum(timings) / len(timings), max(timings)
+            ))
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or ELECTION_DATES)
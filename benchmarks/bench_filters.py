@@ -0,0 +1,65 @@
+"""
+Time building the model objects for a whole payload and for filtered
+subsets of it, to check that narrower requests cost proportionally less.
+Run from the repository root:
+
+    python -m benchmarks.bench_filters [datafile ...]
+"""
+from __future__ import print_function
+import gc
+import json
+import sys
+import time
+
+from elex.api import Election
+
+DATA_FILES = [
+    'tests/data/20160426_ct_rollups.json',
+    'tests/data/20160301_super_tuesday.json',
+]
+FILTERS = [
+    ('all', {}),
+    ('levels=state', {'levels': ['state']}),
+    ('statepostals=CT', {'statepostals': ['CT']}),
+    ('statepostals=CT levels=county', {'statepostals': ['CT'], 'levels': ['county']}),
+    ('officeids=P', {'officeids': 'P'}),
+]
+RUNS = 5
+
+
+def build(content, filters):
+    # Building objects adds keys to the payload's dicts, so each run
+    # decodes its own copy before the clock starts.
+    payload = json.loads(content)
+    election = Election(electiondate=payload.get('electionDate'), **filters)
+    gc.collect()
+    start = time.time()
+    units = election.get_units(election.get_race_objects(payload))
+    return time.time() - start, units
+
+
+def main(data_files):
+    template = '{0:<40} {1:<30} {2:>8} {3:>9.1f}'
+    print('{0:<40} {1:<30} {2:>8} {3:>9}'.format(
+        'file', 'filters', 'results', 'build ms'
+    ))
+    for datafile in data_files:
+        with open(datafile) as readfile:
+            content = readfile.read()
+
+        for name, filters in FILTERS:
+            times = []
+            for run in range(RUNS):
+                seconds, units = build(content, filters)
+                times.append(seconds)
+
+            print(template.format(
+                datafile,
+                name,
+                len(units[2]),
+                min(times) * 1000
+            ))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or DATA_FILES)
@@ -0,0 +1,74 @@
+"""
+Time building the model objects (races, reporting units and candidate
+reporting units) from a decoded payload, and measure the memory they
+keep alive once the payload is gone. Run from the repository root:
+
+    python -m benchmarks.bench_models [datafile ...]
+"""
+from __future__ import print_function
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from elex.api import Election
+
+DATA_FILES = [
+    'tests/data/20160426_ct_rollups.json',
+    'tests/data/20160426-ri_mail_ballots.json',
+    'tests/data/20160301_super_tuesday.json',
+    'tests/data/20121106_me_fl_senate.json',
+]
+RUNS = 5
+
+
+def build(content):
+    # Building objects adds keys to the payload's dicts, so each run
+    # decodes its own copy before the clock starts.
+    payload = json.loads(content)
+    election = Election(electiondate=payload.get('electionDate'))
+    gc.collect()
+    start = time.time()
+    units = election.get_units(election.get_race_objects(payload))
+    return time.time() - start, units
+
+
+def kept_memory(content):
+    gc.collect()
+    tracemalloc.start()
+    seconds, units = build(content)
+    gc.collect()
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept
+
+
+def main(data_files):
+    template = '{0:<45} {1:>6} {2:>6} {3:>8} {4:>9.1f} {5:>8.1f}'
+    print('{0:<45} {1:>6} {2:>6} {3:>8} {4:>9} {5:>8}'.format(
+        'file', 'races', 'units', 'results', 'build ms', 'kept MB'
+    ))
+    for datafile in data_files:
+        with open(datafile) as readfile:
+            content = readfile.read()
+
+        times = []
+        for run in range(RUNS):
+            seconds, units = build(content)
+            times.append(seconds)
+        counts = [len(objs) for objs in units]
+        del units
+
+        print(template.format(
+            datafile,
+            counts[0],
+            counts[1],
+            counts[2],
+            min(times) * 1000,
+            kept_memory(content) / 1024.0 / 1024.0
+        ))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or DATA_FILES)
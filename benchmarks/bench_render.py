@@ -0,0 +1,69 @@
+"""
+Measure CSV output throughput, in rows per second, for results rows
+written from row tuples (as the output handlers do) and from serialized
+dicts. Run from the repository root:
+
+    python -m benchmarks.bench_render [datafile ...]
+"""
+from __future__ import print_function
+import csv
+import sys
+import time
+
+try:
+    from io import StringIO
+except ImportError:
+    from StringIO import StringIO
+
+from elex.api import Election
+from elex.cli.utils import get_rows
+
+DATA_FILES = [
+    'tests/data/20160426_ct_rollups.json',
+    'tests/data/20160301_super_tuesday.json',
+]
+RUNS = 5
+
+
+def render_rows(data):
+    writer = csv.writer(StringIO(), lineterminator='\n')
+    columns, rows = get_rows(data, with_timestamp=True, batch_name='batch')
+    writer.writerow(columns)
+    writer.writerows(rows)
+
+
+def render_dicts(data):
+    writer = csv.writer(StringIO(), lineterminator='\n')
+    now = time.time()
+    for i, obj in enumerate(data):
+        row = obj.serialize()
+        row['timestamp'] = str(int(now))
+        row['batchname'] = 'batch'
+        if i == 0:
+            writer.writerow(row.keys())
+        writer.writerow(row.values())
+
+
+def rows_per_second(render, data):
+    times = []
+    for run in range(RUNS):
+        start = time.time()
+        render(data)
+        times.append(time.time() - start)
+    return len(data) / min(times)
+
+
+def main(data_files):
+    template = '{0:<45} {1:>8} {2:>12.0f} {3:>12.0f} {4:>8.2f}'
+    print('{0:<45} {1:>8} {2:>12} {3:>12} {4:>8}'.format(
+        'file', 'rows', 'dicts/s', 'tuples/s', 'speedup'
+    ))
+    for datafile in data_files:
+        data = Election(electiondate='2016-01-01', datafile=datafile).results
+        dicts = rows_per_second(render_dicts, data)
+        tuples = rows_per_second(render_rows, data)
+        print(template.format(datafile, len(data), dicts, tuples, tuples / dicts))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or DATA_FILES)
@@ -0,0 +1,59 @@
+"""
+Time rolling New England townships up into counties for every race in a
+payload, after its races have been built and tallied. Run from the
+repository root:
+
+    python -m benchmarks.bench_rollups [datafile ...]
+"""
+from __future__ import print_function
+import json
+import sys
+import time
+
+from elex.api import Election, maps, tally
+
+DATA_FILES = [
+    'tests/data/20160426_ct_rollups.json',
+    'tests/data/20160426-ri_mail_ballots.json',
+]
+RUNS = 10
+
+
+def main(data_files):
+    template = '{0:<45} {1:>6} {2:>10} {3:>9} {4:>11.2f}'
+    print('{0:<45} {1:>6} {2:>10} {3:>9} {4:>11}'.format(
+        'file', 'races', 'townships', 'counties', 'rollup ms'
+    ))
+    for datafile in data_files:
+        with open(datafile) as readfile:
+            payload = json.load(readfile)
+
+        races = [
+            race for race in
+            Election(electiondate=payload.get('electionDate'))._get_race_objects(payload)
+            if race.statepostal in maps.FIPS_TO_STATE
+        ]
+        tally.tally_races(races)
+        townships = [list(race.reportingunits) for race in races]
+
+        times = []
+        for run in range(RUNS):
+            for race, units in zip(races, townships):
+                race.reportingunits = list(units)
+            start = time.time()
+            for race in races:
+                race.set_new_england_counties()
+            times.append(time.time() - start)
+
+        print(template.format(
+            datafile,
+            len(races),
+            sum(len(units) for units in townships),
+            sum(len(race.reportingunits) for race in races) -
+            sum(len(units) for units in townships),
+            min(times) * 1000
+        ))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or DATA_FILES)
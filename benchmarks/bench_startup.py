@@ -0,0 +1,85 @@
+"""
+Measure interpreter startup cost of importing elex and running the CLI.
+
+Each case runs in a fresh interpreter so import work is never shared
+between runs. Reports the median and best wall time in milliseconds, and
+for CLI commands that print data, the time from a cold start to the
+first byte of output. Run from the repository root:
+
+    python -m benchmarks.bench_startup
+"""
+from __future__ import print_function
+import subprocess
+import sys
+import time
+
+RUNS = 15
+
+CLI = 'import sys; from elex.cli import main; sys.argv = {0!r}; main()'
+
+CASES = [
+    ('python (baseline)', 'pass'),
+    ('import elex', 'import elex'),
+    ('import elex.api', 'import elex.api'),
+    ('import elex.api.maps', 'import elex.api.maps'),
+    ('elex --help', CLI.format(['elex', '--help'])),
+]
+
+FIRST_BYTE_CASES = [
+    ('elex races (csv)', CLI.format([
+        'elex', 'races', '--data-file', 'tests/data/20151103_national.json'
+    ])),
+    ('elex results (csv)', CLI.format([
+        'elex', 'results', '--data-file', 'tests/data/20151103_national.json'
+    ])),
+    ('elex results (json)', CLI.format([
+        'elex', 'results', '--data-file', 'tests/data/20151103_national.json',
+        '-o', 'json'
+    ])),
+]
+
+
+def run(code, runs=RUNS):
+    timings = []
+    for i in range(runs):
+        start = time.time()
+        subprocess.call(
+            [sys.executable, '-c', code],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        timings.append((time.time() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], timings[0]
+
+
+def first_byte(code, runs=RUNS):
+    timings = []
+    for i in range(runs):
+        start = time.time()
+        process = subprocess.Popen(
+            [sys.executable, '-c', code],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        process.stdout.read(1)
+        timings.append((time.time() - start) * 1000)
+        process.communicate()
+    timings.sort()
+    return timings[len(timings) // 2], timings[0]
+
+
+def main():
+    template = '{0:<30} {1:>10.1f} {2:>10.1f}'
+    print('{0:<30} {1:>10} {2:>10}'.format('case', 'median ms', 'best ms'))
+    for name, code in CASES:
+        print(template.format(name, *run(code)))
+
+    print('')
+    print('{0:<30} {1:>10} {2:>10}'.format('first output byte', 'median ms', 'best ms'))
+    for name, code in FIRST_BYTE_CASES:
+        print(template.format(name, *first_byte(code)))
+
+
+if __name__ == '__main__':
+    main()
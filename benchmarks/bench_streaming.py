@@ -0,0 +1,73 @@
+"""
+Compare full-payload parsing with streaming race parsing.
+
+Reports total time, time to the first race object and peak traced memory
+for each fixture. Run from the repository root:
+
+    python -m benchmarks.bench_streaming
+"""
+from __future__ import print_function
+import sys
+import time
+import tracemalloc
+
+from elex.api import Election
+
+DATA_FILES = [
+    'tests/data/20160426_ct_rollups.json',
+    'tests/data/20160301_super_tuesday.json',
+]
+
+
+def parse_full(datafile):
+    election = Election(datafile=datafile)
+    races = election.get_race_objects(election.get_raw_races())
+    first = time.time()
+    count = 0
+    for race in races:
+        count += 1
+    return first, count
+
+
+def parse_streaming(datafile):
+    election = Election(datafile=datafile)
+    first = None
+    count = 0
+    for race in election.iter_race_objects():
+        if first is None:
+            first = time.time()
+        count += 1
+    return first, count
+
+
+def measure(fn, datafile):
+    tracemalloc.start()
+    start = time.time()
+    first, count = fn(datafile)
+    end = time.time()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'races': count,
+        'first_ms': (first - start) * 1000,
+        'total_ms': (end - start) * 1000,
+        'peak_mb': peak / 1024.0 / 1024.0,
+    }
+
+
+def main(data_files):
+    template = '{0:<45} {1:<10} {2:>6} {3:>10.1f} {4:>10.1f} {5:>9.1f}'
+    print('{0:<45} {1:<10} {2:>6} {3:>10} {4:>10} {5:>9}'.format(
+        'file', 'mode', 'races', 'first ms', 'total ms', 'peak MB'
+    ))
+    for datafile in data_files:
+        for mode, fn in (('full', parse_full), ('streaming', parse_streaming)):
+            result = measure(fn, datafile)
+            print(template.format(
+                datafile, mode, result['races'], result['first_ms'],
+                result['total_ms'], result['peak_mb']
+            ))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or DATA_FILES)
@@ -0,0 +1,71 @@
+"""
+Compare Election.results_table() with Election.results: time to build
+each from a datafile, and the memory each keeps alive. Run from the
+repository root:
+
+    python -m benchmarks.bench_table [datafile ...]
+"""
+from __future__ import print_function
+import gc
+import sys
+import time
+import tracemalloc
+
+from elex.api import Election
+
+DATA_FILES = [
+    'tests/data/20160426_ct_rollups.json',
+    'tests/data/20160301_super_tuesday.json',
+]
+RUNS = 3
+
+
+def build(datafile, method):
+    election = Election(electiondate='2016-01-01', datafile=datafile)
+    gc.collect()
+    start = time.time()
+    results = method(election)
+    return time.time() - start, results
+
+
+def kept_memory(datafile, method):
+    gc.collect()
+    tracemalloc.start()
+    seconds, results = build(datafile, method)
+    gc.collect()
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept
+
+
+METHODS = [
+    ('results', lambda election: election.results),
+    ('results_table()', lambda election: election.results_table()),
+]
+
+
+def main(data_files):
+    template = '{0:<45} {1:<16} {2:>8} {3:>9.1f} {4:>8.2f}'
+    print('{0:<45} {1:<16} {2:>8} {3:>9} {4:>8}'.format(
+        'file', 'method', 'rows', 'build ms', 'kept MB'
+    ))
+    for datafile in data_files:
+        for name, method in METHODS:
+            times = []
+            for run in range(RUNS):
+                seconds, results = build(datafile, method)
+                times.append(seconds)
+            rows = len(results)
+            del results
+
+            print(template.format(
+                datafile,
+                name,
+                rows,
+                min(times) * 1000,
+                kept_memory(datafile, method) / 1024.0 / 1024.0
+            ))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or DATA_FILES)
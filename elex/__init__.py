@@ -1,10 +1,6 @@
 import os
-import requests
 import tempfile
-
-from cachecontrol import CacheControl
-from cachecontrol.caches import FileCache
-from elex.cachecontrol_heuristics import EtagOnlyCache
+import threading
 
 __version__ = '2.4.3'
 _DEFAULT_CACHE_DIRECTORY = os.path.join(tempfile.gettempdir(), 'elex-cache')
@@ -13,9 +9,72 @@ API_KEY = os.environ.get('AP_API_KEY', None)
 API_VERSION = os.environ.get('AP_API_VERSION', 'v2')
 BASE_URL = os.environ.get('AP_API_BASE_URL', 'http://api.ap.org/{0}'.format(API_VERSION))
 CACHE_DIRECTORY = os.environ.get('ELEX_CACHE_DIRECTORY', _DEFAULT_CACHE_DIRECTORY)
+CACHE_BACKEND = os.environ.get('ELEX_CACHE_BACKEND', 'file')
+CACHE_MAX_SIZE = os.environ.get('ELEX_CACHE_MAX_SIZE', None)
+CACHE_MAX_AGE = os.environ.get('ELEX_CACHE_MAX_AGE', None)
+CACHE_MAX_ENTRIES = os.environ.get('ELEX_CACHE_MAX_ENTRIES', None)
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """
+    Return the shared, caching HTTP session used for AP API requests.
+
+    The `requests` session, CacheControl wrapper and response cache
+    (selected by `ELEX_CACHE_BACKEND`) are built on first use rather than at import time, so commands and
+    library users that never touch the network don't pay for them.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                import requests
+                from cachecontrol import CacheControl
+                from elex.cachecontrol_caches import get_cache_backend
+                from elex.cachecontrol_heuristics import EtagOnlyCache
+
+                session = requests.session()
+                session.headers.update({'Accept-Encoding': 'gzip'})
+                backend = get_cache_backend(
+                    CACHE_BACKEND,
+                    CACHE_DIRECTORY,
+                    max_size=int(CACHE_MAX_SIZE) if CACHE_MAX_SIZE else None,
+                    max_age=int(CACHE_MAX_AGE) if CACHE_MAX_AGE else None,
+                    max_entries=(
+                        int(CACHE_MAX_ENTRIES) if CACHE_MAX_ENTRIES else None
+                    )
+                )
+                _cache = CacheControl(session,
+                                      cache=backend,
+                                      heuristic=EtagOnlyCache())
+    return _cache
+
+
+class _LazySession(object):
+    """
+    Stands in for the shared session returned by :func:`get_cache`,
+    building it the first time it is used. Keeps `elex.cache` and
+    `elex.session` working for existing code on every supported Python.
+    """
+    def __getattr__(self, name):
+        return getattr(get_cache(), name)
+
+    def __setattr__(self, name, value):
+        setattr(get_cache(), name, value)
+
+    def __delattr__(self, name):
+        delattr(get_cache(), name)
+
+    def __enter__(self):
+        return get_cache().__enter__()
+
+    def __exit__(self, *args):
+        return get_cache().__exit__(*args)
+
+    def __repr__(self):
+        return repr(get_cache())
+
 
-session = requests.session()
-session.headers.update({'Accept-Encoding': 'gzip'})
-cache = CacheControl(session,
-                     cache=FileCache(CACHE_DIRECTORY),
-                     heuristic=EtagOnlyCache())
+cache = session = _LazySession()
@@ -0,0 +1,79 @@
+"""
+Asyncio interface to the Associated Press Elections API.
+
+Requests are run on a shared thread pool through :func:`utils.api_request`,
+so they keep its semantics -- API key handling, sorted params for
+consistent cache keys, ETag caching and recording -- while an
+election-night service can await several of them concurrently::
+
+    import asyncio
+    from elex.api import aio, Election, DelegateReport, USSenateTrendReport
+
+    election = Election(electiondate='2016-11-08')
+    results, delegates, senate = asyncio.get_event_loop().run_until_complete(
+        asyncio.gather(
+            election.results_async(),
+            DelegateReport.fetch_async(),
+            USSenateTrendReport.fetch_async(),
+        )
+    )
+
+Requires Python 3. This module is not imported by :mod:`elex.api`.
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from elex.api import utils
+
+MAX_WORKERS = int(os.environ.get('ELEX_ASYNC_MAX_WORKERS', 8))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Return the thread pool shared by all asynchronous requests.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    return _executor
+
+
+async def run(fn, *args, **kwargs):
+    """
+    Run a blocking callable on the shared thread pool and await its result.
+
+    :param fn:
+        Callable to run.
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        get_executor(),
+        functools.partial(fn, *args, **kwargs)
+    )
+
+
+async def api_request(path, **params):
+    """
+    Awaitable version of :func:`elex.api.utils.api_request`.
+
+    :param path:
+        API url path.
+    :param \\**params:
+        Extra parameters to pass to `requests`.
+    """
+    return await run(utils.api_request, path, **params)
+
+
+async def get_reports(params={}):
+    """
+    Awaitable version of :func:`elex.api.utils.get_reports`.
+    """
+    return await run(utils.get_reports, params=params)
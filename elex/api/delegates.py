@@ -71,6 +71,11 @@ class DelegateReport(utils.UnicodeMixin):
     [z.__dict__ for z in d.candidates]
     """
 
+    report_titles = {
+        'delSum': 'Delegates / delsum',
+        'delSuper': 'Delegates / delsuper',
+    }
+
     def __init__(self, **kwargs):
         self.reports = None
         self.candidate_objects = []
@@ -82,6 +87,16 @@ class DelegateReport(utils.UnicodeMixin):
         self.parse_sum()
         self.output_candidates()
 
+    @classmethod
+    def fetch_async(cls, **kwargs):
+        """
+        Build a report on the asynchronous request thread pool; returns an
+        awaitable. Accepts the same arguments as the constructor.
+        Requires Python 3.
+        """
+        from elex.api import aio
+        return aio.run(cls, **kwargs)
+
     def output_candidates(self):
         """
         Transforms our multi-layered dict of candidates / states
@@ -187,9 +202,11 @@ class DelegateReport(utils.UnicodeMixin):
         Given a report number and a key for indexing, returns a list
         of delegate counts by party. Makes a request from the AP
         using requests. Formats that request with env vars.
+
+        The report ID is resolved through the shared, cached reports
+        listing (see :func:`elex.api.utils.get_reports`).
         """
-        reports = utils.get_reports(params=params)
-        report_id = self.get_report_id(reports, key)
+        report_id = utils.get_report_id(self.report_titles[key], params=params)
         if report_id:
             r = utils.api_request('/reports/{0}'.format(report_id), **params)
             return r.json()[key]['del']
@@ -200,17 +217,9 @@ class DelegateReport(utils.UnicodeMixin):
         """
         Takes a delSuper or delSum as the argument and returns
         organization-specific report ID.
-        """
-
-        for report in reports:
-            if (
-                key == 'delSum' and
-                report.get('title') == 'Delegates / delsum'
-            ) or (
-                key == 'delSuper' and
-                report.get('title') == 'Delegates / delsuper'
-            ):
-                id = report.get('id').rsplit('/', 1)[-1]
-                return id
 
-        return None
+        Kept for compatibility; see :func:`elex.api.utils.get_report_id`.
+        """
+        if key not in self.report_titles:
+            return None
+        return utils.get_report_id(self.report_titles[key], reports=reports)
@@ -0,0 +1,104 @@
+"""
+Declarative tables mapping AP API keys to model attributes.
+
+The API sends camelCase keys (``voteCount``, ``polID``), while objects
+built from other objects or by hand are passed the lowercase attribute
+names (``votecount``, ``polid``). A :class:`Field` lists the keys an
+attribute is read from: the first key, or the default, gives the value,
+and any later key overrides it when present and truthy. An optional
+transform is applied to the first key's value only, e.g. AP's
+``precinctsReportingPct`` is a percentage but ``precinctsreportingpct``
+is already a fraction.
+
+A :class:`FieldTable` is compiled once, when its class is defined, into
+a function that sets every attribute with straight-line code, checking
+the override keys only if the incoming dict has any of them.
+"""
+from collections import namedtuple
+
+
+class Field(namedtuple('Field', ['name', 'keys', 'default', 'transform'])):
+    """
+    An attribute `name` read from `keys` (a key, or a tuple of the key and
+    its override keys), with a `default` if the first key is missing and
+    an optional `transform` of the first key's value. Defaults are shared
+    by every object, so they should be immutable.
+    """
+    __slots__ = ()
+
+    def __new__(cls, name, keys, default=None, transform=None):
+        return super(Field, cls).__new__(cls, name, keys, default, transform)
+
+
+def is_winner(value):
+    """
+    AP marks winners with `X`.
+    """
+    return value == 'X'
+
+
+def is_runoff(value):
+    """
+    AP marks candidates advancing to a runoff with `R`.
+    """
+    return value == 'R'
+
+
+def from_percent(value):
+    """
+    Convert a percentage to a fraction.
+    """
+    return value * 0.01
+
+
+class FieldTable(object):
+    """
+    A compiled table of :class:`Field` objects.
+    """
+    def __init__(self, fields):
+        """
+        :param fields:
+            A sequence of :class:`Field` objects.
+        """
+        self.fields = tuple(fields)
+        self.override_keys = frozenset(
+            key for field in self.fields for key in self._keys(field)[1:]
+        )
+        self.build = self._compile()
+
+    @staticmethod
+    def _keys(field):
+        if isinstance(field.keys, tuple):
+            return field.keys
+        return (field.keys,)
+
+    def _compile(self):
+        namespace = {'override_keys': self.override_keys}
+        lines = ['def build(obj, kwargs):']
+        overrides = []
+        for i, field in enumerate(self.fields):
+            keys = self._keys(field)
+            if field.default is None or type(field.default) in (bool, int, float):
+                default = repr(field.default)
+            else:
+                default = 'default_%d' % i
+                namespace[default] = field.default
+            value = 'kwargs.get(%r, %s)' % (str(keys[0]), default)
+            if field.transform is not None:
+                namespace['transform_%d' % i] = field.transform
+                value = 'transform_%d(%s)' % (i, value)
+            lines.append('    obj.%s = %s' % (field.name, value))
+            for key in keys[1:]:
+                overrides.append((field.name, key))
+
+        if overrides:
+            lines.append('    if not override_keys.isdisjoint(kwargs):')
+            for name, key in overrides:
+                lines.extend([
+                    '        value = kwargs.get(%r)' % str(key),
+                    '        if value:',
+                    '            obj.%s = value' % name,
+                ])
+
+        exec(compile('\n'.join(lines), '<FieldTable>', 'exec'), namespace)
+        return namespace['build']
@@ -0,0 +1,176 @@
+"""
+Select races and reporting units from a raw AP payload before any model
+objects are built.
+
+A :class:`RaceFilter` tests the decoded race and reporting unit dicts, so
+races, units and candidates that aren't wanted are never constructed::
+
+    races = RaceFilter(statepostals=['CT'], levels=['county'])
+
+Races are selected by `raceids`, `officeids`, `statepostals` and
+`national`; reporting units by `statepostals` and `levels`. Levels are
+those of :attr:`elex.api.models.ReportingUnit.level`: AP's ``subunit`` is
+``township`` in New England and ``county`` everywhere else. New England
+counties are rolled up from townships, so when counties are wanted the
+townships are built too and dropped by :meth:`RaceFilter.prune` once the
+counties have been added.
+"""
+import six
+
+from elex.api import maps
+
+
+def to_set(values):
+    """
+    Return `values`, a list or comma-delimited string, as a frozenset, or
+    None if it is empty.
+    """
+    if not values:
+        return None
+    if isinstance(values, six.string_types):
+        values = values.split(',')
+    return frozenset(six.text_type(value).strip() for value in values)
+
+
+class RaceFilter(object):
+    """
+    A filter on raw race and reporting unit dicts. Criteria that are None
+    or empty match everything.
+    """
+    def __init__(self, raceids=None, officeids=None, statepostals=None,
+                 levels=None, national=None):
+        """
+        :param raceids:
+            List of AP race IDs.
+        :param officeids:
+            List, or comma-delimited string, of AP office IDs.
+        :param statepostals:
+            List, or comma-delimited string, of state postal codes.
+        :param levels:
+            List, or comma-delimited string, of reporting unit levels,
+            e.g. `state`, `county` or `township`.
+        :param national:
+            True for national races only, False for local races only, or
+            None for both.
+        """
+        self.raceids = to_set(raceids)
+        self.officeids = to_set(officeids)
+        self.statepostals = to_set(statepostals)
+        self.levels = to_set(levels)
+        self.national = national
+
+    @property
+    def active(self):
+        """
+        True if this filter can reject anything.
+        """
+        return (
+            self.raceids is not None or
+            self.officeids is not None or
+            self.statepostals is not None or
+            self.levels is not None or
+            self.national is not None
+        )
+
+    def key(self):
+        """
+        Return a hashable key of the criteria, for caches of parsed
+        results.
+        """
+        return tuple(
+            None if value is None else tuple(sorted(value))
+            for value in (
+                self.raceids, self.officeids, self.statepostals, self.levels
+            )
+        ) + (self.national,)
+
+    def match_race(self, race):
+        """
+        Return True if raw race dict `race` passes the race criteria.
+        States are checked separately, in :meth:`filter_race`.
+        """
+        if self.raceids is not None and race.get('raceID') not in self.raceids:
+            return False
+        if self.officeids is not None and race.get('officeID') not in self.officeids:
+            return False
+        if self.national is not None and bool(race.get('national')) != self.national:
+            return False
+        return True
+
+    def match_unit(self, unit):
+        """
+        Return True if raw reporting unit dict `unit` passes the unit
+        criteria.
+        """
+        statepostal = unit.get('statePostal')
+        if self.statepostals is not None and statepostal not in self.statepostals:
+            return False
+        if self.levels is None:
+            return True
+        level = unit.get('level')
+        if level == 'subunit':
+            if statepostal in maps.FIPS_TO_STATE:
+                # Townships are also rolled up into counties.
+                return 'township' in self.levels or 'county' in self.levels
+            level = 'county'
+        return level in self.levels
+
+    def filter_race(self, race):
+        """
+        Return raw race dict `race` if it and all of its reporting units
+        pass, a copy holding only the reporting units that pass, or None
+        if the race doesn't pass.
+        """
+        if not self.match_race(race):
+            return None
+
+        units = race.get('reportingUnits')
+        if not units:
+            if self.statepostals is not None and race.get('statePostal') not in self.statepostals:
+                return None
+            return race
+        if self.statepostals is None and self.levels is None:
+            return race
+
+        kept = [unit for unit in units if self.match_unit(unit)]
+        if not kept:
+            if self.statepostals is not None:
+                return None
+            # Keep the race's state fields, which come from its units.
+            last = units[-1]
+            return dict(
+                race,
+                reportingUnits=kept,
+                statePostal=last.get('statePostal'),
+                stateName=last.get('stateName'),
+            )
+        if len(kept) == len(units):
+            return race
+        return dict(race, reportingUnits=kept)
+
+    def filter_races(self, races):
+        """
+        Iterate over the raw race dicts in `races` that pass, as returned
+        by :meth:`filter_race`.
+        """
+        if not self.active:
+            for race in races:
+                yield race
+            return
+        for race in races:
+            race = self.filter_race(race)
+            if race is not None:
+                yield race
+
+    def prune(self, race):
+        """
+        Drop reporting units kept only to roll up New England counties
+        from built :class:`elex.api.models.Race` `race`, once they have
+        been rolled up.
+        """
+        if self.levels is None or race.statepostal not in maps.FIPS_TO_STATE:
+            return
+        levels = self.levels
+        race.reportingunits = [
+            unit for unit in race.reportingunits if unit.level in levels
+        ]
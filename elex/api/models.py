@@ -2,13 +2,201 @@
 from __future__ import unicode_literals
 import ujson as json
 import datetime
+import operator
+import types
 from elex.api import maps
+from elex.api.fields import Field, FieldTable, from_percent, is_runoff, is_winner
+from elex.api.filters import RaceFilter
+from elex.api import tally
+from elex.api.table import ResultsTable
+from elex.api import timings
 from elex.api import utils
 from collections import OrderedDict
-from dateutil import parser as dateutil_parser
 
 PCT_PRECISION = 6
 
+_field_names = {}
+_context_field_names = {}
+_context_plans = {}
+
+
+def field_names(cls):
+    """
+    Return the names of the public slots and context fields defined on
+    `cls` and its base classes.
+    """
+    names = _field_names.get(cls)
+    if names is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            names.extend(
+                name for name in klass.__dict__.get('__slots__', ())
+                if not name.startswith('_')
+            )
+            names.extend(
+                name for name, value in klass.__dict__.items()
+                if isinstance(value, ContextField)
+            )
+        names = _field_names[cls] = tuple(names)
+    return names
+
+
+def context_field_names(cls):
+    """
+    Return the names of the context fields defined on `cls` and its base
+    classes, as a frozenset.
+    """
+    names = _context_field_names.get(cls)
+    if names is None:
+        names = _context_field_names[cls] = frozenset(
+            name
+            for klass in cls.__mro__
+            for name, value in klass.__dict__.items()
+            if isinstance(value, ContextField)
+        )
+    return names
+
+
+def context_values(obj):
+    """
+    Return the values of all of `obj`'s context fields as a dict. This
+    reads the context's attributes in bulk, which is much faster than
+    reading the fields one at a time.
+
+    :param obj:
+        An object with context fields.
+    """
+    context = obj._context
+    key = (type(obj), type(context))
+    plan = _context_plans.get(key)
+    if plan is None:
+        plan = _context_plans[key] = _context_plan(*key)
+    defaults, slots, get_slots, shared, resolved, other = plan
+
+    values = dict(defaults)
+    if context is not None:
+        if slots:
+            values.update(zip(slots, get_slots(context)))
+        if shared:
+            inherited = context_values(context)
+            for name in shared:
+                values[name] = inherited[name]
+        for field in resolved:
+            values[field.name] = field.resolve(context)
+        for field in other:
+            values[field.name] = getattr(context, field.name, field.default)
+    if obj._overrides:
+        values.update(obj._overrides)
+    return values
+
+
+def _context_plan(cls, context_cls):
+    """
+    Work out how :func:`context_values` reads `cls`'s context fields from
+    a `context_cls` context: the defaults, the names read from plain slots
+    (and a getter returning them as a tuple), the names the context itself
+    shares with its own context, the fields with a `resolve` function and
+    any other fields, which are read one at a time.
+    """
+    fields = [
+        value
+        for klass in reversed(cls.__mro__)
+        for value in klass.__dict__.values()
+        if isinstance(value, ContextField)
+    ]
+    defaults = dict((field.name, field.default) for field in fields)
+    slots = []
+    shared = []
+    resolved = []
+    other = []
+    for field in fields:
+        attribute = getattr(context_cls, field.name, None)
+        if field.resolve is not None:
+            resolved.append(field)
+        elif isinstance(attribute, types.MemberDescriptorType):
+            slots.append(field.name)
+        elif isinstance(attribute, ContextField):
+            shared.append(field.name)
+        else:
+            other.append(field)
+    slots = tuple(slots)
+    get_slots = None
+    if slots:
+        getter = operator.attrgetter(*slots)
+        get_slots = getter if len(slots) > 1 else lambda obj: (getter(obj),)
+    return (defaults, slots, get_slots, tuple(shared), tuple(resolved),
+            tuple(other))
+
+
+def _same(a, b):
+    return a is b or (type(a) is type(b) and a == b)
+
+
+class ContextField(object):
+    """
+    An attribute shared with the object's context: the race or reporting
+    unit that built it. Reading it returns the value set on the object
+    itself, if any, or else the context's current value; setting it only
+    affects this object. Objects without a context get `default`.
+    """
+    __slots__ = ('name', 'default', 'resolve')
+
+    def __init__(self, name, default=None, resolve=None):
+        """
+        :param name:
+            Attribute name, on this object and its context.
+        :param default:
+            Value when neither this object nor its context has one.
+        :param resolve:
+            Optional function computing the value from the context,
+            instead of reading the context's attribute of the same name.
+        """
+        self.name = name
+        self.default = default
+        self.resolve = resolve
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        overrides = obj._overrides
+        if overrides is not None and self.name in overrides:
+            return overrides[self.name]
+        context = obj._context
+        if context is None:
+            return self.default
+        if self.resolve is None:
+            return getattr(context, self.name, self.default)
+        return self.resolve(context)
+
+    def __set__(self, obj, value):
+        context = obj._context
+        overrides = obj._overrides
+        # Only keep values that differ from the context's.
+        if context is not None and _same(value, self.context_value(context)):
+            if overrides is not None:
+                overrides.pop(self.name, None)
+            return
+        if overrides is None:
+            overrides = obj._overrides = {}
+        overrides[self.name] = value
+
+    def context_value(self, context):
+        if context is None:
+            return self.default
+        if self.resolve is not None:
+            return self.resolve(context)
+        return getattr(context, self.name, self.default)
+
+
+def candidate_statename(context):
+    """
+    Candidates are always named after their context's state, if it has one.
+    """
+    statepostal = getattr(context, 'statepostal', None)
+    if statepostal is not None:
+        return maps.STATE_ABBR[statepostal]
+    return getattr(context, 'statename', None)
+
 
 class APElection(utils.UnicodeMixin):
     """
@@ -16,6 +204,64 @@ class APElection(utils.UnicodeMixin):
 
     Includes handy methods for transformation of data and AP connections
     """
+    __slots__ = ()
+
+    def attributes(self):
+        """
+        Return a dict of the attributes set on this object, including
+        those shared with its context, like `__dict__` for objects without
+        `__slots__`.
+        """
+        attributes = {}
+        context_fields = context_field_names(type(self))
+        for name in field_names(type(self)):
+            if name in context_fields:
+                continue
+            try:
+                attributes[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        if context_fields:
+            attributes.update(context_values(self))
+        if hasattr(self, '__dict__'):
+            attributes.update(self.__dict__)
+        return attributes
+
+    @classmethod
+    def from_dict(cls, kwargs, context=None, **options):
+        """
+        Build an object from a dict of constructor keyword arguments,
+        such as one parsed from the AP API, without copying it into
+        keyword arguments. Classes implementing :meth:`set_fields`
+        support it.
+
+        :param kwargs:
+            Dict of constructor keyword arguments.
+        :param context:
+            Optional parent object; see :meth:`set_context`.
+        :param \**options:
+            Other options for :meth:`set_fields`.
+        """
+        obj = cls.__new__(cls)
+        obj.set_fields(kwargs, context, **options)
+        return obj
+
+    def set_context(self, context, kwargs):
+        """
+        Share this object's context fields with `context`, the race or
+        reporting unit building it. Context fields passed in `kwargs`
+        override the context's values.
+
+        :param context:
+            Parent object, or None.
+        :param kwargs:
+            Constructor keyword arguments.
+        """
+        self._context = context
+        self._overrides = None
+        for name in context_field_names(type(self)).intersection(kwargs):
+            setattr(self, name, kwargs[name])
+
     def set_state_fields_from_reportingunits(self):
         """
         Set state fields.
@@ -24,25 +270,22 @@ class APElection(utils.UnicodeMixin):
             self.statepostal = str(self.reportingunits[-1].statepostal)
             self.statename = str(maps.STATE_ABBR[self.statepostal])
 
-    def set_reportingunits(self):
+    def set_reportingunits(self, defer_tally=False):
         """
         Set reporting units.
 
         If this race has reportingunits,
         serialize them into objects.
+
+        :param defer_tally:
+            If True, leave vote counts and percentages to
+            :mod:`elex.api.tally`.
         """
         reportingunits_obj = []
 
         for r in self.reportingunits:
-
-            # Don't obliterate good data with possibly empty fields.
-            SKIP_FIELDS = ['candidates', 'statepostal', 'statename']
-
-            for k, v in self.__dict__.items():
-                if k not in SKIP_FIELDS:
-                    r[k] = v
-
-            obj = ReportingUnit(**r)
+            # Race fields are shared with the race rather than copied.
+            obj = ReportingUnit.from_dict(r, self, defer_tally=defer_tally)
 
             reportingunits_obj.append(obj)
         setattr(self, 'reportingunits', reportingunits_obj)
@@ -83,21 +326,16 @@ class APElection(utils.UnicodeMixin):
         serialize them into objects.
         """
         candidate_objs = []
+        is_ballot_measure = getattr(self, 'officeid', None) == 'I'
+        has_state = getattr(self, 'statepostal', None) is not None
         for c in self.candidates:
+            # Race and reporting unit fields are shared with this object
+            # rather than copied; see :class:`ContextField`.
+            c['is_ballot_measure'] = is_ballot_measure
+            if has_state:
+                c.pop('statename', None)
 
-            for k, v in self.__dict__.items():
-                if k != 'votecount':
-                    c.setdefault(k, v)
-
-            c['is_ballot_measure'] = False
-            if hasattr(self, 'officeid') and getattr(self, 'officeid') == 'I':
-                c['is_ballot_measure'] = True
-
-            if getattr(self, 'statepostal', None) is not None:
-                statename = maps.STATE_ABBR[self.statepostal]
-                c['statename'] = statename
-
-            obj = CandidateReportingUnit(**c)
+            obj = CandidateReportingUnit.from_dict(c, self)
             candidate_objs.append(obj)
 
         self.candidates = candidate_objs
@@ -111,6 +349,19 @@ class APElection(utils.UnicodeMixin):
         """
         raise NotImplementedError
 
+    #: Names of the values returned by :meth:`row`, in order; the keys
+    #: of :meth:`serialize`.
+    columns = ()
+
+    def row(self):
+        """
+        Return the values of :meth:`serialize` as a tuple in
+        :attr:`columns` order, without building a dict. Classes with many
+        instances implement it directly and build :meth:`serialize` from
+        it.
+        """
+        return tuple(self.serialize().values())
+
 
 class Candidate(APElection):
     """
@@ -151,6 +402,11 @@ class Candidate(APElection):
         self.set_unique_id()
         self.set_id_field()
 
+    columns = (
+        'id', 'candidateid', 'ballotorder', 'first', 'last', 'party',
+        'polid', 'polnum',
+    )
+
     def serialize(self):
         """
         Implements :meth:`APElection.serialize()`.
@@ -234,6 +490,11 @@ class BallotMeasure(APElection):
         self.set_unique_id()
         self.set_id_field()
 
+    columns = (
+        'id', 'candidateid', 'ballotorder', 'description', 'electiondate',
+        'last', 'polid', 'polnum', 'seatname',
+    )
+
     def serialize(self):
         """
         Implements :meth:`APElection.serialize()`.
@@ -277,70 +538,78 @@ class CandidateReportingUnit(APElection):
     AP candidate. Note: A candidate can
     be a person OR a ballot measure.
     """
+    __slots__ = (
+        'id', 'unique_id', 'first', 'last', 'party', 'candidateid', 'polid',
+        'ballotorder', 'polnum', 'votecount', 'votepct', 'delegatecount',
+        'winner', 'runoff', 'is_ballot_measure', 'incumbent', 'electwon',
+        '_context', '_overrides',
+    )
+
+    electiondate = ContextField('electiondate')
+    level = ContextField('level')
+    reportingunitname = ContextField('reportingunitname')
+    reportingunitid = ContextField('reportingunitid')
+    fipscode = ContextField('fipscode')
+    lastupdated = ContextField('lastupdated')
+    precinctsreporting = ContextField('precinctsreporting', 0)
+    precinctstotal = ContextField('precinctstotal', 0)
+    precinctsreportingpct = ContextField('precinctsreportingpct', 0.0)
+    uncontested = ContextField('uncontested', False)
+    test = ContextField('test', False)
+    raceid = ContextField('raceid')
+    statepostal = ContextField('statepostal')
+    statename = ContextField('statename', resolve=candidate_statename)
+    racetype = ContextField('racetype')
+    racetypeid = ContextField('racetypeid')
+    officeid = ContextField('officeid')
+    officename = ContextField('officename')
+    seatname = ContextField('seatname')
+    description = ContextField('description')
+    seatnum = ContextField('seatnum')
+    initialization_data = ContextField('initialization_data')
+    national = ContextField('national', False)
+    electtotal = ContextField('electtotal', 0)
+
+    field_table = FieldTable((
+        Field('first', 'first'),
+        Field('last', 'last'),
+        Field('party', 'party'),
+        Field('candidateid', ('candidateID', 'candidateid')),
+        Field('polid', ('polID', 'polid')),
+        Field('ballotorder', ('ballotOrder', 'ballotorder')),
+        Field('polnum', ('polNum', 'polnum')),
+        Field('votecount', ('voteCount', 'votecount'), 0),
+        Field('votepct', ('votePct', 'votepct'), 0.0),
+        Field('delegatecount', ('delegateCount', 'delegatecount'), 0),
+        Field('winner', 'winner', False, is_winner),
+        Field('runoff', 'winner', False, is_runoff),
+        Field('is_ballot_measure', 'is_ballot_measure'),
+        Field('incumbent', 'incumbent', False),
+        Field('electwon', 'electWon', 0),
+    ))
+
     def __init__(self, **kwargs):
-        self.id = None
-        self.unique_id = None
-        self.electiondate = kwargs.get('electiondate', None)
-        self.first = kwargs.get('first', None)
-        self.last = kwargs.get('last', None)
-        self.party = kwargs.get('party', None)
+        """
+        :param context:
+            The reporting unit (or, before results, the race) this
+            candidate belongs to. Its race and reporting unit fields are
+            read from the context unless passed in `kwargs`.
+        """
+        self.set_fields(kwargs, kwargs.get('context', None))
 
-        self.candidateid = kwargs.get('candidateID', None)
-        if kwargs.get('candidateid', None):
-            self.candidateid = kwargs['candidateid']
-
-        self.polid = kwargs.get('polID', None)
-        if kwargs.get('polid', None):
-            self.polid = kwargs['polid']
-
-        self.ballotorder = kwargs.get('ballotOrder', None)
-        if kwargs.get('ballotorder', None):
-            self.ballotorder = kwargs['ballotorder']
-
-        self.polnum = kwargs.get('polNum', None)
-        if kwargs.get('polnum', None):
-            self.polnum = kwargs['polnum']
-
-        self.votecount = kwargs.get('voteCount', 0)
-        if kwargs.get('votecount', None):
-            self.votecount = kwargs['votecount']
-
-        self.votepct = kwargs.get('votePct', 0.0)
-        if kwargs.get('votepct', None):
-            self.votepct = kwargs['votepct']
-
-        self.delegatecount = kwargs.get('delegateCount', 0)
-        if kwargs.get('delegatecount', None):
-            self.delegatecount = kwargs['delegatecount']
-
-        self.winner = kwargs.get('winner', False) == 'X'
-        self.runoff = kwargs.get('winner', False) == 'R'
-        self.is_ballot_measure = kwargs.get('is_ballot_measure', None)
-        self.level = kwargs.get('level', None)
-        self.reportingunitname = kwargs.get('reportingunitname', None)
-        self.reportingunitid = kwargs.get('reportingunitid', None)
-        self.fipscode = kwargs.get('fipscode', None)
-        self.lastupdated = kwargs.get('lastupdated', None)
-        self.precinctsreporting = kwargs.get('precinctsreporting', 0)
-        self.precinctstotal = kwargs.get('precinctstotal', 0)
-        self.precinctsreportingpct = kwargs.get('precinctsreportingpct', 0.0)
-        self.uncontested = kwargs.get('uncontested', False)
-        self.test = kwargs.get('test', False)
-        self.raceid = kwargs.get('raceid', None)
-        self.statepostal = kwargs.get('statepostal', None)
-        self.statename = kwargs.get('statename', None)
-        self.racetype = kwargs.get('racetype', None)
-        self.racetypeid = kwargs.get('racetypeid', None)
-        self.officeid = kwargs.get('officeid', None)
-        self.officename = kwargs.get('officename', None)
-        self.seatname = kwargs.get('seatname', None)
-        self.description = kwargs.get('description', None)
-        self.seatnum = kwargs.get('seatnum', None)
-        self.initialization_data = kwargs.get('initialization_data', None)
-        self.national = kwargs.get('national', False)
-        self.incumbent = kwargs.get('incumbent', False)
-        self.electtotal = kwargs.get('electtotal', 0)
-        self.electwon = kwargs.get('electWon', 0)
+    def set_fields(self, kwargs, context=None):
+        """
+        Set fields from constructor keyword arguments.
+
+        :param kwargs:
+            Dict of constructor keyword arguments.
+        :param context:
+            Parent object, or None.
+        """
+        self.set_context(context, kwargs)
+        self.field_table.build(self, kwargs)
+        if 'party' not in kwargs:
+            self.party = getattr(context, 'party', None)
 
         self.set_polid()
         self.set_unique_id()
@@ -376,52 +645,120 @@ class CandidateReportingUnit(APElection):
         else:
             self.unique_id = self.candidateid
 
+    columns = (
+        'id', 'raceid', 'racetype', 'racetypeid', 'ballotorder',
+        'candidateid', 'description', 'delegatecount', 'electiondate',
+        'electtotal', 'electwon', 'fipscode', 'first', 'incumbent',
+        'initialization_data', 'is_ballot_measure', 'last', 'lastupdated',
+        'level', 'national', 'officeid', 'officename', 'party', 'polid',
+        'polnum', 'precinctsreporting', 'precinctsreportingpct',
+        'precinctstotal', 'reportingunitid', 'reportingunitname', 'runoff',
+        'seatname', 'seatnum', 'statename', 'statepostal', 'test',
+        'uncontested', 'votecount', 'votepct', 'winner',
+    )
+
+    # Types of the columns stored in typed arrays by
+    # :class:`elex.api.table.ResultsTable`; the rest are strings.
+    column_types = {
+        'ballotorder': int,
+        'delegatecount': int,
+        'electtotal': int,
+        'electwon': int,
+        'incumbent': bool,
+        'initialization_data': bool,
+        'is_ballot_measure': bool,
+        'national': bool,
+        'precinctsreporting': int,
+        'precinctsreportingpct': float,
+        'precinctstotal': int,
+        'runoff': bool,
+        'test': bool,
+        'uncontested': bool,
+        'votecount': int,
+        'votepct': float,
+        'winner': bool,
+    }
+
+    def row(self, shared=None):
+        """
+        Implements :meth:`APElection.row()`.
+
+        :param shared:
+            Optional dict of this object's context field values, as
+            returned by :func:`context_values`; see :meth:`rows`.
+        """
+        if shared is None:
+            shared = context_values(self)
+        return (
+            self.id,
+            shared['raceid'],
+            shared['racetype'],
+            shared['racetypeid'],
+            self.ballotorder,
+            self.candidateid,
+            shared['description'],
+            self.delegatecount,
+            shared['electiondate'],
+            shared['electtotal'],
+            self.electwon,
+            shared['fipscode'],
+            self.first,
+            self.incumbent,
+            shared['initialization_data'],
+            self.is_ballot_measure,
+            self.last,
+            shared['lastupdated'],
+            shared['level'],
+            shared['national'],
+            shared['officeid'],
+            shared['officename'],
+            self.party,
+            self.polid,
+            self.polnum,
+            shared['precinctsreporting'],
+            shared['precinctsreportingpct'],
+            shared['precinctstotal'],
+            shared['reportingunitid'],
+            shared['reportingunitname'],
+            self.runoff,
+            shared['seatname'],
+            shared['seatnum'],
+            shared['statename'],
+            shared['statepostal'],
+            shared['test'],
+            shared['uncontested'],
+            self.votecount,
+            round(self.votepct, PCT_PRECISION),
+            self.winner,
+        )
+
+    @staticmethod
+    def rows(candidates):
+        """
+        Return the rows of `candidates`, as from :meth:`row`. The context
+        fields of candidates without overrides are read once for each
+        reporting unit, rather than once per candidate.
+
+        :param candidates:
+            A list of CandidateReportingUnit objects.
+        """
+        rows = []
+        context = shared = None
+        for candidate in candidates:
+            if candidate._overrides:
+                rows.append(candidate.row())
+                continue
+            if candidate._context is not context or shared is None:
+                context = candidate._context
+                shared = context_values(candidate)
+            rows.append(candidate.row(shared))
+        return rows
+
     def serialize(self):
         """
         Implements :meth:`APElection.serialize()`.
         """
-        return OrderedDict((
-            ('id', self.id),
-            ('raceid', self.raceid),
-            ('racetype', self.racetype),
-            ('racetypeid', self.racetypeid),
-            ('ballotorder', self.ballotorder),
-            ('candidateid', self.candidateid),
-            ('description', self.description),
-            ('delegatecount', self.delegatecount),
-            ('electiondate', self.electiondate),
-            ('electtotal', self.electtotal),
-            ('electwon', self.electwon),
-            ('fipscode', self.fipscode),
-            ('first', self.first),
-            ('incumbent', self.incumbent),
-            ('initialization_data', self.initialization_data),
-            ('is_ballot_measure', self.is_ballot_measure),
-            ('last', self.last),
-            ('lastupdated', self.lastupdated),
-            ('level', self.level),
-            ('national', self.national),
-            ('officeid', self.officeid),
-            ('officename', self.officename),
-            ('party', self.party),
-            ('polid', self.polid),
-            ('polnum', self.polnum),
-            ('precinctsreporting', self.precinctsreporting),
-            ('precinctsreportingpct', self.precinctsreportingpct),
-            ('precinctstotal', self.precinctstotal),
-            ('reportingunitid', self.reportingunitid),
-            ('reportingunitname', self.reportingunitname),
-            ('runoff', self.runoff),
-            ('seatname', self.seatname),
-            ('seatnum', self.seatnum),
-            ('statename', self.statename),
-            ('statepostal', self.statepostal),
-            ('test', self.test),
-            ('uncontested', self.uncontested),
-            ('votecount', self.votecount),
-            ('votepct', round(self.votepct, PCT_PRECISION)),
-            ('winner', self.winner),
-        ))
+        return OrderedDict(zip(self.columns, self.row()))
 
     def __unicode__(self):
         if self.is_ballot_measure:
@@ -438,71 +775,87 @@ class ReportingUnit(APElection):
     Canonical representation of a single
     level of reporting.
     """
-    def __init__(self, **kwargs):
-        self.electiondate = kwargs.get('electiondate', None)
+    __slots__ = (
+        'id', 'statepostal', 'statename', 'level', 'reportingunitname',
+        'reportingunitid', 'fipscode', 'lastupdated', 'precinctsreporting',
+        'precinctstotal', 'precinctsreportingpct', 'candidates', 'votecount',
+        'electtotal', '_context', '_overrides',
+    )
+
+    electiondate = ContextField('electiondate')
+    uncontested = ContextField('uncontested', False)
+    test = ContextField('test', False)
+    raceid = ContextField('raceid')
+    racetype = ContextField('racetype')
+    racetypeid = ContextField('racetypeid')
+    officeid = ContextField('officeid')
+    officename = ContextField('officename')
+    seatname = ContextField('seatname')
+    description = ContextField('description')
+    seatnum = ContextField('seatnum')
+    initialization_data = ContextField('initialization_data', False)
+    national = ContextField('national', False)
+
+    field_table = FieldTable((
+        Field('statepostal', ('statePostal', 'statepostal')),
+        Field('statename', ('stateName', 'statename')),
+        Field('level', 'level'),
+        Field('reportingunitname', ('reportingunitName', 'reportingunitname')),
+        Field('reportingunitid', ('reportingunitID', 'reportingunitid')),
+        Field('fipscode', ('fipsCode', 'fipscode')),
+        Field('lastupdated', ('lastUpdated', 'lastupdated')),
+        Field('precinctsreporting', ('precinctsReporting', 'precinctsreporting'), 0),
+        Field('precinctstotal', ('precinctsTotal', 'precinctstotal'), 0),
+        Field(
+            'precinctsreportingpct',
+            ('precinctsReportingPct', 'precinctsreportingpct'),
+            0.0,
+            from_percent
+        ),
+        Field('votecount', 'votecount', 0),
+        Field('electtotal', 'electTotal', 0),
+    ))
 
-        self.statepostal = kwargs.get('statePostal', None)
-        if kwargs.get('statepostal', None):
-            self.statepostal = kwargs['statepostal']
-
-        self.statename = kwargs.get('stateName', None)
-        if kwargs.get('statename', None):
-            self.statename = kwargs['statename']
-
-        self.level = kwargs.get('level', None)
-
-        self.reportingunitname = kwargs.get('reportingunitName', None)
-        if kwargs.get('reportingunitname', None):
-            self.reportingunitname = kwargs['reportingunitname']
-
-        self.reportingunitid = kwargs.get('reportingunitID', None)
-        if kwargs.get('reportingunitid', None):
-            self.reportingunitid = kwargs['reportingunitid']
-
-        self.fipscode = kwargs.get('fipsCode', None)
-        if kwargs.get('fipscode', None):
-            self.fipscode = kwargs['fipscode']
-
-        self.lastupdated = kwargs.get('lastUpdated', None)
-        if kwargs.get('lastupdated', None):
-            self.lastupdated = kwargs['lastupdated']
-
-        self.precinctsreporting = kwargs.get('precinctsReporting', 0)
-        if kwargs.get('precinctsreporting', None):
-            self.precinctsreporting = kwargs['precinctsreporting']
-
-        self.precinctstotal = kwargs.get('precinctsTotal', 0)
-        if kwargs.get('precinctstotal', None):
-            self.precinctstotal = kwargs['precinctstotal']
-
-        self.precinctsreportingpct = kwargs.get('precinctsReportingPct', 0.0)\
-            * 0.01
+    def __init__(self, **kwargs):
+        """
+        :param context:
+            The race this reporting unit belongs to. Its race fields are
+            read from the context unless passed in `kwargs`.
+        :param defer_tally:
+            If True, leave vote counts and percentages to
+            :mod:`elex.api.tally`.
+        """
+        self.set_fields(
+            kwargs,
+            kwargs.get('context', None),
+            kwargs.get('defer_tally', False)
+        )
 
-        if kwargs.get('precinctsreportingpct', None):
-            self.precinctsreportingpct = kwargs['precinctsreportingpct']
+    def set_fields(self, kwargs, context=None, defer_tally=False):
+        """
+        Set fields from constructor keyword arguments.
 
-        self.uncontested = kwargs.get('uncontested', False)
-        self.test = kwargs.get('test', False)
-        self.raceid = kwargs.get('raceid', None)
-        self.racetype = kwargs.get('racetype', None)
-        self.racetypeid = kwargs.get('racetypeid', None)
-        self.officeid = kwargs.get('officeid', None)
-        self.officename = kwargs.get('officename', None)
-        self.seatname = kwargs.get('seatname', None)
-        self.description = kwargs.get('description', None)
-        self.seatnum = kwargs.get('seatnum', None)
-        self.initialization_data = kwargs.get('initialization_data', False)
-        self.national = kwargs.get('national', False)
+        :param kwargs:
+            Dict of constructor keyword arguments.
+        :param context:
+            Parent object, or None.
+        :param defer_tally:
+            If True, leave vote counts and percentages to
+            :mod:`elex.api.tally`.
+        """
+        self.set_context(context, kwargs)
+        self.field_table.build(self, kwargs)
+        if getattr(context, 'lastupdated', None):
+            self.lastupdated = context.lastupdated
         self.candidates = kwargs.get('candidates', [])
-        self.votecount = kwargs.get('votecount', 0)
-        self.electtotal = kwargs.get('electTotal', 0)
 
         self.set_level()
         self.pad_fipscode()
         self.set_reportingunitids()
         self.set_candidates()
-        self.set_votecount()
-        self.set_candidate_votepct()
+        if not defer_tally:
+            self.set_votecount()
+            self.set_candidate_votepct()
         self.set_id_field()
 
     def __unicode__(self):
@@ -547,8 +900,8 @@ class ReportingUnit(APElection):
         Set vote count.
         """
         if not self.uncontested:
-            for c in self.candidates:
-                self.votecount = sum([c.votecount for c in self.candidates])
+            if self.candidates:
+                self.votecount = sum(c.votecount for c in self.candidates)
         else:
             self.votecount = None
 
@@ -556,48 +909,59 @@ class ReportingUnit(APElection):
         """
         Set vote percentage for each candidate.
         """
-        if not self.uncontested:
+        if not self.uncontested and self.votecount:
+            total = float(self.votecount)
             for c in self.candidates:
-                try:
-                    c.votepct = float(c.votecount) / float(self.votecount)
-                except ZeroDivisionError:
-                    pass
+                c.votepct = float(c.votecount) / total
+
+    columns = (
+        'id', 'reportingunitid', 'reportingunitname', 'description',
+        'electiondate', 'electtotal', 'fipscode', 'initialization_data',
+        'lastupdated', 'level', 'national', 'officeid', 'officename',
+        'precinctsreporting', 'precinctsreportingpct', 'precinctstotal',
+        'raceid', 'racetype', 'racetypeid', 'seatname', 'seatnum',
+        'statename', 'statepostal', 'test', 'uncontested', 'votecount',
+    )
+
+    def row(self):
+        """
+        Implements :meth:`APElection.row()`.
+        """
+        shared = context_values(self)
+        return (
+            self.id,
+            self.reportingunitid,
+            self.reportingunitname,
+            shared['description'],
+            shared['electiondate'],
+            self.electtotal,
+            self.fipscode,
+            shared['initialization_data'],
+            self.lastupdated,
+            self.level,
+            shared['national'],
+            shared['officeid'],
+            shared['officename'],
+            self.precinctsreporting,
+            self.precinctsreportingpct,
+            self.precinctstotal,
+            shared['raceid'],
+            shared['racetype'],
+            shared['racetypeid'],
+            shared['seatname'],
+            shared['seatnum'],
+            self.statename,
+            self.statepostal,
+            shared['test'],
+            shared['uncontested'],
+            self.votecount,
+        )
 
     def serialize(self):
         """
         Implements :meth:`APElection.serialize()`.
         """
-        return OrderedDict((
-            ('id', self.id),
-            ('reportingunitid', self.reportingunitid),
-            ('reportingunitname', self.reportingunitname),
-            ('description', self.description),
-            ('electiondate', self.electiondate),
-            ('electtotal', self.electtotal),
-            ('fipscode', self.fipscode),
-            ('initialization_data', self.initialization_data),
-            ('lastupdated', self.lastupdated),
-            ('lastupdated', self.lastupdated),
-            ('level', self.level),
-            ('national', self.national),
-            ('officeid', self.officeid),
-            ('officename', self.officename),
-            ('precinctsreporting', self.precinctsreporting),
-            ('precinctsreportingpct', self.precinctsreportingpct),
-            ('precinctstotal', self.precinctstotal),
-            ('raceid', self.raceid),
-            ('racetype', self.racetype),
-            ('racetypeid', self.racetypeid),
-            ('seatname', self.seatname),
-            ('seatnum', self.seatnum),
-            ('statename', self.statename),
-            ('statename', self.statename),
-            ('statepostal', self.statepostal),
-            ('statepostal', self.statepostal),
-            ('test', self.test),
-            ('uncontested', self.uncontested),
-            ('votecount', self.votecount),
-        ))
+        return OrderedDict(zip(self.columns, self.row()))
 
 
 class Race(APElection):
@@ -606,24 +970,55 @@ class Race(APElection):
     race, which is a seat in a political geography
     within a certain election.
     """
+    __slots__ = (
+        'id', 'electiondate', 'statepostal', 'statename', 'test', 'raceid',
+        'racetype', 'racetypeid', 'officeid', 'officename', 'party',
+        'seatname', 'description', 'seatnum', 'uncontested', 'lastupdated',
+        'initialization_data', 'national', 'candidates', 'reportingunits',
+        'is_ballot_measure',
+    )
+
+    field_table = FieldTable((
+        Field('electiondate', 'electiondate'),
+        Field('statepostal', 'statePostal'),
+        Field('statename', 'stateName'),
+        Field('test', 'test', False),
+        Field('raceid', 'raceID'),
+        Field('racetype', 'raceType'),
+        Field('racetypeid', 'raceTypeID'),
+        Field('officeid', 'officeID'),
+        Field('officename', 'officeName'),
+        Field('party', 'party'),
+        Field('seatname', 'seatName'),
+        Field('description', 'description'),
+        Field('seatnum', 'seatNum'),
+        Field('uncontested', 'uncontested', False),
+        Field('lastupdated', 'lastUpdated'),
+        Field('initialization_data', 'initialization_data', False),
+        Field('national', 'national', False),
+    ))
+
     def __init__(self, **kwargs):
-        self.electiondate = kwargs.get('electiondate', None)
-        self.statepostal = kwargs.get('statePostal', None)
-        self.statename = kwargs.get('stateName', None)
-        self.test = kwargs.get('test', False)
-        self.raceid = kwargs.get('raceID', None)
-        self.racetype = kwargs.get('raceType', None)
-        self.racetypeid = kwargs.get('raceTypeID', None)
-        self.officeid = kwargs.get('officeID', None)
-        self.officename = kwargs.get('officeName', None)
-        self.party = kwargs.get('party', None)
-        self.seatname = kwargs.get('seatName', None)
-        self.description = kwargs.get('description', None)
-        self.seatnum = kwargs.get('seatNum', None)
-        self.uncontested = kwargs.get('uncontested', False)
-        self.lastupdated = kwargs.get('lastUpdated', None)
-        self.initialization_data = kwargs.get('initialization_data', False)
-        self.national = kwargs.get('national', False)
+        """
+        :param defer_tally:
+            If True, leave vote counts and percentages for the caller to
+            tally; see :meth:`tally`.
+        """
+        self.set_fields(kwargs, defer_tally=kwargs.get('defer_tally', False))
+
+    def set_fields(self, kwargs, context=None, defer_tally=False):
+        """
+        Set fields from constructor keyword arguments.
+
+        :param kwargs:
+            Dict of constructor keyword arguments.
+        :param context:
+            Unused; races have no parent.
+        :param defer_tally:
+            If True, leave vote counts and percentages for the caller to
+            tally; see :meth:`tally`.
+        """
+        self.field_table.build(self, kwargs)
         self.candidates = kwargs.get('candidates', [])
         self.reportingunits = kwargs.get('reportingUnits', [])
         self.is_ballot_measure = False
@@ -633,125 +1028,98 @@ class Race(APElection):
         if self.initialization_data:
             self.set_candidates()
         else:
-            self.set_reportingunits()
+            self.set_reportingunits(defer_tally=True)
             self.set_state_fields_from_reportingunits()
-            self.set_new_england_counties()
+            if not defer_tally:
+                self.tally()
 
-    def set_new_england_counties(self):
-        if self.statepostal in maps.FIPS_TO_STATE.keys():
+    def tally(self):
+        """
+        Set vote counts and percentages for this race's reporting units,
+        then roll New England townships up into counties.
 
-            counties = {}
-
-            for c in maps.FIPS_TO_STATE[self.statepostal].keys():
-                try:
-                    counties[c] = dict([
-                        r.__dict__ for
-                        r in self.reportingunits if
-                        r.level == 'township' and
-                        "Mail Ballots C.D." not in r.reportingunitname and
-                        r.fipscode == c
-                    ][0])
-
-                    # Set some basic information we know about the county.
-                    counties[c]['level'] = 'county'
-                    counties[c]['statepostal'] = self.statepostal
-                    counties[c]['candidates'] = {}
-                    counties[c]['reportingunitname'] =\
-                        maps.FIPS_TO_STATE[self.statepostal][c]
-                    counties[c]['reportingunitid'] = "%s-%s" % (
-                        self.statepostal,
-                        c
-                    )
+        Races built with `defer_tally=True` are left for the caller to
+        tally, e.g. with the rest of an election through
+        :func:`elex.api.tally.tally_races`.
+        """
+        tally.tally_units(self.reportingunits)
+        self.set_new_england_counties()
 
-                    reporting_units = [
-                        r for
-                        r in self.reportingunits if
-                        r.level == 'township' and
-                        "Mail Ballots C.D." not in r.reportingunitname and
-                        r.fipscode == c
-                    ]
-
-                    # Declaratively sum the precincts / votes for this county.
-                    counties[c]['precinctstotal'] = sum([
-                        r.precinctstotal for
-                        r in reporting_units if
-                        r.level == 'township' and
-                        "Mail Ballots C.D." not in r.reportingunitname and
-                        r.fipscode == c
-                    ])
-                    counties[c]['precinctsreporting'] = sum([
-                        r.precinctsreporting for
-                        r in reporting_units if
-                        r.level == 'township' and
-                        "Mail Ballots C.D." not in r.reportingunitname and
-                        r.fipscode == c
-                    ])
-
-                    pcts_tot = float(counties[c]['precinctstotal'])
-                    pcts_rep = float(counties[c]['precinctsreporting'])
-
-                    try:
-                        counties[c]['precinctsreportingpct'] = pcts_rep / pcts_tot
-                    except ZeroDivisionError:
-                        counties[c]['precinctsreportingpct'] = 0.0
-
-                    counties[c]['votecount'] = sum([
-                        int(r.votecount or 0) for
-                        r in reporting_units if
-                        r.level == 'township' and
-                        "Mail Ballots C.D." not in r.reportingunitname and
-                        r.fipscode == c
-                    ])
-
-                    for r in reporting_units:
-
-                        # Set up candidates for each county.
-                        for cru in r.candidates:
-                            if not counties[c]['candidates'].get(cru.unique_id, None):
-                                d = dict(cru.__dict__)
-                                d['level'] = 'county'
-                                d['reportingunitid'] = "%s-%s" % (
-                                    self.statepostal,
-                                    c
-                                )
-                                fips_dict = maps.FIPS_TO_STATE[self.statepostal]
-                                d['reportingunitname'] = fips_dict[c]
-                                counties[c]['candidates'][cru.unique_id] = d
-
-                            else:
-                                d = counties[c]['candidates'][cru.unique_id]
-                                d['votecount'] += cru.votecount
-                                d['precinctstotal'] += cru.precinctstotal
-                                d['precinctsreporting'] += cru.precinctsreporting
-
-                                try:
-                                    d['precinctsreportingpct'] = (
-                                        float(d['precinctsreporting']) /
-                                        float(d['precinctstotal'])
-                                    )
-
-                                except ZeroDivisionError:
-                                    d['precinctsreportingpct'] = 0.0
-
-                except IndexError:
-                    """
-                    This is the ME bug from the ME primary.
-                    """
-                    pass
+    def set_new_england_counties(self):
+        """
+        New England states report at the township level, so add a
+        county reporting unit for each county with townships, summing
+        their precincts and votes and those of each candidate.
 
-            try:
-                for ru in counties.values():
-                    ru['candidates'] = ru['candidates'].values()
-                    ru['statename'] = str(maps.STATE_ABBR[ru['statepostal']])
-                    r = ReportingUnit(**ru)
-                    self.reportingunits.append(r)
+        Townships are grouped by fipscode in a single pass.
+        """
+        if self.statepostal not in maps.FIPS_TO_STATE:
+            return
 
-            except AttributeError:
-                """
-                Sometimes, the dict is empty because we have no townships to
-                roll up into counties. Issue #228.
-                """
-                pass
+        fips_dict = maps.FIPS_TO_STATE[self.statepostal]
+        townships = {}
+        for r in self.reportingunits:
+            if r.level == 'township' and "Mail Ballots C.D." not in r.reportingunitname:
+                townships.setdefault(r.fipscode, []).append(r)
+
+        counties = []
+        for c in fips_dict:
+            reporting_units = townships.get(c)
+            if not reporting_units:
+                # No townships for this county, e.g. the ME bug from
+                # the ME primary.
+                continue
+
+            reportingunitid = "%s-%s" % (self.statepostal, c)
+            reportingunitname = fips_dict[c]
+
+            # Set some basic information we know about the county.
+            county = reporting_units[0].attributes()
+            county['level'] = 'county'
+            county['statepostal'] = self.statepostal
+            county['reportingunitname'] = reportingunitname
+            county['reportingunitid'] = reportingunitid
+
+            precinctstotal = 0
+            precinctsreporting = 0
+            votecount = 0
+            candidates = OrderedDict()
+            for r in reporting_units:
+                precinctstotal += r.precinctstotal
+                precinctsreporting += r.precinctsreporting
+                votecount += int(r.votecount or 0)
+
+                # Set up candidates for each county.
+                for cru in r.candidates:
+                    d = candidates.get(cru.unique_id)
+                    if d is None:
+                        d = cru.attributes()
+                        d['level'] = 'county'
+                        d['reportingunitid'] = reportingunitid
+                        d['reportingunitname'] = reportingunitname
+                        candidates[cru.unique_id] = d
+                    else:
+                        d['votecount'] += cru.votecount
+                        d['precinctstotal'] += cru.precinctstotal
+                        d['precinctsreporting'] += cru.precinctsreporting
+                        d['precinctsreportingpct'] = tally.reporting_pct(
+                            d['precinctsreporting'],
+                            d['precinctstotal']
+                        )
+
+            county['precinctstotal'] = precinctstotal
+            county['precinctsreporting'] = precinctsreporting
+            county['precinctsreportingpct'] = tally.reporting_pct(
+                precinctsreporting,
+                precinctstotal
+            )
+            county['votecount'] = votecount
+            county['candidates'] = list(candidates.values())
+            county['statename'] = str(maps.STATE_ABBR[self.statepostal])
+            counties.append(county)
+
+        for ru in counties:
+            self.reportingunits.append(ReportingUnit.from_dict(ru, self))
 
     def set_id_field(self):
         """
@@ -759,31 +1127,45 @@ class Race(APElection):
         """
         self.id = self.raceid
 
+    columns = (
+        'id', 'raceid', 'racetype', 'racetypeid', 'description',
+        'electiondate', 'initialization_data', 'is_ballot_measure',
+        'lastupdated', 'national', 'officeid', 'officename', 'party',
+        'seatname', 'seatnum', 'statename', 'statepostal', 'test',
+        'uncontested',
+    )
+
+    def row(self):
+        """
+        Implements :meth:`APElection.row()`.
+        """
+        return (
+            self.id,
+            self.raceid,
+            self.racetype,
+            self.racetypeid,
+            self.description,
+            self.electiondate,
+            self.initialization_data,
+            self.is_ballot_measure,
+            self.lastupdated,
+            self.national,
+            self.officeid,
+            self.officename,
+            self.party,
+            self.seatname,
+            self.seatnum,
+            self.statename,
+            self.statepostal,
+            self.test,
+            self.uncontested,
+        )
+
     def serialize(self):
         """
         Implements :meth:`APElection.serialize()`.
         """
-        return OrderedDict((
-            ('id', self.id),
-            ('raceid', self.raceid),
-            ('racetype', self.racetype),
-            ('racetypeid', self.racetypeid),
-            ('description', self.description),
-            ('electiondate', self.electiondate),
-            ('initialization_data', self.initialization_data),
-            ('is_ballot_measure', self.is_ballot_measure),
-            ('lastupdated', self.lastupdated),
-            ('national', self.national),
-            ('officeid', self.officeid),
-            ('officename', self.officename),
-            ('party', self.party),
-            ('seatname', self.seatname),
-            ('seatnum', self.seatnum),
-            ('statename', self.statename),
-            ('statepostal', self.statepostal),
-            ('test', self.test),
-            ('uncontested', self.uncontested)
-        ))
+        return OrderedDict(zip(self.columns, self.row()))
 
     def __unicode__(self):
         if self.racetype:
@@ -831,6 +1213,8 @@ class Elections():
             If electiondate is specified, gets the next election
             after the specified date.
         """
+        from dateutil import parser as dateutil_parser
+
         if not electiondate:
             today = datetime.datetime.now()
         else:
@@ -862,6 +1246,18 @@ class Election(APElection):
             The date of the election.
         :param datafile:
             A cached data file.
+        :param raceids:
+            Optional list of AP race IDs to parse.
+        :param officeids:
+            Optional comma-delimited string of AP office IDs to parse.
+        :param statepostals:
+            Optional list of state postal codes to parse.
+        :param levels:
+            Optional list of reporting unit levels to parse, e.g.
+            `state` or `county`.
+        :param national:
+            True to parse national races only, False for local races
+            only.
         """
         self.id = None
 
@@ -879,14 +1275,32 @@ class Election(APElection):
 
         self.raceids = kwargs.get('raceids', [])
         self.officeids = kwargs.get('officeids', None)
+        self.statepostals = kwargs.get('statepostals', None)
+        self.levels = kwargs.get('levels', None)
 
         self.set_id_field()
 
         self._response = None
+        self._units_cache = {}
 
     def __unicode__(self):
         return "{}".format(self.electiondate)
 
+    @property
+    def filters(self):
+        """
+        A :class:`elex.api.filters.RaceFilter` of this election's
+        `raceids`, `officeids`, `statepostals`, `levels` and `national`,
+        applied to the raw payload before any objects are built.
+        """
+        return RaceFilter(
+            raceids=self.raceids,
+            officeids=self.officeids,
+            statepostals=self.statepostals,
+            levels=self.levels,
+            national=self.national
+        )
+
     def set_id_field(self):
         """
         Set id to `<electiondate>`.
@@ -907,7 +1321,8 @@ class Election(APElection):
             A dict of optional parameters to be included in API request.
         """
         self._response = utils.api_request('/elections/{0}'.format(path), **params)
-        return self._response.json()
+        with timings.stage('decode'):
+            return self._response.json()
 
     def get_uniques(self, candidate_reporting_units):
         """
@@ -961,13 +1376,86 @@ class Election(APElection):
         """
         if self.datafile:
             with open(self.datafile, 'r') as readfile:
-                payload = json.loads(readfile.read())
-                self.electiondate = payload.get('electionDate')
-                return payload
+                content = readfile.read()
+            with timings.stage('decode'):
+                payload = json.loads(content)
+            self.electiondate = payload.get('electionDate')
+            return payload
         else:
             payload = self.get(self.electiondate, **params)
             return payload
 
+    def iter_raw_races(self, meta=None, **params):
+        """
+        Stream raw race dicts one at a time from the datafile or API
+        response without parsing the whole payload first.
+
+        :param meta:
+            Optional dict to collect top-level payload values
+            (e.g. `electionDate`) into.
+        :param \**params:
+            A dict of additional parameters to pass to API.
+            Ignored if `datafile` was passed to the constructor.
+        """
+        if self.datafile:
+            with open(self.datafile, 'r') as readfile:
+                chunks = iter(
+                    lambda: readfile.read(utils.STREAM_CHUNK_SIZE), ''
+                )
+                for race in utils.stream_json_array(chunks, 'races', meta):
+                    yield race
+        else:
+            self._response = utils.api_stream_request(
+                '/elections/{0}'.format(self.electiondate),
+                **params
+            )
+            chunks = utils.iter_response_chunks(self._response)
+            for race in utils.stream_json_array(chunks, 'races', meta):
+                yield race
+
+    def iter_race_objects(self, **params):
+        """
+        Stream parsed race objects one at a time. Memory use stays flat
+        regardless of payload size and the first race is available
+        before the rest of the payload has been read.
+
+        Yields the same races as :meth:`get_race_objects`.
+
+        With a `datafile`, `electiondate` is set from the payload's
+        `electionDate` as soon as it has been read. AP usually sends it
+        before the races, but if it comes after them it is only known
+        once the stream has been read to the end.
+
+        :param \**params:
+            A dict of additional parameters to pass to API.
+            Ignored if `datafile` was passed to the constructor.
+        """
+        meta = {}
+        initialization_data = None
+        filters = self.filters
+        for r in self.iter_raw_races(meta=meta, **params):
+            if self.datafile and meta.get('electionDate'):
+                self.electiondate = meta['electionDate']
+
+            if initialization_data is None:
+                initialization_data = bool(r.get('candidates', None))
+
+            if filters.active:
+                r = filters.filter_race(r)
+                if r is None:
+                    continue
+
+            if initialization_data:
+                r['initialization_data'] = True
+                yield Race.from_dict(r)
+            else:
+                race = Race.from_dict(r)
+                filters.prune(race)
+                yield race
+
+        if self.datafile and meta.get('electionDate'):
+            self.electiondate = meta['electionDate']
+
     def get_race_objects(self, parsed_json):
         """
         Get parsed race objects.
@@ -975,23 +1463,55 @@ class Election(APElection):
         :param parsed_json:
             Dict of parsed AP election JSON.
         """
+        with timings.stage('races') as stage:
+            payload = self._get_race_objects(parsed_json)
+            stage.count = len(payload)
+        self.tally_races(payload)
+        return payload
+
+    def _get_race_objects(self, parsed_json):
+        return list(self._iter_race_objects(parsed_json, defer_tally=True))
+
+    def _iter_race_objects(self, parsed_json, defer_tally=False):
+        """
+        Build race objects from parsed AP election JSON one at a time.
+
+        :param parsed_json:
+            Dict of parsed AP election JSON.
+        :param defer_tally:
+            If True, leave races with results for :meth:`tally_races`.
+        """
         if len(parsed_json['races']) > 0:
+            filters = self.filters
+            races = filters.filter_races(parsed_json['races'])
             if parsed_json['races'][0].get('candidates', None):
-                payload = []
-                for r in parsed_json['races']:
-                    if len(self.raceids) > 0 and r['raceID'] in self.raceids:
-                        r['initialization_data'] = True
-                        payload.append(Race(**r))
-                    else:
-                        r['initialization_data'] = True
-                        payload.append(Race(**r))
-                return payload
-            if len(self.raceids) > 0:
-                return [Race(**r) for r in parsed_json['races'] if r['raceID'] in self.raceids]
-            else:
-                return [Race(**r) for r in parsed_json['races']]
-        else:
-            return []
+                for r in races:
+                    r['initialization_data'] = True
+                    yield Race.from_dict(r)
+                return
+            for r in races:
+                race = Race.from_dict(r, defer_tally=defer_tally)
+                if not defer_tally:
+                    filters.prune(race)
+                yield race
+
+    def tally_races(self, races):
+        """
+        Tally races built with `defer_tally=True` in one batch.
+
+        :param races:
+            A list of Race objects.
+        """
+        races = [race for race in races if not race.initialization_data]
+        if not races:
+            return
+        filters = self.filters
+        with timings.stage('tally') as stage:
+            tally.tally_races(races)
+            for race in races:
+                race.set_new_england_counties()
+                filters.prune(race)
+            stage.count = len(races)
 
     def get_units(self, race_objs):
         """
@@ -1002,6 +1522,12 @@ class Election(APElection):
         :param race_objs:
             A list of top-level Race objects.
         """
+        with timings.stage('units') as stage:
+            units = self._get_units(race_objs)
+            stage.count = len(units[2])
+        return units
+
+    def _get_units(self, race_objs):
         races = []
         reporting_units = []
         candidate_reporting_units = []
@@ -1031,6 +1557,102 @@ class Election(APElection):
                 races.append(race)
         return races, reporting_units, candidate_reporting_units
 
+    def get_cached_units(self, **params):
+        """
+        Fetch, parse and split races into units once per set of effective
+        request parameters, reusing the parsed object graph on later calls.
+
+        Returns the same tuple as :meth:`get_units`. Call :meth:`refresh`
+        to drop the cached object graphs, e.g. between polls.
+
+        :param \**params:
+            A dict of additional parameters to pass to API.
+        """
+        key = self._units_cache_key(params)
+        if key not in self._units_cache:
+            self._units_cache[key] = self._parse_units(**params)
+
+        # Hand out fresh lists so callers can't alter the cached graph's shape.
+        return tuple(list(units) for units in self._units_cache[key])
+
+    def _parse_units(self, **params):
+        """
+        Fetch and parse races into units. API responses answered from the
+        HTTP cache reuse the object graph parsed for the same ETag (see
+        :mod:`elex.api.parsed_cache`) instead of being parsed again.
+        """
+        if self.datafile:
+            return self.get_units(self.get_race_objects(self.get_raw_races(**params)))
+
+        from elex.api.parsed_cache import get_parsed_cache, parsed_cache_key
+
+        self._response = utils.api_request(
+            '/elections/{0}'.format(self.electiondate), **params
+        )
+        parsed_cache = get_parsed_cache()
+        cache_key = parsed_cache_key(
+            self._response,
+            self.electiondate,
+            self.filters.key()
+        )
+        if cache_key and getattr(self._response, 'from_cache', False):
+            units = parsed_cache.get(cache_key)
+            if units is not None:
+                return units
+
+        with timings.stage('decode'):
+            payload = self._response.json()
+        units = self.get_units(self.get_race_objects(payload))
+        if cache_key:
+            parsed_cache.set(cache_key, units)
+        return units
+
+    def get_raw_races_async(self, **params):
+        """
+        Awaitable version of :meth:`get_raw_races`. Requires Python 3.
+
+        :param \**params:
+            A dict of additional parameters to pass to API.
+        """
+        from elex.api import aio
+        return aio.run(self.get_raw_races, **params)
+
+    def results_async(self):
+        """
+        Awaitable version of :attr:`results`. The parsed payload is cached
+        as if :attr:`results` had been read, so :attr:`bundle` and
+        :attr:`results` are free afterwards. Requires Python 3.
+        """
+        from elex.api import aio
+        return aio.run(lambda: self.results)
+
+    def refresh(self):
+        """
+        Invalidate cached payloads and object graphs so the next property
+        access fetches and parses fresh data.
+        """
+        self._units_cache = {}
+
+    def _units_cache_key(self, params):
+        """
+        Build a hashable cache key from the request parameters that change
+        the payload. A datafile is parsed the same way whatever the params.
+        """
+        filters = self.filters.key()
+        if self.datafile:
+            return ('datafile', self.datafile, filters)
+
+        effective = []
+        for k, v in sorted(params.items()):
+            if k == 'apiKey':
+                continue
+            if isinstance(v, list):
+                v = tuple(v)
+            effective.append((k, v))
+        return ('api', self.electiondate, tuple(effective), filters)
+
+    columns = ('id', 'electiondate', 'liveresults', 'testresults')
+
     def serialize(self):
         """
         Implements :meth:`APElection.serialize()`.
@@ -1047,7 +1669,7 @@ class Election(APElection):
         """
         Return list of race objects.
         """
-        raw_races = self.get_raw_races(
+        races, reporting_units, candidate_reporting_units = self.get_cached_units(
             omitResults=True,
             level="ru",
             test=self.testresults,
@@ -1055,11 +1677,6 @@ class Election(APElection):
             officeID=self.officeids,
             apiKey=self.api_key
         )
-
-        race_objs = self.get_race_objects(raw_races)
-        races, reporting_units, candidate_reporting_units = self.get_units(
-            race_objs
-        )
         return races
 
     @property
@@ -1067,7 +1684,7 @@ class Election(APElection):
         """
         Return list of reporting unit objects.
         """
-        raw_races = self.get_raw_races(
+        races, reporting_units, candidate_reporting_units = self.get_cached_units(
             omitResults=False,
             level="ru",
             test=self.testresults,
@@ -1075,10 +1692,6 @@ class Election(APElection):
             officeID=self.officeids,
             apiKey=self.api_key
         )
-        race_objs = self.get_race_objects(raw_races)
-        races, reporting_units, candidate_reporting_units = self.get_units(
-            race_objs
-        )
         return reporting_units
 
     @property
@@ -1086,7 +1699,7 @@ class Election(APElection):
         """
         Return list of candidate reporting unit objects.
         """
-        raw_races = self.get_raw_races(
+        races, reporting_units, candidate_reporting_units = self.get_cached_units(
             omitResults=True,
             level="ru",
             test=self.testresults,
@@ -1094,10 +1707,6 @@ class Election(APElection):
             officeID=self.officeids,
             apiKey=self.api_key
         )
-        race_objs = self.get_race_objects(raw_races)
-        races, reporting_units, candidate_reporting_units = self.get_units(
-            race_objs
-        )
         return candidate_reporting_units
 
     @property
@@ -1105,7 +1714,7 @@ class Election(APElection):
         """
         Return list of candidate reporting unit objects with results.
         """
-        raw_races = self.get_raw_races(
+        races, reporting_units, candidate_reporting_units = self.get_cached_units(
             omitResults=False,
             level=self.resultslevel,
             setzerocounts=self.setzerocounts,
@@ -1114,18 +1723,46 @@ class Election(APElection):
             officeID=self.officeids,
             apiKey=self.api_key
         )
-        race_objs = self.get_race_objects(raw_races)
-        races, reporting_units, candidate_reporting_units = self.get_units(
-            race_objs
-        )
         return candidate_reporting_units
 
+    def results_table(self):
+        """
+        Return the same rows as :attr:`results`, serialized, in a
+        column-oriented :class:`elex.api.table.ResultsTable`.
+
+        Race objects are built and their rows added to the table one race
+        at a time, so only one race's objects are alive at once and none
+        are kept.
+        """
+        payload = self.get_raw_races(
+            omitResults=False,
+            level=self.resultslevel,
+            setzerocounts=self.setzerocounts,
+            test=self.testresults,
+            national=self.national,
+            officeID=self.officeids,
+            apiKey=self.api_key
+        )
+        results = ResultsTable(
+            CandidateReportingUnit.columns,
+            CandidateReportingUnit.column_types
+        )
+        with timings.stage('table') as stage:
+            for race in self._iter_race_objects(payload):
+                races, reporting_units, candidate_reporting_units = self._get_units([race])
+                results.extend(
+                    CandidateReportingUnit.rows(candidate_reporting_units)
+                )
+            results.compact()
+            stage.count = len(results)
+        return results
+
     @property
     def candidates(self):
         """
         Return list of candidate objects with results.
         """
-        raw_races = self.get_raw_races(
+        races, reporting_units, candidate_reporting_units = self.get_cached_units(
             omitResults=True,
             level="ru",
             test=self.testresults,
@@ -1133,10 +1770,6 @@ class Election(APElection):
             officeID=self.officeids,
             apiKey=self.api_key
         )
-        race_objs = self.get_race_objects(raw_races)
-        races, reporting_units, candidate_reporting_units = self.get_units(
-            race_objs
-        )
         candidates, ballot_measures = self.get_uniques(
             candidate_reporting_units
         )
@@ -1147,18 +1780,41 @@ class Election(APElection):
         """
         Return list of ballot measure objects with results.
         """
-        raw_races = self.get_raw_races(
+        races, reporting_units, candidate_reporting_units = self.get_cached_units(
             omitResults=True,
             level="ru",
             test=self.testresults,
             national=self.national,
             apiKey=self.api_key
         )
-        race_objs = self.get_race_objects(raw_races)
-        races, reporting_units, candidate_reporting_units = self.get_units(
-            race_objs
-        )
         candidates, ballot_measures = self.get_uniques(
             candidate_reporting_units
         )
         return ballot_measures
+
+    @property
+    def bundle(self):
+        """
+        Return every entity list parsed from a single results request,
+        as an OrderedDict of races, reporting units, results, candidates
+        and ballot measures.
+        """
+        races, reporting_units, candidate_reporting_units = self.get_cached_units(
+            omitResults=False,
+            level=self.resultslevel,
+            setzerocounts=self.setzerocounts,
+            test=self.testresults,
+            national=self.national,
+            officeID=self.officeids,
+            apiKey=self.api_key
+        )
+        candidates, ballot_measures = self.get_uniques(
+            candidate_reporting_units
+        )
+        return OrderedDict((
+            ('races', races),
+            ('reporting_units', reporting_units),
+            ('results', candidate_reporting_units),
+            ('candidates', candidates),
+            ('ballot_measures', ballot_measures),
+        ))
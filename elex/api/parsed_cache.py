@@ -0,0 +1,197 @@
+"""
+Cache parsed election results by response ETag.
+
+When CacheControl answers a poll from its cache (usually after a 304),
+the body is byte-for-byte what was parsed last time, so the parsed races,
+reporting units and candidate reporting units can be reused instead of
+decoding and rebuilding them. Entries are keyed by the request URL (less
+the API key), the response ETag, the elex version and anything else that
+changes how the payload is parsed.
+
+The cache keeps the `ELEX_PARSED_CACHE_SIZE` (default 8) most recently
+used results in memory. Set `ELEX_PARSED_CACHE_DIR` to also pickle them
+to disk, so separate ``elex`` invocations share them. Set
+`ELEX_PARSED_CACHE_SIZE` to 0 to disable the cache.
+
+Cached objects are shared between every caller that gets a hit; treat
+them as read-only.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import elex
+
+try:
+    from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+except ImportError:
+    from urllib import urlencode
+    from urlparse import parse_qsl, urlsplit, urlunsplit
+
+PARSED_CACHE_SIZE = int(os.environ.get('ELEX_PARSED_CACHE_SIZE', 8))
+PARSED_CACHE_DIR = os.environ.get('ELEX_PARSED_CACHE_DIR', None)
+
+_parsed_cache = None
+_parsed_cache_lock = threading.Lock()
+
+
+class ParsedCache(object):
+    """
+    A least recently used cache of parsed results, optionally backed by a
+    directory of pickles.
+    """
+    def __init__(self, max_entries=PARSED_CACHE_SIZE, directory=None):
+        """
+        :param max_entries:
+            Number of results to keep in memory, and on disk.
+        :param directory:
+            Optional directory to pickle results to.
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Return the parsed result for `key`, or None.
+        """
+        if not self.max_entries:
+            return None
+
+        with self.lock:
+            value = self.data.pop(key, None)
+            if value is not None:
+                self.data[key] = value
+                self.hits += 1
+                return value
+
+        value = self._load(key)
+        with self.lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._store(key, value)
+        return value
+
+    def set(self, key, value):
+        """
+        Cache the parsed result `value` for `key`.
+        """
+        if not self.max_entries:
+            return
+
+        with self.lock:
+            self._store(key, value)
+        self._dump(key, value)
+
+    def clear(self):
+        """
+        Drop every cached result, in memory and on disk.
+        """
+        with self.lock:
+            self.data.clear()
+        for path in self._paths():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _store(self, key, value):
+        self.data.pop(key, None)
+        self.data[key] = value
+        while len(self.data) > self.max_entries:
+            self.data.popitem(last=False)
+
+    def _path(self, key):
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, '{0}.pickle'.format(digest))
+
+    def _paths(self):
+        if not self.directory or not os.path.isdir(self.directory):
+            return []
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith('.pickle')
+        ]
+
+    def _load(self, key):
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as readfile:
+                stored_key, value = pickle.load(readfile)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError,
+                AttributeError, ImportError, ValueError):
+            return None
+        if stored_key != key:
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return value
+
+    def _dump(self, key, value):
+        if not self.directory:
+            return
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        # Write to a temporary file first so readers never see half a pickle.
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as writefile:
+            pickle.dump((key, value), writefile, pickle.HIGHEST_PROTOCOL)
+        path = self._path(key)
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(temp_path, path)
+
+        paths = sorted(self._paths(), key=os.path.getmtime)
+        for path in paths[:-self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def parsed_cache_key(response, *args):
+    """
+    Build a parsed cache key for `response`, or return None if it has no
+    ETag to key on.
+
+    :param response:
+        A response from the caching session.
+    :param \\*args:
+        Anything else that changes how the payload is parsed.
+    """
+    etag = response.headers.get('ETag')
+    if not etag:
+        return None
+
+    parts = urlsplit(response.url)
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query) if k != 'apiKey'
+    ))
+    url = urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+    return (url, etag, elex.__version__) + tuple(args)
+
+
+def get_parsed_cache():
+    """
+    Return the shared :class:`ParsedCache`, creating it on first use.
+    """
+    global _parsed_cache
+    if _parsed_cache is None:
+        with _parsed_cache_lock:
+            if _parsed_cache is None:
+                _parsed_cache = ParsedCache(directory=PARSED_CACHE_DIR)
+    return _parsed_cache
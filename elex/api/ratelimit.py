@@ -0,0 +1,191 @@
+"""
+Client-side rate limiting for AP Elections API requests.
+
+The AP API allows a fixed number of requests per minute and answers any
+more with a 403. Set `ELEX_API_QUOTA` to that number and every request
+made through :func:`elex.api.utils.api_request` first takes a token from a
+shared limiter, waiting for one if the quota is used up instead of
+failing. Results requests go ahead of waiting ``/reports`` requests.
+
+Tokens are the quota less the requests made in the last minute, so the
+whole quota can be used at once but never more than the quota is used in
+any minute. (A classic token bucket refilling at the same average rate
+would allow up to twice the quota in a minute after a burst.)
+
+The limiter is shared by every thread in the process. To share it between
+processes, for example several ``elex`` commands run from cron, set
+`ELEX_API_QUOTA_FILE` to a path they can all write to; the limiter's
+state is kept there under a lock file.
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+API_QUOTA = os.environ.get('ELEX_API_QUOTA', None)
+API_QUOTA_FILE = os.environ.get('ELEX_API_QUOTA_FILE', None)
+QUOTA_PERIOD = 60.0
+
+RESULTS = 0
+REPORTS = 1
+PRIORITY_NAMES = {
+    RESULTS: 'results',
+    REPORTS: 'reports',
+}
+
+logger = logging.getLogger(__name__)
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket holding `quota` tokens, where each token
+    taken is returned `period` seconds later.
+    """
+    def __init__(self, quota, period=QUOTA_PERIOD, state_file=None):
+        """
+        :param quota:
+            Requests allowed per `period`.
+        :param period:
+            Length of the quota window, in seconds.
+        :param state_file:
+            Optional path to keep the bucket's state in, to share it
+            between processes.
+        """
+        self.quota = quota
+        self.period = period
+        self.state_file = state_file
+        self.taken = []
+        self.condition = threading.Condition()
+        self.waiting = dict((priority, 0) for priority in PRIORITY_NAMES)
+
+    def acquire(self, priority=RESULTS, timeout=None):
+        """
+        Take a token, waiting until one is available. Waiting requests of
+        a higher priority (lower number) are served first.
+
+        Returns True once a token is taken, or False if `timeout` seconds
+        pass first.
+
+        :param priority:
+            :data:`RESULTS` or :data:`REPORTS`.
+        :param timeout:
+            Optional maximum number of seconds to wait.
+        """
+        start = time.time()
+        deadline = None if timeout is None else start + timeout
+        with self.condition:
+            self.waiting[priority] += 1
+            try:
+                while True:
+                    ahead = any(
+                        self.waiting[p] for p in self.waiting if p < priority
+                    )
+                    wait = None if ahead else self._take()
+                    if wait == 0:
+                        waited = time.time() - start
+                        if waited > 0.01:
+                            logger.debug(
+                                'Waited %.2f s for AP API quota (%s)',
+                                waited, PRIORITY_NAMES[priority]
+                            )
+                        return True
+
+                    if deadline is not None:
+                        remaining = deadline - time.time()
+                        if remaining <= 0:
+                            return False
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self.condition.wait(wait)
+            finally:
+                self.waiting[priority] -= 1
+                self.condition.notify_all()
+
+    def drain(self):
+        """
+        Empty the bucket for a full period, e.g. after the API answered
+        with a 403 because the quota was used by someone else.
+        """
+        def drain(taken):
+            return [time.time()] * self.quota, None
+
+        with self.condition:
+            self._update(drain)
+
+    def budget(self):
+        """
+        Return the current budget for monitoring: the quota, the tokens
+        available now and the number of waiting requests by priority.
+        """
+        with self.condition:
+            taken = self._update(lambda taken: (taken, len(taken)))
+            budget = {
+                'quota': self.quota,
+                'available': max(self.quota - taken, 0),
+            }
+            for priority, name in PRIORITY_NAMES.items():
+                budget['waiting_{0}'.format(name)] = self.waiting[priority]
+            return budget
+
+    def _take(self):
+        """
+        Take a token if one is available; returns 0 if one was taken, or
+        the number of seconds until the next one is returned.
+        """
+        def take(taken):
+            if len(taken) < self.quota:
+                return taken + [time.time()], 0
+            return taken, max(taken[0] + self.period - time.time(), 0.001)
+        return self._update(take)
+
+    def _update(self, fn):
+        """
+        Forget tokens taken more than a period ago, then apply
+        `fn(taken) -> (taken, result)` to the sorted times tokens were
+        taken, in this process or in the shared state file, and return
+        `result`.
+        """
+        if not self.state_file:
+            self.taken, result = fn(self._expire(self.taken))
+            return result
+
+        from lockfile import LockFile
+        with LockFile(self.state_file):
+            try:
+                with open(self.state_file) as readfile:
+                    taken = json.load(readfile)
+            except (IOError, OSError, ValueError):
+                taken = []
+            taken, result = fn(self._expire(taken))
+            with open(self.state_file, 'w') as writefile:
+                json.dump(taken, writefile)
+            return result
+
+    def _expire(self, taken):
+        cutoff = time.time() - self.period
+        return [t for t in taken if t > cutoff]
+
+
+def get_limiter():
+    """
+    Return the shared :class:`TokenBucket`, or None if `ELEX_API_QUOTA`
+    isn't set.
+    """
+    global _limiter
+    if _limiter is None and API_QUOTA:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = TokenBucket(int(API_QUOTA), state_file=API_QUOTA_FILE)
+    return _limiter
+
+
+def request_priority(path):
+    """
+    Return the priority of a request for `path`.
+    """
+    if path.lstrip('/').startswith('reports'):
+        return REPORTS
+    return RESULTS
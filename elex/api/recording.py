@@ -0,0 +1,585 @@
+"""
+Record raw Associated Press Elections API responses as they are received.
+
+Recording is enabled with `ELEX_RECORDING` (``flat`` or ``mongodb``).
+Payloads are handed to a background writer thread through a bounded queue,
+so a slow disk or database never delays parsing and output. If the queue
+is full, the payload is dropped and a warning is logged. Queued payloads
+are written before the interpreter exits. MongoDB recordings share one
+pooled client and are inserted in unordered batches.
+
+Flat recordings can be compressed (`ELEX_RECORDING_COMPRESSION`), stored
+by content hash so unchanged payloads only cost a small pointer file
+(`ELEX_RECORDING_DEDUPE`), and stored as JSON deltas against a periodic
+base snapshot (`ELEX_RECORDING_DELTAS`). The current base and delta count
+are kept in the recording directory, so deltas carry on across runs, e.g.
+one `elex` run per poll. Use :func:`read_recording` to load a recording in
+any of these formats.
+"""
+import atexit
+import datetime
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+from six.moves import queue
+
+RECORDING_QUEUE_SIZE = int(os.environ.get('ELEX_RECORDING_QUEUE_SIZE', 64))
+RECORDING_BATCH_SIZE = int(os.environ.get('ELEX_RECORDING_BATCH_SIZE', 32))
+RECORDING_PREFIX = 'ap_elections_loader_recording-'
+OBJECTS_DIRECTORY = 'objects'
+# Base and delta count of ELEX_RECORDING_DELTAS, kept next to `objects/`.
+DELTA_STATE_FILE = 'recording_state.json'
+DELTA_STATE_KEYS = ('base', 'deltas', 'digest', 'target')
+COMPRESSION_SUFFIXES = {
+    '': '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+# Bytes read from the start of a recording to find its election date.
+HEAD_SIZE = 64 * 1024
+ELECTION_DATE = re.compile(br'"electionDate"\s*:\s*"([^"]*)"')
+
+logger = logging.getLogger(__name__)
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+class Recorder(object):
+    """
+    Writes recordings from a background thread, started on first use.
+    """
+    def __init__(self, queue_size=RECORDING_QUEUE_SIZE, mongodb_client=None):
+        """
+        :param queue_size:
+            Maximum number of payloads waiting to be written.
+        :param mongodb_client:
+            Optional `pymongo.MongoClient` (or compatible) to record to;
+            by default one is created from `ELEX_RECORDING_MONGO_URL` on
+            first use.
+        """
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.thread = None
+        self.lock = threading.Lock()
+        self.dropped = 0
+        self.flat_state = {}
+        self.mongodb_client = mongodb_client
+        self.mongodb_collection = None
+
+    def record(self, content, recorder=None, timestamp=None):
+        """
+        Queue raw response bytes to be recorded.
+
+        :param content:
+            The response body, as received.
+        :param recorder:
+            ``flat`` or ``mongodb``; defaults to `ELEX_RECORDING`.
+        :param timestamp:
+            When the response was received; defaults to now.
+        """
+        recorder = recorder or os.environ.get('ELEX_RECORDING', False)
+        if not recorder:
+            return
+        if timestamp is None:
+            timestamp = int(time.mktime(datetime.datetime.now().timetuple()))
+
+        self.start()
+        try:
+            self.queue.put_nowait((recorder, timestamp, content))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(
+                'Recording queue is full; dropped recording at %s', timestamp
+            )
+
+    def start(self):
+        """
+        Start the writer thread if it isn't running.
+        """
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(
+                        target=self.run,
+                        name='elex-recorder'
+                    )
+                    self.thread.daemon = True
+                    self.thread.start()
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < RECORDING_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.write_batch(batch)
+            finally:
+                for item in batch:
+                    self.queue.task_done()
+
+    def flush(self):
+        """
+        Block until every queued payload has been written.
+        """
+        if self.thread is not None:
+            self.queue.join()
+
+    def write_batch(self, batch):
+        """
+        Write queued recordings, inserting MongoDB documents together.
+        Called from the writer thread.
+        """
+        documents = []
+        for recorder, timestamp, content in batch:
+            try:
+                if recorder == u"mongodb":
+                    documents.append(mongodb_document(timestamp, content))
+                else:
+                    self.write(recorder, timestamp, content)
+            except Exception:
+                logger.exception('Could not write recording at %s', timestamp)
+
+        if documents:
+            try:
+                self.write_mongodb(documents)
+            except Exception:
+                logger.exception(
+                    'Could not write %s recordings to MongoDB', len(documents)
+                )
+
+    def write(self, recorder, timestamp, content):
+        """
+        Write a single recording.
+        """
+        if recorder == u"mongodb":
+            self.write_mongodb([mongodb_document(timestamp, content)])
+        elif recorder == u"flat":
+            self.write_flat(timestamp, content)
+
+    def get_mongodb_collection(self):
+        """
+        Return the recording collection, connecting on first use. The
+        client is kept for the life of the recorder and pools its
+        connections.
+        """
+        if self.mongodb_collection is None:
+            from pymongo.write_concern import WriteConcern
+
+            client = self.mongodb_client
+            if client is None:
+                from pymongo import MongoClient
+                client = self.mongodb_client = MongoClient(
+                    os.environ.get(
+                        'ELEX_RECORDING_MONGO_URL',
+                        'mongodb://localhost:27017/'
+                    )
+                )
+            database = client[
+                os.environ.get(
+                    'ELEX_RECORDING_MONGO_DB',
+                    'ap_elections_loader'
+                )
+            ]
+            collection = database.elex_recording
+
+            w = os.environ.get('ELEX_RECORDING_MONGO_WRITE_CONCERN', None)
+            if w:
+                collection = collection.with_options(
+                    write_concern=WriteConcern(w=int(w) if w.isdigit() else w)
+                )
+            self.mongodb_collection = collection
+        return self.mongodb_collection
+
+    def write_mongodb(self, documents):
+        """
+        Insert recording documents in one unordered batch.
+        """
+        self.get_mongodb_collection().insert_many(documents, ordered=False)
+
+    def write_flat(self, timestamp, content):
+        """
+        Write a flat file recording to `ELEX_RECORDING_DIR`.
+
+        With `ELEX_RECORDING_DEDUPE`, full payloads are stored once under
+        ``objects/`` by SHA-256, and each recording is a ``.ref`` file
+        naming the payload it points to. A payload identical to the
+        previous one is always just a pointer.
+
+        With `ELEX_RECORDING_DELTAS` set to N, a full base payload is
+        written, followed by up to N ``.delta.json`` files holding the
+        changes from that base. Delta files are never deduplicated
+        against ``objects/``, but a repeated payload still points to the
+        previous delta. The base, delta count and previous payload's
+        digest are saved to ``recording_state.json`` in the directory
+        after each recording and read back by the next recorder to write
+        there, so a new process carries on from the same base.
+        """
+        directory = os.environ.get('ELEX_RECORDING_DIR', '/tmp')
+        compression = os.environ.get('ELEX_RECORDING_COMPRESSION', '')
+        dedupe = bool(os.environ.get('ELEX_RECORDING_DEDUPE', False))
+        deltas = int(os.environ.get('ELEX_RECORDING_DELTAS', 0) or 0)
+        suffix = COMPRESSION_SUFFIXES[compression]
+        name = '{0}{1}'.format(RECORDING_PREFIX, timestamp)
+
+        if not (compression or dedupe or deltas):
+            _write(os.path.join(directory, name + '.json'), content)
+            return
+
+        state = self.flat_state
+        if state.get('directory') != directory:
+            state.clear()
+            state['directory'] = directory
+            if deltas:
+                state.update(read_delta_state(directory))
+
+        digest = hashlib.sha256(content).hexdigest()
+        if dedupe and digest == state.get('digest'):
+            _write_ref(directory, name, state['target'])
+            return
+
+        payload = None
+        if deltas:
+            payload = json.loads(content.decode('utf-8'))
+
+        if deltas and 'base' in state and 'base_payload' not in state:
+            # The base was written by an earlier process.
+            try:
+                state['base_payload'] = read_recording(
+                    os.path.join(directory, state['base'])
+                )
+            except (IOError, OSError, ValueError):
+                logger.warning(
+                    'Could not read recording base %s; writing a new one',
+                    state['base']
+                )
+                del state['base']
+
+        if deltas and 'base' in state and state['deltas'] < deltas:
+            delta = {
+                'base': state['base'],
+                'ops': json_diff(state['base_payload'], payload),
+            }
+            target = name + '.delta.json' + suffix
+            _write(
+                os.path.join(directory, target),
+                compress(json.dumps(delta).encode('utf-8'), compression)
+            )
+            state['deltas'] += 1
+        else:
+            if dedupe:
+                target = '{0}/{1}.json{2}'.format(
+                    OBJECTS_DIRECTORY, digest, suffix
+                )
+                path = os.path.join(directory, target)
+                if not os.path.exists(path):
+                    objects = os.path.join(directory, OBJECTS_DIRECTORY)
+                    if not os.path.isdir(objects):
+                        os.makedirs(objects)
+                    _write(path, compress(content, compression))
+            else:
+                target = name + '.json' + suffix
+                _write(
+                    os.path.join(directory, target),
+                    compress(content, compression)
+                )
+            if deltas:
+                state['base'] = target
+                state['base_payload'] = payload
+                state['deltas'] = 0
+
+        if dedupe and target.startswith(OBJECTS_DIRECTORY):
+            _write_ref(directory, name, target)
+        state['digest'] = digest
+        state['target'] = target
+        if deltas:
+            write_delta_state(directory, state)
+
+
+def get_recorder():
+    """
+    Return the shared :class:`Recorder`, creating it on first use.
+    """
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = Recorder()
+                atexit.register(_recorder.flush)
+    return _recorder
+
+
+def read_delta_state(directory):
+    """
+    Return the delta state saved in recording directory `directory` by
+    :func:`write_delta_state`, or an empty dict if there is none.
+    """
+    path = os.path.join(directory, DELTA_STATE_FILE)
+    try:
+        with open(path) as readfile:
+            saved = json.load(readfile)
+    except (IOError, OSError, ValueError):
+        return {}
+    if not isinstance(saved, dict) or 'base' not in saved:
+        return {}
+    return dict((key, saved[key]) for key in DELTA_STATE_KEYS if key in saved)
+
+
+def write_delta_state(directory, state):
+    """
+    Save the base, delta count and last digest and target of flat
+    recordings in `directory`, replacing the file in one step.
+    """
+    path = os.path.join(directory, DELTA_STATE_FILE)
+    saved = dict((key, state[key]) for key in DELTA_STATE_KEYS if key in state)
+    _write(path + '.tmp', json.dumps(saved).encode('utf-8'))
+    os.rename(path + '.tmp', path)
+
+
+def iter_recordings(directory):
+    """
+    Yield `(timestamp, path)` for every flat file recording in
+    `directory`, oldest first, whatever format it was written in.
+
+    :param directory:
+        A recording directory, e.g. `ELEX_RECORDING_DIR`.
+    """
+    recordings = []
+    for name in os.listdir(directory):
+        if not name.startswith(RECORDING_PREFIX):
+            continue
+        timestamp = name[len(RECORDING_PREFIX):].split('.', 1)[0]
+        if not timestamp.isdigit():
+            continue
+        recordings.append((int(timestamp), name))
+
+    for timestamp, name in sorted(recordings):
+        yield timestamp, os.path.join(directory, name)
+
+
+def resolve_recording(path):
+    """
+    Return the path of the file holding a recording, following ``.ref``
+    pointers.
+
+    :param path:
+        Path to a recording file.
+    """
+    while path.endswith('.ref'):
+        with open(path) as readfile:
+            target = readfile.read().strip()
+        path = os.path.join(os.path.dirname(path), target)
+    return path
+
+
+def is_delta(path):
+    return '.delta.json' in os.path.basename(path)
+
+
+def read_recording(path):
+    """
+    Load the payload of a flat file recording, following ``.ref``
+    pointers, decompressing and applying deltas as needed.
+
+    :param path:
+        Path to a recording file.
+    """
+    path = resolve_recording(path)
+    with open(path, 'rb') as readfile:
+        content = decompress(readfile.read(), path)
+    payload = json.loads(content.decode('utf-8'))
+
+    if is_delta(path):
+        base = read_recording(
+            os.path.join(os.path.dirname(path), payload['base'])
+        )
+        return apply_delta(base, payload['ops'])
+    return payload
+
+
+def read_recording_content(path):
+    """
+    Return the bytes of a flat file recording as they were received,
+    following ``.ref`` pointers and decompressing as needed. Deltas don't
+    keep the received bytes, so a delta recording's payload is rebuilt
+    and encoded again.
+
+    :param path:
+        Path to a recording file.
+    """
+    path = resolve_recording(path)
+    if is_delta(path):
+        return json.dumps(read_recording(path)).encode('utf-8')
+    with open(path, 'rb') as readfile:
+        return decompress(readfile.read(), path)
+
+
+def recording_election_date(path):
+    """
+    Return the `electionDate` of a recording of election results, or None
+    if it isn't one, decompressing only the start of the file when the
+    date and races can be found there.
+
+    :param path:
+        Path to a recording file.
+    """
+    path = resolve_recording(path)
+    if not is_delta(path):
+        with open(path, 'rb') as readfile:
+            head = read_head(readfile, path)
+        match = ELECTION_DATE.search(head)
+        if match and b'"races"' in head:
+            return match.group(1).decode('utf-8')
+
+    payload = read_recording(path)
+    if isinstance(payload, dict) and 'races' in payload:
+        return payload.get('electionDate')
+    return None
+
+
+def read_head(readfile, path, size=HEAD_SIZE):
+    """
+    Read up to `size` decompressed bytes from the start of `readfile`, a
+    recording opened from `path`.
+    """
+    if path.endswith('.gz'):
+        with gzip.GzipFile(fileobj=readfile) as gzipfile:
+            return gzipfile.read(size)
+    elif path.endswith('.zst'):
+        import zstandard
+        reader = zstandard.ZstdDecompressor().stream_reader(readfile)
+        return reader.read(size)
+    return readfile.read(size)
+
+
+def mongodb_document(timestamp, content):
+    """
+    Build the MongoDB document for a recording. With
+    `ELEX_RECORDING_MONGO_COMPRESSION` (``gzip`` or ``zstd``), the raw
+    payload is stored compressed as binary data instead of as a decoded
+    document.
+    """
+    compression = os.environ.get('ELEX_RECORDING_MONGO_COMPRESSION', '')
+    if compression:
+        from bson.binary import Binary
+        return {
+            "time": timestamp,
+            "encoding": compression,
+            "data": Binary(compress(content, compression)),
+        }
+    return {"time": timestamp, "data": json.loads(content.decode('utf-8'))}
+
+
+def read_mongodb_recording(document):
+    """
+    Load the payload of a recording document written by
+    :func:`mongodb_document`.
+
+    :param document:
+        A document from the ``elex_recording`` collection.
+    """
+    encoding = document.get('encoding')
+    if encoding:
+        suffix = COMPRESSION_SUFFIXES[encoding]
+        content = decompress(bytes(document['data']), suffix)
+        return json.loads(content.decode('utf-8'))
+    return document['data']
+
+
+def compress(content, compression):
+    """
+    Compress bytes with ``gzip`` or ``zstd``; an empty `compression`
+    returns them unchanged.
+    """
+    if compression == 'gzip':
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb', mtime=0) as gzipfile:
+            gzipfile.write(content)
+        return buf.getvalue()
+    elif compression == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor().compress(content)
+    return content
+
+
+def decompress(content, path):
+    """
+    Decompress bytes read from `path`, based on its file extension.
+    """
+    if path.endswith('.gz'):
+        with gzip.GzipFile(fileobj=io.BytesIO(content)) as gzipfile:
+            return gzipfile.read()
+    elif path.endswith('.zst'):
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(content)
+    return content
+
+
+def json_diff(old, new, path=None, ops=None):
+    """
+    Return a list of operations turning the JSON value `old` into `new`.
+
+    Each operation is ``['replace', path, value]`` or
+    ``['remove', path]``, where `path` is a list of object keys and array
+    indexes. Objects and same-length arrays are compared item by item;
+    any other change replaces the value whole.
+    """
+    if path is None:
+        path = []
+    if ops is None:
+        ops = []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append(['remove', path + [key]])
+        for key, value in new.items():
+            if key in old:
+                json_diff(old[key], value, path + [key], ops)
+            else:
+                ops.append(['replace', path + [key], value])
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for i, (old_value, new_value) in enumerate(zip(old, new)):
+            json_diff(old_value, new_value, path + [i], ops)
+    elif type(old) is not type(new) or old != new:
+        ops.append(['replace', path, new])
+    return ops
+
+
+def apply_delta(payload, ops):
+    """
+    Apply operations from :func:`json_diff` to `payload`, in place where
+    possible, and return the result.
+    """
+    for op in ops:
+        path = op[1]
+        if not path:
+            payload = op[2]
+            continue
+        parent = payload
+        for key in path[:-1]:
+            parent = parent[key]
+        if op[0] == 'remove':
+            del parent[path[-1]]
+        else:
+            parent[path[-1]] = op[2]
+    return payload
+
+
+def _write(path, content):
+    with open(path, 'wb') as writefile:
+        writefile.write(content)
+
+
+def _write_ref(directory, name, target):
+    with open(os.path.join(directory, name + '.ref'), 'w') as writefile:
+        writefile.write(target)
@@ -0,0 +1,369 @@
+"""
+Column-oriented storage for result rows.
+
+A :class:`ResultsTable` keeps one column per field instead of one object
+per row, with a fixed type for each column. Integer, float and boolean
+columns are typed arrays (:class:`array.array`), which NumPy and other
+buffer-aware libraries can use without copying::
+
+    votes = numpy.asarray(table.array('votecount'))
+
+Missing values (None) in a typed column are stored as 0 and flagged in
+the column's null mask (:meth:`ResultsTable.mask`). Any other value of
+the wrong type raises a TypeError.
+
+Every other column is dictionary-encoded: an array of small integer codes
+into a list of the column's distinct values, so repeated strings such as
+state names, office names and parties are stored once.
+
+Rows are added in batches (e.g. a race at a time) with
+:meth:`ResultsTable.extend`, which splits them into columns with
+``zip(*rows)`` and extends each column's array once.
+"""
+from array import array
+from collections import OrderedDict
+
+try:
+    array('q')
+    INT_TYPECODE = 'q'
+except ValueError:
+    INT_TYPECODE = 'l'
+
+# Code widths for dictionary-encoded columns, widened as values are added.
+CODE_TYPECODES = (('B', 0xff), ('H', 0xffff), ('i', 0x7fffffff))
+
+# One entry of a null mask for a value that isn't missing.
+NOT_NULL = array('B', [0])
+
+
+class TypedColumn(object):
+    """
+    A column of values of one type, stored in an :class:`array.array`,
+    with a null mask once a value is None.
+    """
+    encoded = False
+
+    def __init__(self, kind, typecode):
+        self.kind = kind
+        self.data = array(typecode)
+        self.mask = None
+
+    def extend(self, values):
+        """
+        Add a sequence of values.
+        """
+        data = self.data
+        start = len(data)
+        try:
+            data.extend(values)
+        except OverflowError:
+            del data[start:]
+            if data.typecode != 'i':
+                raise
+            self.data = array(INT_TYPECODE, data)
+            self.extend(values)
+            return
+        except TypeError:
+            del data[start:]
+            self.extend_nullable(values)
+            return
+        if self.mask is not None:
+            self.mask.extend(NOT_NULL * len(values))
+
+    def extend_nullable(self, values):
+        """
+        Add a sequence of values, some of them None.
+        """
+        if self.mask is None:
+            self.mask = NOT_NULL * len(self.data)
+        mask = self.mask
+        for value in values:
+            if value is None:
+                self.data.append(0)
+                mask.append(1)
+                continue
+            try:
+                self.data.append(value)
+            except OverflowError:
+                if self.data.typecode != 'i':
+                    raise
+                self.data = array(INT_TYPECODE, self.data)
+                self.data.append(value)
+            mask.append(0)
+
+    def truncate(self, length):
+        del self.data[length:]
+        if self.mask is not None:
+            del self.mask[length:]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if self.mask is not None and self.mask[index]:
+            return None
+        return self.kind(self.data[index])
+
+    def values(self):
+        if self.kind is bool:
+            values = [value != 0 for value in self.data]
+        else:
+            values = self.data.tolist()
+        if self.mask is None:
+            return values
+        return [
+            None if null else value
+            for value, null in zip(values, self.mask)
+        ]
+
+    @property
+    def nbytes(self):
+        nbytes = self.data.itemsize * len(self.data)
+        if self.mask is not None:
+            nbytes += len(self.mask)
+        return nbytes
+
+
+class EncodedColumn(object):
+    """
+    A dictionary-encoded column: codes into a list of distinct values.
+    """
+    encoded = True
+    mask = None
+
+    def __init__(self):
+        self.index = {}
+        self.width = 0
+        self.data = array(CODE_TYPECODES[0][0])
+        self._categories = []
+
+    def extend(self, values):
+        """
+        Add a sequence of values.
+        """
+        index = self.index
+        if index is None:
+            index = self.index = dict(
+                (value, code) for code, value in enumerate(self._categories)
+            )
+
+        # New values get the next codes, in order.
+        count = len(index)
+        first = values[0]
+        if values.count(first) == len(values):
+            # Race-wide fields are the same in every row of a race.
+            codes = [index.setdefault(first, count)] * len(values)
+        else:
+            setdefault = index.setdefault
+            codes = [setdefault(value, len(index)) for value in values]
+
+        if len(index) > count:
+            while len(index) - 1 > CODE_TYPECODES[self.width][1]:
+                self.width += 1
+                self.data = array(CODE_TYPECODES[self.width][0], self.data)
+        self.data.extend(codes)
+
+    @property
+    def categories(self):
+        """
+        The column's distinct values, in code order.
+        """
+        if self.index is not None and len(self._categories) != len(self.index):
+            categories = [None] * len(self.index)
+            for value, code in self.index.items():
+                categories[code] = value
+            self._categories = categories
+        return self._categories
+
+    def compact(self):
+        """
+        Drop the lookup table used while adding values; it is rebuilt if
+        more values are added.
+        """
+        self.categories
+        self.index = None
+
+    def truncate(self, length):
+        del self.data[length:]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return self.categories[self.data[index]]
+
+    def values(self):
+        categories = self.categories
+        return [categories[code] for code in self.data]
+
+    @property
+    def nbytes(self):
+        return self.data.itemsize * len(self.data)
+
+
+def make_column(kind=None):
+    """
+    Return an empty column for values of type `kind`: int, float or bool,
+    or None for a dictionary-encoded column.
+    """
+    if kind is bool:
+        return TypedColumn(bool, 'b')
+    if kind is int:
+        # Widened to INT_TYPECODE if a value doesn't fit.
+        return TypedColumn(int, 'i')
+    if kind is float:
+        return TypedColumn(float, 'd')
+    if kind is None:
+        return EncodedColumn()
+    raise ValueError('Unsupported column type {0!r}'.format(kind))
+
+
+class ResultsTable(object):
+    """
+    Rows of results stored by column. Columns are in the order of the
+    rows' fields, e.g. those of
+    :meth:`elex.api.models.CandidateReportingUnit.serialize`.
+    """
+    def __init__(self, columns=None, types=None):
+        """
+        :param columns:
+            Optional list of column names. If not given, the keys of the
+            first row added are used.
+        :param types:
+            Optional dict of column names to int, float or bool, e.g.
+            :attr:`elex.api.models.CandidateReportingUnit.column_types`.
+            Other columns are dictionary-encoded.
+        """
+        self.columns = list(columns or [])
+        self.types = dict(types or {})
+        self._data = None
+        self._length = 0
+
+    def append(self, row):
+        """
+        Add a row.
+
+        :param row:
+            A sequence of values in column order, or a mapping of column
+            names to values.
+        """
+        self.extend([row])
+
+    def extend(self, rows):
+        """
+        Add rows, each as for :meth:`append`. If a value can't be added,
+        none of the rows are.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+
+        if hasattr(rows[0], 'keys'):
+            if not self.columns:
+                self.columns = list(rows[0].keys())
+            rows = [[row[name] for name in self.columns] for row in rows]
+
+        width = len(self.columns)
+        lengths = set(map(len, rows))
+        if lengths != set([width]):
+            raise ValueError('Expected {0} values per row, got {1}'.format(
+                width, ', '.join(str(length) for length in sorted(lengths))
+            ))
+
+        if self._data is None:
+            self._data = [
+                make_column(self.types.get(name)) for name in self.columns
+            ]
+
+        try:
+            for column, values in zip(self._data, zip(*rows)):
+                column.extend(values)
+        except Exception:
+            for column in self._data:
+                column.truncate(self._length)
+            raise
+        self._length += len(rows)
+
+    def compact(self):
+        """
+        Free memory only needed while adding rows.
+        """
+        for column in self._data or []:
+            if column.encoded:
+                column.compact()
+
+    def __len__(self):
+        return self._length
+
+    def _column(self, name):
+        if name not in self.columns:
+            raise KeyError(name)
+        if self._data is None:
+            return None
+        return self._data[self.columns.index(name)]
+
+    def column(self, name):
+        """
+        Return the values of column `name` as a list.
+        """
+        column = self._column(name)
+        return [] if column is None else column.values()
+
+    def array(self, name):
+        """
+        Return the :class:`array.array` backing column `name`: its values
+        for a typed column, with 0 for missing values, or its codes into
+        :meth:`categories` for a dictionary-encoded one.
+        """
+        column = self._column(name)
+        return array('b') if column is None else column.data
+
+    def mask(self, name):
+        """
+        Return the null mask of typed column `name`, an
+        :class:`array.array` of 1 for each missing value and 0 for the
+        others, or None if the column has no missing values.
+        """
+        column = self._column(name)
+        return None if column is None else column.mask
+
+    def categories(self, name):
+        """
+        Return the distinct values of dictionary-encoded column `name`,
+        in code order, or None if the column is typed.
+        """
+        column = self._column(name)
+        if column is None or not column.encoded:
+            return None
+        return column.categories
+
+    def row(self, index):
+        """
+        Return row `index` as an OrderedDict of column names to values.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return OrderedDict(
+            (name, column[index])
+            for name, column in zip(self.columns, self._data)
+        )
+
+    def rows(self):
+        """
+        Iterate over the rows as OrderedDicts of column names to values.
+        """
+        if self._data is None:
+            return
+        columns = self.columns
+        for values in zip(*[column.values() for column in self._data]):
+            yield OrderedDict(zip(columns, values))
+
+    @property
+    def nbytes(self):
+        """
+        Bytes used by the columns' arrays and null masks, not counting
+        the distinct values of dictionary-encoded columns.
+        """
+        return sum(column.nbytes for column in self._data or [])
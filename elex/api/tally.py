@@ -0,0 +1,73 @@
+"""
+Count votes for reporting units in bulk.
+
+Once an election's races and reporting units are built, :func:`tally_races`
+sets every contested reporting unit's `votecount` to the sum of its
+candidates' votes, and each candidate's `votepct` to their share of it,
+in one pass over the whole election.
+
+Results are the same as :meth:`elex.api.models.ReportingUnit.set_votecount`
+and :meth:`elex.api.models.ReportingUnit.set_candidate_votepct`: integer
+sums and one double precision division per candidate, rounded to
+`PCT_PRECISION` only when serialized.
+"""
+
+
+def tally_races(races):
+    """
+    Tally the reporting units of every race with results.
+
+    :param races:
+        A list of :class:`elex.api.models.Race` objects.
+    """
+    units = []
+    for race in races:
+        if not race.initialization_data:
+            units.extend(race.reportingunits)
+    tally_units(units)
+
+
+def tally_units(units):
+    """
+    Set vote counts and candidate vote percentages for `units`.
+
+    Uncontested units get a `votecount` of None and their candidates'
+    percentages are left alone, as are those of units with no votes.
+    Units without candidates keep their `votecount`.
+
+    :param units:
+        A list of :class:`elex.api.models.ReportingUnit` objects.
+    """
+    for unit in units:
+        if unit.uncontested:
+            unit.votecount = None
+            continue
+
+        candidates = unit.candidates
+        if not candidates:
+            continue
+
+        total = 0
+        for c in candidates:
+            total += c.votecount
+        unit.votecount = total
+
+        if total:
+            total = float(total)
+            for c in candidates:
+                c.votepct = float(c.votecount) / total
+
+
+def reporting_pct(reporting, total):
+    """
+    Return the share of precincts reporting, or 0.0 if there are none.
+
+    :param reporting:
+        Precincts reporting.
+    :param total:
+        Total precincts.
+    """
+    try:
+        return float(reporting) / float(total)
+    except ZeroDivisionError:
+        return 0.0
@@ -0,0 +1,187 @@
+"""
+Stage timings for the fetch, decode, parse and render pipeline.
+
+Once :func:`enable` is called (``elex --timings`` does this), each stage
+records its number of calls, wall clock time, CPU time and the number of
+objects it produced:
+
+* ``fetch``: requests answered by the AP API, through
+  :func:`elex.api.utils.api_request`, including any wait for the rate
+  limiter. Requests answered from the HTTP cache, with or without a 304
+  revalidation, are counted as ``fetch (cached)``.
+* ``decode``: decoding JSON payloads.
+* ``races``: building :class:`elex.api.models.Race` objects (including
+  their reporting units and candidates) in
+  :meth:`elex.api.models.Election.get_race_objects`.
+* ``tally``: counting votes and rolling up New England counties for all
+  of those races at once, through :func:`elex.api.tally.tally_races`.
+* ``table``: building a :class:`elex.api.table.ResultsTable` in
+  :meth:`elex.api.models.Election.results_table`; the count is rows.
+* ``units``: splitting races into units in
+  :meth:`elex.api.models.Election.get_units`; the count is candidate
+  reporting units.
+* ``render``: writing rows in the CSV and JSON output handlers.
+
+CPU time is process-wide, so it includes other threads working at the
+same time. When timings are disabled, :func:`stage` costs one function
+call.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    cpu_clock = time.process_time
+except AttributeError:
+    cpu_clock = time.clock
+
+wall_clock = getattr(time, 'perf_counter', time.time)
+
+_timings = None
+
+
+class Timings(object):
+    """
+    Thread-safe totals for each pipeline stage, in the order stages were
+    first recorded.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stages = OrderedDict()
+
+    def add(self, name, wall, cpu, count=None):
+        """
+        Add one call of stage `name`.
+
+        :param wall:
+            Wall clock seconds.
+        :param cpu:
+            CPU seconds.
+        :param count:
+            Optional number of objects produced.
+        """
+        with self.lock:
+            totals = self.stages.setdefault(name, [0, 0.0, 0.0, None])
+            totals[0] += 1
+            totals[1] += wall
+            totals[2] += cpu
+            if count is not None:
+                totals[3] = (totals[3] or 0) + count
+
+    def serialize(self):
+        """
+        Return the totals as an OrderedDict of stage name to calls,
+        milliseconds of wall and CPU time, and count.
+        """
+        with self.lock:
+            return OrderedDict(
+                (name, OrderedDict((
+                    ('calls', calls),
+                    ('wall_ms', round(wall * 1000, 3)),
+                    ('cpu_ms', round(cpu * 1000, 3)),
+                    ('count', count),
+                )))
+                for name, (calls, wall, cpu, count) in self.stages.items()
+            )
+
+    def summary(self):
+        """
+        Return the totals as a plain text table.
+        """
+        lines = ['{0:<16}{1:>7}{2:>12}{3:>12}{4:>10}'.format(
+            'stage', 'calls', 'wall ms', 'cpu ms', 'count'
+        )]
+        for name, totals in self.serialize().items():
+            lines.append('{0:<16}{1:>7}{2:>12.1f}{3:>12.1f}{4:>10}'.format(
+                name,
+                totals['calls'],
+                totals['wall_ms'],
+                totals['cpu_ms'],
+                '' if totals['count'] is None else totals['count']
+            ))
+        return '\n'.join(lines)
+
+
+class Stage(object):
+    """
+    Context manager timing one call of a stage. Set `count` to the number
+    of objects produced, and `name` to re-label the call, before it exits.
+    """
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+        self.count = None
+
+    def __enter__(self):
+        self.wall = wall_clock()
+        self.cpu = cpu_clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timings.add(
+            self.name,
+            wall_clock() - self.wall,
+            cpu_clock() - self.cpu,
+            self.count
+        )
+
+
+class NullStage(object):
+    """
+    Stand-in for :class:`Stage` when timings are disabled.
+    """
+    name = None
+    count = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def __setattr__(self, name, value):
+        pass
+
+
+NULL_STAGE = NullStage()
+
+
+def stage(name):
+    """
+    Time a stage::
+
+        with timings.stage('races') as stage:
+            races = build_races()
+            stage.count = len(races)
+
+    :param name:
+        Stage name.
+    """
+    if _timings is None:
+        return NULL_STAGE
+    return Stage(_timings, name)
+
+
+def enable():
+    """
+    Start recording timings, discarding any recorded so far, and return
+    the new :class:`Timings`.
+    """
+    global _timings
+    _timings = Timings()
+    return _timings
+
+
+def disable():
+    """
+    Stop recording timings.
+    """
+    global _timings
+    _timings = None
+
+
+def get_timings():
+    """
+    Return the current :class:`Timings`, or None if timings are disabled.
+    """
+    return _timings
@@ -65,6 +65,16 @@ class BaseTrendReport(utils.UnicodeMixin):
         self.parties = []
         self.output_parties()
 
+    @classmethod
+    def fetch_async(cls, trend_file=None, testresults=False):
+        """
+        Build a report on the asynchronous request thread pool; returns an
+        awaitable. Accepts the same arguments as the constructor.
+        Requires Python 3.
+        """
+        from elex.api import aio
+        return aio.run(cls, trend_file=trend_file, testresults=testresults)
+
     def load_raw_data(self, office_code, trend_file=None):
         """
         Gets underlying data lists we need for parsing.
@@ -92,26 +102,33 @@ class BaseTrendReport(utils.UnicodeMixin):
         Given a report number and a key for indexing, returns a list
         of delegate counts by party. Makes a request from the AP
         using requests. Formats that request with env vars.
+
+        The report ID is resolved through the shared, cached reports
+        listing (see :func:`elex.api.utils.get_reports`).
         """
-        reports = utils.get_reports(params=params)
-        report_id = self.get_report_id(reports, key)
+        report_id = None
+        if key == self.office_code:
+            report_id = utils.get_report_id(
+                [self.api_report_id, self.api_test_report_id],
+                params=params
+            )
         if report_id:
             r = utils.api_request('/reports/{0}'.format(report_id))
             return r.json()['trendtable']
 
     def get_report_id(self, reports, key):
         """
-        Takes a delSuper or delSum as the argument and returns
+        Takes an office code as the argument and returns
         organization-specific report ID.
+
+        Kept for compatibility; see :func:`elex.api.utils.get_report_id`.
         """
-        for report in reports:
-            if (
-                key == self.office_code and
-                report.get('title') in [self.api_report_id, self.api_test_report_id]
-            ):
-                id = report.get('id').rsplit('/', 1)[-1]
-                return id
-        return None
+        if key != self.office_code:
+            return None
+        return utils.get_report_id(
+            [self.api_report_id, self.api_test_report_id],
+            reports=reports
+        )
 
     def output_parties(self):
         """
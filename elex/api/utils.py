@@ -3,22 +3,24 @@ Utility functions to record raw election results and handle low-level HTTP
 interaction with the Associated Press Election API.
 """
 from __future__ import print_function
+import codecs
 import os
 import sys
 import six
 import elex
+import json as stdlib_json
 import ujson as json
+import threading
 import time
-import datetime
-from elex import cache
 from elex.exceptions import APAPIKeyException
-from pymongo import MongoClient
 
 
 class UnicodeMixin(object):
     """
     Python 2 + 3 compatibility for __unicode__
     """
+    __slots__ = ()
+
     if sys.version_info > (3, 0):
         __str__ = lambda x: x.__unicode__()
     else:
@@ -33,39 +35,46 @@ def write_recording(payload):
     Record a timestamped version of an Associated Press Elections API
     data download.
 
-    Presumes JSON at the moment.
-    Would have to refactor if using XML or FTP.
-    FACTOR FOR USE; REFACTOR FOR REUSE.
+    The payload is written by a background thread; see
+    :mod:`elex.api.recording`.
 
     :param payload:
-        JSON payload from Associated Press Elections API.
-    """
-    recorder = os.environ.get('ELEX_RECORDING', False)
-    if recorder:
-        timestamp = int(time.mktime(datetime.datetime.now().timetuple()))
-        if recorder == u"mongodb":
-            MONGODB_CLIENT = MongoClient(
-                os.environ.get(
-                    'ELEX_RECORDING_MONGO_URL',
-                    'mongodb://localhost:27017/'
-                )
-            )
-            MONGODB_DATABASE = MONGODB_CLIENT[
-                os.environ.get(
-                    'ELEX_RECORDING_MONGO_DB',
-                    'ap_elections_loader'
-                )
-            ]
-            collection = MONGODB_DATABASE.elex_recording
-            collection.insert({"time": timestamp, "data": payload})
-        elif recorder == u"flat":
-            recorder_directory = os.environ.get('ELEX_RECORDING_DIR', '/tmp')
-            json_path = '%s/ap_elections_loader_recording-%s.json' % (
-                recorder_directory,
-                timestamp
-            )
-            with open(json_path, 'w') as writefile:
-                writefile.write(json.dumps(payload))
+        Raw response bytes from Associated Press Elections API. Other
+        values are encoded as JSON first.
+    """
+    if os.environ.get('ELEX_RECORDING', False):
+        if isinstance(payload, six.text_type):
+            payload = payload.encode('utf-8')
+        elif not isinstance(payload, six.binary_type):
+            payload = json.dumps(payload).encode('utf-8')
+
+        from elex.api.recording import get_recorder
+        get_recorder().record(payload)
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def prepare_request(path, **params):
+    """
+    Build the URL and sorted parameter list for an AP elections API
+    request, filling in the API key and format.
+
+    :param path:
+        API url path.
+    :param \**params:
+        Extra parameters to pass to `requests`.
+    """
+    params['apiKey'] = params.get('apiKey') or elex.API_KEY
+    if not params['apiKey']:
+        raise APAPIKeyException()
+
+    params['format'] = 'json'
+
+    params = sorted(params.items())  # Sort for consistent caching
+
+    url = '{0}{1}'.format(elex.BASE_URL, path.replace('//', '/'))
+    return url, params
 
 
 def api_request(path, **params):
@@ -84,28 +93,349 @@ def api_request(path, **params):
         `apiKey="<YOUR API KEY>`, your AP API key, or `national=True`,
         for national-only results.
     """
-    params['apiKey'] = params.get('apiKey') or elex.API_KEY
-    if not params['apiKey']:
-        raise APAPIKeyException()
+    url, params = prepare_request(path, **params)
+    response = send_request(path, url, params)
+    response.raise_for_status()
+    record_cache_stat(response)
 
-    params['format'] = 'json'
+    write_recording(response.content)
+    return response
 
-    params = sorted(params.items())  # Sort for consistent caching
 
-    url = '{0}{1}'.format(elex.BASE_URL, path.replace('//', '/'))
-    response = cache.get(url, params=params)
+def api_stream_request(path, **params):
+    """
+    Like :func:`api_request`, but leaves the response body unread so it
+    can be consumed incrementally with :func:`iter_response_chunks`.
+
+    :param \**params:
+        Extra parameters to pass to `requests`.
+    """
+    url, params = prepare_request(path, **params)
+    response = send_request(path, url, params, stream=True)
     response.raise_for_status()
+    record_cache_stat(response)
+    return response
+
+
+def send_request(path, url, params, **kwargs):
+    """
+    Send a prepared request through the caching session. If
+    `ELEX_API_QUOTA` is set, wait for the client-side rate limiter first,
+    and if the API still answers 403 (over quota), wait for the quota to
+    refill and try once more. See :mod:`elex.api.ratelimit`.
+
+    Timed as the ``fetch`` stage; see :mod:`elex.api.timings`.
 
-    write_recording(response.json())
+    :param path:
+        API url path, used to prioritize results over reports.
+    :param url:
+        Full request URL from :func:`prepare_request`.
+    :param params:
+        Request parameters from :func:`prepare_request`.
+    :param \**kwargs:
+        Extra arguments for `requests`, e.g. `stream=True`.
+    """
+    from elex.api import timings
+    from elex.api.ratelimit import get_limiter, request_priority
+
+    with timings.stage('fetch') as stage:
+        limiter = get_limiter()
+        if limiter is None:
+            response = elex.get_cache().get(url, params=params, **kwargs)
+        else:
+            priority = request_priority(path)
+            limiter.acquire(priority)
+            response = elex.get_cache().get(url, params=params, **kwargs)
+            if response.status_code == 403:
+                response.close()
+                limiter.drain()
+                limiter.acquire(priority)
+                response = elex.get_cache().get(url, params=params, **kwargs)
+
+        if getattr(response, 'from_cache', False):
+            stage.name = 'fetch (cached)'
     return response
 
 
+def record_cache_stat(response):
+    """
+    Count a response as a cache hit, a miss or a 304 revalidation in the
+    response cache's usage counters, when the backend keeps them.
+
+    :param response:
+        A response returned by the caching session.
+    """
+    cache = elex.get_cache().get_adapter(response.url).cache
+    if not hasattr(cache, 'incr_stat'):
+        return
+
+    if not getattr(response, 'from_cache', False):
+        cache.incr_stat('misses')
+    elif 'If-None-Match' in response.request.headers:
+        cache.incr_stat('not_modified')
+    else:
+        cache.incr_stat('hits')
+
+
+def iter_response_chunks(response, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield decoded text chunks from a streamed response. The body is only
+    kept in memory, and recorded once fully read, if recording is enabled.
+
+    :param response:
+        A response returned by :func:`api_stream_request`.
+    :param chunk_size:
+        Number of bytes to read at a time.
+    """
+    recording = []
+    record = os.environ.get('ELEX_RECORDING', False)
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if record:
+            recording.append(chunk)
+        yield decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+    if record:
+        write_recording(b''.join(recording))
+
+
+def stream_json_array(chunks, key, meta=None):
+    """
+    Incrementally parse a top-level JSON object from an iterable of text
+    chunks, yielding the items of its `key` array one at a time as they
+    become complete. Only one item is held in memory at once.
+
+    Other top-level values are decoded into the `meta` dict, if given.
+
+    :param chunks:
+        An iterable of text chunks, e.g. from a file or
+        :func:`iter_response_chunks`.
+    :param key:
+        The top-level key of the array to stream, e.g. `races`.
+    :param meta:
+        Optional dict to collect the other top-level values into.
+    """
+    return _JSONArrayStream(chunks, key, meta).items()
+
+
+class _JSONArrayStream(object):
+    """
+    Buffer and cursor for :func:`stream_json_array`.
+    """
+    decoder = stdlib_json.JSONDecoder()
+
+    def __init__(self, chunks, key, meta=None):
+        self.chunks = iter(chunks)
+        self.key = key
+        self.meta = meta if meta is not None else {}
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def read(self, size=1):
+        """
+        Append chunks to the buffer until it holds at least `size` more
+        characters. Returns False once the chunks are exhausted.
+        """
+        if self.eof:
+            return False
+        target = len(self.buffer) + size
+        for chunk in self.chunks:
+            self.buffer += chunk
+            if len(self.buffer) >= target:
+                return True
+        self.eof = True
+        return len(self.buffer) > target - size
+
+    def compact(self):
+        """
+        Drop the parsed part of the buffer.
+        """
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+
+    def peek(self):
+        """
+        Skip whitespace and return the next character without consuming it.
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read():
+                raise ValueError('Unexpected end of JSON input')
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError('Expected one of {0!r} at {1!r}'.format(chars, char))
+        self.pos += 1
+        return char
+
+    def value(self):
+        """
+        Decode the next complete JSON value, reading more input as needed.
+        A value ending exactly at the end of the buffer might be a
+        truncated number, so it is only accepted once the input is done.
+        Reads grow geometrically so large values are rescanned only a
+        logarithmic number of times.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                if not self.read(len(self.buffer) - self.pos):
+                    raise
+                continue
+            if end == len(self.buffer) and self.read():
+                continue
+            self.pos = end
+            return value
+
+    def items(self):
+        self.expect('{')
+        if self.peek() == '}':
+            return
+        while True:
+            name = self.value()
+            self.expect(':')
+            if name == self.key and self.peek() == '[':
+                self.pos += 1
+                if self.peek() == ']':
+                    self.pos += 1
+                else:
+                    while True:
+                        self.compact()
+                        yield self.value()
+                        if self.expect(',]') == ']':
+                            break
+            else:
+                self.meta[name] = self.value()
+            if self.expect(',}') == '}':
+                return
+
+
+REPORTS_CACHE_TTL = float(os.environ.get('ELEX_REPORTS_CACHE_TTL', 60))
+
+_reports_cache = {}
+# Guards `_reports_cache` and `_reports_fetch_locks`; never held during a
+# request.
+_reports_lock = threading.Lock()
+# One lock per set of params, held while that listing is fetched.
+_reports_fetch_locks = {}
+
+
 def get_reports(params={}):
     """
     Get data from `reports` endpoints.
+
+    The listing is cached process-wide for `ELEX_REPORTS_CACHE_TTL`
+    seconds (default 60; 0 disables caching) per set of params, so
+    delegate and trend reports share a single request.
     """
-    resp = api_request('/reports', **params)
-    if resp.ok:
-        return resp.json().get('reports')
+    return _get_reports_index(params)['reports']
+
+
+def get_report_id(titles, params={}, reports=None):
+    """
+    Resolve a report title to its organization-specific report ID using
+    the cached reports listing.
+
+    :param titles:
+        A report title, or a list of titles; the one listed first by the
+        API wins.
+    :param params:
+        Parameters for the `reports` request.
+    :param reports:
+        Optional reports listing, as returned by :func:`get_reports`, to
+        search instead of the cached one.
+    """
+    if isinstance(titles, six.string_types):
+        titles = [titles]
+    if reports is None:
+        index = _get_reports_index(params)['index']
     else:
-        return []
+        index = _index_reports(reports)
+    matches = [index[title] for title in titles if title in index]
+    if matches:
+        return min(matches)[1]
+    return None
+
+
+def clear_reports_cache():
+    """
+    Drop the cached reports listing.
+    """
+    with _reports_lock:
+        _reports_cache.clear()
+
+
+def _get_reports_index(params):
+    """
+    Return the cached reports listing for `params`, with a title index
+    of `(position, id)` tuples, refreshing it once it is older than
+    `REPORTS_CACHE_TTL`.
+
+    Listings for different params are fetched independently; concurrent
+    requests for the same params wait for a single fetch.
+    """
+    # The API treats `test=False` the same as no test flag, so it is not
+    # sent, and delegate reports (no params) and trend reports
+    # (`test=False`) share a listing.
+    params = dict(
+        (k, v) for k, v in params.items() if not (k == 'test' and not v)
+    )
+    key = tuple(sorted(params.items()))
+    with _reports_lock:
+        entry = _fresh_reports_entry(key)
+        if entry:
+            return entry
+        fetch_lock = _reports_fetch_locks.setdefault(key, threading.Lock())
+
+    with fetch_lock:
+        with _reports_lock:
+            entry = _fresh_reports_entry(key)
+            if entry:
+                return entry
+
+        resp = api_request('/reports', **params)
+        if resp.ok:
+            reports = resp.json().get('reports')
+        else:
+            reports = []
+
+        entry = {
+            'fetched': time.time(),
+            'reports': reports,
+            'index': _index_reports(reports),
+        }
+        with _reports_lock:
+            _reports_cache[key] = entry
+        return entry
+
+
+def _fresh_reports_entry(key):
+    """
+    Return the cached listing for `key` if it is newer than
+    `REPORTS_CACHE_TTL`. Called with `_reports_lock` held.
+    """
+    entry = _reports_cache.get(key)
+    if entry and time.time() - entry['fetched'] < REPORTS_CACHE_TTL:
+        return entry
+    return None
+
+
+def _index_reports(reports):
+    """
+    Map each title in a reports listing to the `(position, id)` of the
+    first report with that title.
+    """
+    index = {}
+    for position, report in enumerate(reports):
+        title = report.get('title')
+        if title not in index:
+            index[title] = (position, report.get('id').rsplit('/', 1)[-1])
+    return index
@@ -0,0 +1,548 @@
+"""
+Response cache backends for CacheControl, selected with the
+`ELEX_CACHE_BACKEND` environment variable:
+
+* ``file`` (default): CacheControl's `FileCache`, one file per URL.
+* ``sqlite``: a single SQLite database file in WAL mode.
+* ``memory``: an in-process LRU cache, useful for long-running pollers.
+
+Every backend can be bounded with `ELEX_CACHE_MAX_SIZE` (total bytes)
+and `ELEX_CACHE_MAX_AGE` (seconds since an entry was written). Bounds are
+enforced on write, evicting expired entries first and then the least
+recently used ones. Backends also count cache hits, misses and 304
+revalidations for ``elex cache-stats``.
+
+The file backend keeps a running total of its size and only scans the
+cache directory when a bound may have been crossed, and saves its
+counters in batches rather than on every request.
+"""
+import atexit
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from cachecontrol.cache import BaseCache
+from cachecontrol.caches import FileCache
+
+BACKENDS = ('file', 'sqlite', 'memory')
+SQLITE_FILENAME = 'elex-cache.sqlite3'
+STATS_FILENAME = 'elex-cache-stats.json'
+STAT_NAMES = ('hits', 'misses', 'not_modified')
+MEMORY_CACHE_MAX_ENTRIES = 256
+# Writes between full scans of a bounded file cache, which pick up entries
+# written or removed by other processes.
+FILE_CACHE_SCAN_INTERVAL = 100
+# Seconds between saves of a file cache's counters; they are also saved
+# on exit.
+FILE_CACHE_STATS_INTERVAL = 30
+
+
+class SQLiteCache(BaseCache):
+    """
+    Store cached responses in a single SQLite file, keyed by URL, with
+    each entry's size and last access time.
+    """
+    def __init__(self, path, max_size=None, max_age=None):
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self.path = path
+        self.max_size = max_size
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            path,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, '
+            'value BLOB NOT NULL, '
+            'size INTEGER NOT NULL, '
+            'created REAL NOT NULL, '
+            'accessed REAL NOT NULL)'
+        )
+        self.connection.execute(
+            'CREATE INDEX IF NOT EXISTS responses_accessed '
+            'ON responses (accessed)'
+        )
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS stats ('
+            'name TEXT PRIMARY KEY, '
+            'value INTEGER NOT NULL)'
+        )
+
+    def __str__(self):
+        return self.path
+
+    def get(self, key):
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT value FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                'UPDATE responses SET accessed = ? WHERE key = ?',
+                (time.time(), key)
+            )
+        return bytes(row[0])
+
+    def set(self, key, value, expires=None):
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, value, size, created, accessed) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, sqlite3.Binary(value), len(value), now, now)
+            )
+            self._evict(now)
+
+    def delete(self, key):
+        with self.lock:
+            self.connection.execute(
+                'DELETE FROM responses WHERE key = ?', (key,)
+            )
+
+    def clear(self):
+        """
+        Delete every entry and reset the counters; returns the number of
+        entries removed.
+        """
+        with self.lock:
+            cursor = self.connection.execute('DELETE FROM responses')
+            self.connection.execute('DELETE FROM stats')
+        return cursor.rowcount
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def incr_stat(self, name):
+        """
+        Increment one of the persistent usage counters.
+        """
+        with self.lock:
+            self.connection.execute(
+                'INSERT OR IGNORE INTO stats (name, value) VALUES (?, 0)',
+                (name,)
+            )
+            self.connection.execute(
+                'UPDATE stats SET value = value + 1 WHERE name = ?', (name,)
+            )
+
+    def stats(self):
+        """
+        Return entry count, total bytes, oldest entry time and counters.
+        """
+        with self.lock:
+            entries, size, oldest = self.connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(created) '
+                'FROM responses'
+            ).fetchone()
+            counters = dict(self.connection.execute(
+                'SELECT name, value FROM stats'
+            ).fetchall())
+        return _stats(entries, size, oldest, counters)
+
+    def _evict(self, now):
+        if self.max_age is not None:
+            self.connection.execute(
+                'DELETE FROM responses WHERE created < ?',
+                (now - self.max_age,)
+            )
+
+        if self.max_size is not None:
+            total = self.connection.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM responses'
+            ).fetchone()[0]
+            if total > self.max_size:
+                evict = []
+                rows = self.connection.execute(
+                    'SELECT key, size FROM responses ORDER BY accessed'
+                ).fetchall()
+                for key, size in rows:
+                    if total <= self.max_size:
+                        break
+                    evict.append((key,))
+                    total -= size
+                self.connection.executemany(
+                    'DELETE FROM responses WHERE key = ?', evict
+                )
+
+
+class MemoryCache(BaseCache):
+    """
+    Keep cached responses in process memory, evicting the least recently
+    used entry once `max_entries` is reached.
+    """
+    def __init__(self, max_entries=MEMORY_CACHE_MAX_ENTRIES, max_size=None,
+                 max_age=None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.data = OrderedDict()
+        self.size = 0
+        self.counters = {}
+
+    def __str__(self):
+        return 'memory'
+
+    def get(self, key):
+        with self.lock:
+            entry = self.data.pop(key, None)
+            if entry is None:
+                return None
+            self.data[key] = entry
+        return entry[0]
+
+    def set(self, key, value, expires=None):
+        now = time.time()
+        with self.lock:
+            self._pop(key)
+            self.data[key] = (value, now)
+            self.size += len(value)
+            self._evict(now)
+
+    def delete(self, key):
+        with self.lock:
+            self._pop(key)
+
+    def clear(self):
+        """
+        Delete every entry and reset the counters; returns the number of
+        entries removed.
+        """
+        with self.lock:
+            count = len(self.data)
+            self.data.clear()
+            self.size = 0
+            self.counters = {}
+        return count
+
+    def incr_stat(self, name):
+        """
+        Increment one of the usage counters.
+        """
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def stats(self):
+        """
+        Return entry count, total bytes, oldest entry time and counters.
+        """
+        with self.lock:
+            created = [entry[1] for entry in self.data.values()]
+            return _stats(
+                len(self.data),
+                self.size,
+                min(created) if created else None,
+                self.counters
+            )
+
+    def _pop(self, key):
+        entry = self.data.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0])
+
+    def _evict(self, now):
+        if self.max_age is not None:
+            for key, entry in list(self.data.items()):
+                if entry[1] < now - self.max_age:
+                    self._pop(key)
+
+        while self.data and (
+            len(self.data) > self.max_entries or
+            (self.max_size is not None and self.size > self.max_size)
+        ):
+            key, entry = self.data.popitem(last=False)
+            self.size -= len(entry[0])
+
+
+class BoundedFileCache(FileCache):
+    """
+    CacheControl's `FileCache` with size and age bounds and persistent
+    usage counters.
+
+    A file's modification time is when it was written; its access time is
+    set explicitly on every write and read, so least recently used eviction
+    does not depend on how the filesystem is mounted.
+
+    The cache directory is scanned on the first write, then only when the
+    running total of bytes written goes over `max_size`, when the oldest
+    entry seen may have gone past `max_age`, or every
+    `FILE_CACHE_SCAN_INTERVAL` writes. Counters are added up in memory and
+    saved every `FILE_CACHE_STATS_INTERVAL` seconds and on exit.
+    """
+    def __init__(self, directory, max_size=None, max_age=None, **kwargs):
+        super(BoundedFileCache, self).__init__(directory, **kwargs)
+        self.max_size = max_size
+        self.max_age = max_age
+        self.stats_path = os.path.join(directory, STATS_FILENAME)
+        self.lock = threading.Lock()
+        self.size = None
+        self.oldest = None
+        self.writes = 0
+        self.counters = {}
+        self.counters_saved = time.time()
+        self.save_registered = False
+
+    def __str__(self):
+        return self.directory
+
+    def get(self, key):
+        value = super(BoundedFileCache, self).get(key)
+        if value is not None:
+            name = self._fn(key)
+            try:
+                os.utime(name, (time.time(), os.path.getmtime(name)))
+            except OSError:
+                pass
+        return value
+
+    def set(self, key, value, expires=None):
+        if self.max_size is None and self.max_age is None:
+            self._set(key, value)
+            return
+
+        # Writes are counted under the lock, so a scan can't run between
+        # writing a file and adding it to the running total.
+        with self.lock:
+            name = self._fn(key)
+            replaced = self._getsize(name)
+            now = self._set(key, value)
+            self.writes += 1
+            if self.size is not None:
+                self.size += len(value) - replaced
+            if (
+                self.size is None or
+                self.writes >= FILE_CACHE_SCAN_INTERVAL or
+                (self.max_size is not None and self.size > self.max_size) or
+                (self.max_age is not None and self.oldest < now - self.max_age)
+            ):
+                self._evict(now)
+
+    def _set(self, key, value):
+        """
+        Write an entry and mark it as just used; returns the time written.
+        """
+        super(BoundedFileCache, self).set(key, value)
+        now = time.time()
+        try:
+            os.utime(self._fn(key), (now, now))
+        except OSError:
+            pass
+        return now
+
+    def delete(self, key):
+        name = self._fn(key)
+        size = self._getsize(name)
+        super(BoundedFileCache, self).delete(key)
+        with self.lock:
+            if self.size is not None and not os.path.exists(name):
+                self.size -= size
+
+    def incr_stat(self, name):
+        """
+        Increment one of the usage counters kept alongside the cache files.
+        Counts are saved every `FILE_CACHE_STATS_INTERVAL` seconds and on
+        exit.
+        """
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+            if not self.save_registered:
+                atexit.register(self.save_counters)
+                self.save_registered = True
+            due = time.time() - self.counters_saved >= FILE_CACHE_STATS_INTERVAL
+        if due:
+            self.save_counters()
+
+    def save_counters(self):
+        """
+        Add the counts made since the last save to the counters file.
+        """
+        with self.lock:
+            counts, self.counters = self.counters, {}
+            self.counters_saved = time.time()
+        if not counts:
+            return
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, self.dirmode)
+        with self.lock_class(self.stats_path):
+            counters = self._read_counters()
+            for name, count in counts.items():
+                counters[name] = counters.get(name, 0) + count
+            with open(self.stats_path, 'w') as writefile:
+                json.dump(counters, writefile)
+
+    def stats(self):
+        """
+        Return entry count, total bytes, oldest entry time and counters.
+        """
+        self.save_counters()
+        entries = list(self._entries())
+        return _stats(
+            len(entries),
+            sum(entry[1] for entry in entries),
+            min(entry[2] for entry in entries) if entries else None,
+            self._read_counters()
+        )
+
+    def _read_counters(self):
+        try:
+            with open(self.stats_path) as readfile:
+                return json.load(readfile)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _entries(self):
+        """
+        Yield `(path, size, written, accessed)` for every cache file.
+        """
+        for root, dirs, files in os.walk(self.directory):
+            for name in files:
+                if name == STATS_FILENAME or name.endswith('.lock'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime, stat.st_atime
+
+    def _evict(self, now):
+        """
+        Scan the cache directory, remove entries past the bounds and reset
+        the running total. Called with `lock` held.
+        """
+        entries = []
+        total = 0
+        for path, size, written, accessed in self._entries():
+            if self.max_age is not None and written < now - self.max_age:
+                self._remove(path)
+            else:
+                entries.append((accessed, path, size, written))
+                total += size
+
+        if self.max_size is not None and total > self.max_size:
+            entries.sort()
+            evicted = 0
+            for accessed, path, size, written in entries:
+                if total <= self.max_size:
+                    break
+                self._remove(path)
+                total -= size
+                evicted += 1
+            entries = entries[evicted:]
+
+        self.size = total
+        self.oldest = min(entry[3] for entry in entries) if entries else now
+        self.writes = 0
+
+    @staticmethod
+    def _getsize(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class CacheStats(object):
+    """
+    Usage summary of a response cache backend, rendered by
+    ``elex cache-stats``.
+    """
+    def __init__(self, backend, cache):
+        """
+        :param backend:
+            The backend name, e.g. ``file``.
+        :param cache:
+            A cache built by :func:`get_cache_backend`.
+        """
+        self.backend = backend
+        self.location = str(cache)
+        self.stats = cache.stats()
+
+    def serialize(self):
+        """
+        Return the usage summary as an OrderedDict, one row of
+        ``elex cache-stats`` output.
+        """
+        oldest = self.stats['oldest']
+        if oldest is not None:
+            oldest = datetime.datetime.utcfromtimestamp(
+                int(oldest)
+            ).isoformat() + 'Z'
+        return OrderedDict((
+            ('backend', self.backend),
+            ('location', self.location),
+            ('entries', self.stats['entries']),
+            ('bytes', self.stats['bytes']),
+            ('hits', self.stats['hits']),
+            ('misses', self.stats['misses']),
+            ('not_modified', self.stats['not_modified']),
+            ('oldest_entry', oldest),
+        ))
+
+
+def _stats(entries, size, oldest, counters):
+    stats = OrderedDict((
+        ('entries', entries),
+        ('bytes', size),
+        ('oldest', oldest),
+    ))
+    for name in STAT_NAMES:
+        stats[name] = counters.get(name, 0)
+    return stats
+
+
+def get_cache_backend(backend, directory, max_size=None, max_age=None,
+                      max_entries=None):
+    """
+    Build the CacheControl cache backend named by `backend`.
+
+    :param backend:
+        One of ``file``, ``sqlite`` or ``memory``.
+    :param directory:
+        The elex cache directory.
+    :param max_size:
+        Optional maximum total size of cached responses, in bytes.
+    :param max_age:
+        Optional maximum age of a cached response, in seconds.
+    :param max_entries:
+        Optional maximum number of entries in the ``memory`` backend;
+        defaults to `MEMORY_CACHE_MAX_ENTRIES`.
+    """
+    if backend == 'sqlite':
+        return SQLiteCache(
+            os.path.join(directory, SQLITE_FILENAME),
+            max_size=max_size,
+            max_age=max_age
+        )
+    elif backend == 'memory':
+        return MemoryCache(
+            max_entries=max_entries or MEMORY_CACHE_MAX_ENTRIES,
+            max_size=max_size,
+            max_age=max_age
+        )
+    elif backend == 'file':
+        return BoundedFileCache(directory, max_size=max_size, max_age=max_age)
+    raise ValueError('Unknown cache backend {0!r}; expected one of {1}'.format(
+        backend, ', '.join(BACKENDS)
+    ))
@@ -1,10 +1,16 @@
+import os
+import time
 from cement.core.controller import CementBaseController, expose
 from cement.core.foundation import CementApp
 from cement.ext.ext_logging import LoggingLogHandler
-from elex.api import Elections, DelegateReport, USGovernorTrendReport, USHouseTrendReport, USSenateTrendReport
 from elex.cli.constants import BANNER, LOG_FORMAT
 from elex.cli.decorators import require_date_argument, require_ap_api_key
-from elex.cli.hooks import add_election_hook, cachecontrol_logging_hook
+from elex.cli.hooks import (
+    add_election_hook,
+    cachecontrol_logging_hook,
+    print_timings_hook,
+    timings_hook
+)
 from shutil import rmtree
 
 
@@ -70,6 +76,16 @@ when using `elex [gov/house/senate]-trends`'
                 help='Specify raceids to parse.',
                 default=[]
             )),
+            (['--states'], dict(
+                action='store',
+                help='Specify state postal codes to parse.',
+                default=None
+            )),
+            (['--levels'], dict(
+                action='store',
+                help='Specify reporting unit levels to parse.',
+                default=None
+            )),
             (['--set-zero-counts'], dict(
                 action='store_true',
                 help='Override results with zeros; omits the winner indicator.\
@@ -95,6 +111,60 @@ Sets the vote, delegate, and reporting precinct counts to zero.',
                 action='store',
                 help='Specify a value for a `batchname` column to append to each row.',
             )),
+            (['--bundle-dir'], dict(
+                action='store',
+                help='Directory to write files to when using `elex bundle`.',
+                default='.'
+            )),
+            (['--recording-dir'], dict(
+                action='store',
+                help='Directory of flat file recordings to read when using \
+`elex replay`. Defaults to ELEX_RECORDING_DIR.',
+                default=None
+            )),
+            (['--replay-speed'], dict(
+                action='store',
+                type=float,
+                help='Playback speed for `elex replay`: 1 is real time, 10 is \
+ten times faster, 0 is as fast as possible.',
+                default=1.0
+            )),
+            (['--data-dir'], dict(
+                action='store',
+                help='Directory of fixtures to serve when using `elex serve`. \
+Defaults to the repository\'s tests/data.',
+                default=None
+            )),
+            (['--port'], dict(
+                action='store',
+                type=int,
+                help='Port to listen on when using `elex serve`.',
+                default=8000
+            )),
+            (['--quota'], dict(
+                action='store',
+                type=int,
+                help='Requests allowed per minute when using `elex serve`; \
+unlimited by default.',
+                default=None
+            )),
+            (['--latency'], dict(
+                action='store',
+                type=float,
+                help='Seconds to delay each response when using `elex serve`.',
+                default=0
+            )),
+            (['--timings'], dict(
+                action='store_true',
+                help='Print wall and CPU time and object counts for each \
+stage (fetch, decode, races, units, render) to stderr when done.',
+                default=False
+            )),
+            (['--timings-json'], dict(
+                action='store_true',
+                help='Like `--timings`, but print the timings as JSON.',
+                default=False
+            )),
         ]
 
     @expose(hide=True)
@@ -308,6 +378,213 @@ Sets the vote, delegate, and reporting precinct counts to zero.',
         self._process_cache()
         self.app.render(data)
 
+    @expose(help="Get races, reporting units, results, candidates and \
+ballot measures from a single request, one file each")
+    @require_ap_api_key
+    @require_date_argument
+    def bundle(self):
+        """
+        ``elex bundle <electiondate>``
+
+        Fetches the results payload once and writes races, reporting units,
+        results, candidates and ballot measures to their own files in the
+        ``--bundle-dir`` directory (default: the current directory).
+
+        Command:
+
+        .. code:: bash
+
+            elex bundle 2016-03-01 --bundle-dir /tmp/elex-bundle
+
+        Will write:
+
+        .. code:: bash
+
+            /tmp/elex-bundle/races.csv
+            /tmp/elex-bundle/reporting_units.csv
+            /tmp/elex-bundle/results.csv
+            /tmp/elex-bundle/candidates.csv
+            /tmp/elex-bundle/ballot_measures.csv
+
+        Use ``-o json`` to write ``.json`` files instead.
+        """
+        bundle = self.app.election.bundle
+        self.app.log.info('Getting bundle for election {0}'.format(
+            self.app.election.electiondate
+        ))
+        self._process_cache()
+
+        bundle_dir = self.app.pargs.bundle_dir
+        if not os.path.isdir(bundle_dir):
+            os.makedirs(bundle_dir)
+
+        extension = self.app.output._meta.label
+        for name, data in bundle.items():
+            path = os.path.join(bundle_dir, '{0}.{1}'.format(name, extension))
+            self.app.log.info('Writing {0} {1} to {2}'.format(
+                len(data),
+                name.replace('_', ' '),
+                path
+            ))
+            with open(path, 'w') as writefile:
+                self.app.output.render(data, out=writefile)
+
+    @expose(help="Replay a directory of recordings through the results \
+parser and output")
+    def replay(self):
+        """
+        ``elex replay``
+
+        Parses and renders results from every flat file recording in a
+        directory (see :doc:`recording`), in the order they were recorded.
+        Recordings without races, such as election or report listings, are
+        skipped.
+
+        Command:
+
+        .. code:: bash
+
+            elex replay --recording-dir /tmp/recordings --replay-speed 10
+
+        By default, recordings are replayed in real time, waiting between
+        them as long as elex did between requests when recording. Use
+        ``--replay-speed`` to go faster, or ``--replay-speed 0`` to go as
+        fast as possible. Decode, parse and render times for each
+        recording, and a summary at the end, are logged. Decode time covers
+        reading and decompressing the recording and decoding its JSON.
+        """
+        from elex.api.recording import iter_recordings, read_recording
+
+        directory = self.app.pargs.recording_dir or os.environ.get(
+            'ELEX_RECORDING_DIR', '/tmp'
+        )
+        speed = self.app.pargs.replay_speed
+        election = self.app.election
+
+        self.app.log.info('Replaying recordings from {0}'.format(directory))
+        timings = []
+        start = None
+        for timestamp, path in iter_recordings(directory):
+            decode_start = time.time()
+            payload = read_recording(path)
+            decode_end = time.time()
+            if not isinstance(payload, dict) or 'races' not in payload:
+                self.app.log.debug('Skipping {0} (no races)'.format(path))
+                continue
+
+            if start is None:
+                start = (timestamp, time.time())
+            elif speed > 0:
+                delay = (timestamp - start[0]) / speed - (time.time() - start[1])
+                if delay > 0:
+                    time.sleep(delay)
+
+            parse_start = time.time()
+            election.electiondate = payload.get('electionDate')
+            race_objs = election.get_race_objects(payload)
+            races, reporting_units, results = election.get_units(race_objs)
+            render_start = time.time()
+            self.app.render(results)
+            render_end = time.time()
+
+            timings.append((
+                decode_end - decode_start,
+                render_start - parse_start,
+                render_end - render_start
+            ))
+            self.app.log.info(
+                'Replayed {0}: {1} results, decode {2:.1f} ms, parse {3:.1f} ms, '
+                'render {4:.1f} ms'.format(
+                    os.path.basename(path),
+                    len(results),
+                    timings[-1][0] * 1000,
+                    timings[-1][1] * 1000,
+                    timings[-1][2] * 1000
+                )
+            )
+
+        if not timings:
+            self.app.log.error('No recordings found in {0}'.format(directory))
+            self.app.close(1)
+            return
+
+        decode = [t[0] for t in timings]
+        parse = [t[1] for t in timings]
+        render = [t[2] for t in timings]
+        self.app.log.info(
+            'Replayed {0} recordings in {1:.2f} s; decode mean {2:.1f} ms, '
+            'max {3:.1f} ms; parse mean {4:.1f} ms, max {5:.1f} ms; '
+            'render mean {6:.1f} ms, max {7:.1f} ms'.format(
+                len(timings),
+                time.time() - start[1],
+                sum(decode) / len(decode) * 1000,
+                max(decode) * 1000,
+                sum(parse) / len(parse) * 1000,
+                max(parse) * 1000,
+                sum(render) / len(render) * 1000,
+                max(render) * 1000
+            )
+        )
+
+    @expose(help="Run a local stand-in for the AP Elections API")
+    def serve(self):
+        """
+        ``elex serve``
+
+        Serves the AP Elections API endpoints elex uses from the test
+        fixtures, or election results from ``--recording-dir``, with ETags,
+        304 responses and an optional per-minute quota and latency. Use it
+        to test and benchmark without an API key or network access.
+
+        Command:
+
+        .. code:: bash
+
+            elex serve --port 8000 --quota 10 --latency 0.2
+
+        Fixtures are read from the repository's ``tests/data``, so run it
+        from a checkout, or point ``--data-dir`` at a copy of them.
+
+        Then, in another shell:
+
+        .. code:: bash
+
+            export AP_API_BASE_URL=http://127.0.0.1:8000/v2
+            export AP_API_KEY=stand-in
+            elex results 2016-03-01
+        """
+        from elex.server import DEFAULT_DATA_DIRECTORY, StandInServer
+
+        data_dir = self.app.pargs.data_dir
+        recording_dir = self.app.pargs.recording_dir
+        if data_dir is None:
+            data_dir = DEFAULT_DATA_DIRECTORY
+            if recording_dir and not os.path.isdir(data_dir):
+                # Installed packages don't include the fixtures.
+                data_dir = None
+
+        try:
+            server = StandInServer(
+                address=('127.0.0.1', self.app.pargs.port),
+                data_dir=data_dir,
+                recording_dir=recording_dir,
+                quota=self.app.pargs.quota,
+                latency=self.app.pargs.latency
+            )
+        except IOError as e:
+            self.app.log.error(str(e))
+            self.app.close(1)
+            return
+        self.app.log.info('Serving AP Elections API stand-in at {0}'.format(
+            server.base_url
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
     @expose(help="Get list of available elections")
     @require_ap_api_key
     def elections(self):
@@ -330,6 +607,8 @@ Sets the vote, delegate, and reporting precinct counts to zero.',
             2016-02-16,2016-02-16,True,False
             ...
         """
+        from elex.api import Elections
+
         self.app.log.info('Getting election list')
         elections = Elections().get_elections(
             datafile=self.app.pargs.data_file
@@ -359,6 +638,8 @@ Sets the vote, delegate, and reporting precinct counts to zero.',
             state,2472,0,Bush,OR,1239,1237,GOP,0,OR-1239,0,0,0
 
         """
+        from elex.api import DelegateReport
+
         self.app.log.info('Getting delegate reports')
         if (
             self.app.pargs.delegate_super_file and
@@ -394,6 +675,8 @@ Sets the vote, delegate, and reporting precinct counts to zero.',
             party,office,won,leading,holdovers,winning_trend,current,insufficient_vote,net_winners,net_leaders
             Dem,Governor,7,7,12,19,20,0,-1,0
         """
+        from elex.api import USGovernorTrendReport
+
         self.app.log.info('Getting governor trend report')
         report = USGovernorTrendReport(self.app.pargs.trend_file)
         self.app.render(report.parties)
@@ -419,6 +702,8 @@ Sets the vote, delegate, and reporting precinct counts to zero.',
             party,office,won,leading,holdovers,winning_trend,current,insufficient_vote,net_winners,net_leaders
             Dem,U.S. House,201,201,0,201,193,0,+8,0
         """
+        from elex.api import USHouseTrendReport
+
         self.app.log.info('Getting US House trend report')
         report = USHouseTrendReport(self.app.pargs.trend_file)
         self.app.render(report.parties)
@@ -444,6 +729,8 @@ Sets the vote, delegate, and reporting precinct counts to zero.',
             party,office,won,leading,holdovers,winning_trend,current,insufficient_vote,net_winners,net_leaders
             Dem,U.S. Senate,23,23,30,53,51,0,+2,0
         """
+        from elex.api import USSenateTrendReport
+
         self.app.log.info('Getting US Senate trend report')
         report = USSenateTrendReport(self.app.pargs.trend_file)
         self.app.render(report.parties)
@@ -479,6 +766,8 @@ relative to that date, otherwise will use today's date)")
 
         This will find the first election after April 15, 2016.
         """
+        from elex.api import Elections
+
         self.app.log.info('Getting next election')
         if len(self.app.pargs.date):
             electiondate = self.app.pargs.date[0]
@@ -510,8 +799,18 @@ relative to that date, otherwise will use today's date)")
 
         If no cache entries exist, elex will close with exit code 65.
         """
-        from elex import cache
-        adapter = cache.get_adapter('http://')
+        from elex import get_cache
+        adapter = get_cache().get_adapter('http://')
+
+        if hasattr(adapter.cache, 'clear'):
+            self.app.log.info('Clearing cache ({0})'.format(adapter.cache))
+            if adapter.cache.clear():
+                self.app.log.info('Cache cleared.')
+            else:
+                self.app.log.info('No cache entries found.')
+                self.app.exit_code = 65
+            return
+
         self.app.log.info('Clearing cache ({0})'.format(adapter.cache.directory))
         try:
             rmtree(adapter.cache.directory)
@@ -521,6 +820,37 @@ relative to that date, otherwise will use today's date)")
         else:
             self.app.log.info('Cache cleared.')
 
+    @expose(help="Show response cache size and hit/miss counts")
+    def cache_stats(self):
+        """
+        ``elex cache-stats``
+
+        Returns the number of cached responses, their total size in bytes,
+        the cache hit, miss and 304 (not modified) counts since the cache
+        was last cleared, and when the oldest entry was written.
+
+        Command:
+
+        .. code:: bash
+
+            elex cache-stats
+
+        Example output:
+
+        .. csv-table::
+
+            backend,location,entries,bytes,hits,misses,not_modified,oldest_entry
+            file,/tmp/elex-cache,12,48213377,3,12,41,2016-11-08T23:01:12Z
+
+        The counters only include requests served by elex, so they are not
+        available for the ``memory`` backend across separate commands.
+        """
+        from elex import CACHE_BACKEND, get_cache
+        from elex.cachecontrol_caches import CacheStats
+
+        adapter = get_cache().get_adapter('http://')
+        self.app.render(CacheStats(CACHE_BACKEND, adapter.cache))
+
     def _process_cache(self):
         """
         Handles logging and exit code for cached responses.
@@ -543,7 +873,9 @@ class ElexApp(CementApp):
         exit_on_close = True
         hooks = [
             ('post_setup', cachecontrol_logging_hook),
+            ('post_argument_parsing', timings_hook),
             ('post_argument_parsing', add_election_hook),
+            ('pre_close', print_timings_hook),
         ]
         extensions = [
             'elex.cli.ext_csv',
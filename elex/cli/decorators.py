@@ -1,8 +1,8 @@
+import sys
 from elex import CACHE_DIRECTORY
 from elex.cli.utils import parse_date
 from elex.exceptions import APAPIKeyException
 from functools import wraps
-from requests.exceptions import ConnectionError, HTTPError
 from xml.dom.minidom import parseString
 
 
@@ -45,25 +45,33 @@ def require_ap_api_key(fn):
         self.app.log.debug('Cache directory: {0}'.format(CACHE_DIRECTORY))
         try:
             return fn(self)
-        except HTTPError as e:
-            if e.response.status_code == 400:
-                message = e.response.json().get('errorMessage')
-            elif e.response.status_code == 401:
-                dom = parseString(e.response.content)
-                error_msg = dom.getElementsByTagName('Message')[0].childNodes[0].data
-                message = '{0} ({1})'.format(e.response.reason, error_msg)
-            else:
-                message = e.response.reason
-            self.app.log.error('HTTP Error {0} - {1}'.format(e.response.status_code, message))
-            self.app.log.debug('HTTP Error {0} ({1})'.format(e.response.status_code, e.response.url))
-            self.app.close(1)
         except APAPIKeyException as e:
             text = 'APAPIKeyError: AP_API_KEY environment variable is not set.'
             self.app.log.error(text)
             self.app.close(1)
-        except ConnectionError as e:
-            real_exception = e.args[0]
-            self.app.log.error('Connection error ({0})'.format(real_exception.reason))
-            self.app.log.debug('Connection error accessing {0}'.format(e.request.url))
+        except Exception as e:
+            # If requests was never imported, no request was made and this
+            # can't be an HTTP error; don't import requests just to check.
+            requests_exceptions = sys.modules.get('requests.exceptions')
+            if requests_exceptions is None:
+                raise
+            if isinstance(e, requests_exceptions.HTTPError):
+                if e.response.status_code == 400:
+                    message = e.response.json().get('errorMessage')
+                elif e.response.status_code == 401:
+                    dom = parseString(e.response.content)
+                    error_msg = dom.getElementsByTagName('Message')[0].childNodes[0].data
+                    message = '{0} ({1})'.format(e.response.reason, error_msg)
+                else:
+                    message = e.response.reason
+                self.app.log.error('HTTP Error {0} - {1}'.format(e.response.status_code, message))
+                self.app.log.debug('HTTP Error {0} ({1})'.format(e.response.status_code, e.response.url))
+                self.app.close(1)
+            elif isinstance(e, requests_exceptions.ConnectionError):
+                real_exception = e.args[0]
+                self.app.log.error('Connection error ({0})'.format(real_exception.reason))
+                self.app.log.debug('Connection error accessing {0}'.format(e.request.url))
+            else:
+                raise
 
     return decorated
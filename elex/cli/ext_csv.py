@@ -1,7 +1,8 @@
 import csv
 import sys
-import time
 from cement.core import handler, output
+from elex.api import timings
+from elex.cli.utils import get_rows
 
 
 class CSVOutputHandler(output.CementOutputHandler):
@@ -12,40 +13,45 @@ class CSVOutputHandler(output.CementOutputHandler):
         label = 'csv'
         overridable = True
 
-    def render(self, data, template=None):
+    def render(self, data, template=None, out=None, **kw):
+        if out is None:
+            out = sys.stdout
+
         if not isinstance(data, (list, tuple)):
             data = [data]
 
         if len(data) == 0:
             return
 
-        if self.app.pargs.with_timestamp:
-            now = time.time()
-
-        try:
-            # Properly terminate lines for Windows and Excel.
-            # See: https://github.com/newsdev/elex/issues/232
-            writer = csv.writer(sys.stdout, lineterminator='\n')
-            for i, obj in enumerate(data):
-                row = obj.serialize()
-                if self.app.pargs.with_timestamp:
-                    row['timestamp'] = str(int(now))
-                if self.app.pargs.batch_name:
-                    row['batchname'] = self.app.pargs.batch_name
-                if i == 0:
-                    writer.writerow(row.keys())
-                writer.writerow(row.values())
-        except IOError:
-            # Handle pipes that could close before output is done.
-            # See: http://stackoverflow.com/questions/15793886/
-            try:
-                sys.stdout.close()
-            except IOError:
-                pass
+        with timings.stage('render') as stage:
+            stage.count = len(data)
+            columns, rows = get_rows(
+                data,
+                with_timestamp=self.app.pargs.with_timestamp,
+                batch_name=self.app.pargs.batch_name
+            )
+
             try:
-                sys.stderr.close()
+                # Properly terminate lines for Windows and Excel.
+                # See: https://github.com/newsdev/elex/issues/232
+                writer = csv.writer(out, lineterminator='\n')
+                writer.writerow(columns)
+                writer.writerows(rows)
             except IOError:
-                pass
+                # Files, e.g. those written by `elex bundle`, must not
+                # fail silently.
+                if out is not sys.stdout:
+                    raise
+                # Handle pipes that could close before output is done.
+                # See: http://stackoverflow.com/questions/15793886/
+                try:
+                    out.close()
+                except IOError:
+                    pass
+                try:
+                    sys.stderr.close()
+                except IOError:
+                    pass
 
 
 def load(app):
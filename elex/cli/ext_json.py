@@ -1,8 +1,9 @@
 import json
 import sys
-import time
-from bson import json_util
+from collections import OrderedDict
 from cement.core import handler, output
+from elex.api import timings
+from elex.cli.utils import get_rows
 
 
 class ElexJSONOutputHandler(output.CementOutputHandler):
@@ -13,48 +14,54 @@ class ElexJSONOutputHandler(output.CementOutputHandler):
         label = 'json'
         overridable = True
 
-    def render(self, data, template=None):
+    def render(self, data, template=None, out=None, **kw):
+        if out is None:
+            out = sys.stdout
+
         if not isinstance(data, (list, tuple)):
             data = [data]
 
         if len(data) == 0:
             return
 
-        try:
-            kwargs = {}
-            if self.app.pargs.format_json:
-                kwargs['sort_keys'] = True
-                kwargs['indent'] = 4
-
-            if self.app.pargs.with_timestamp:
-                now = time.time()
-
-            json_data = []
-            for obj in data:
-                row = obj.serialize()
-                if self.app.pargs.with_timestamp:
-                    row['timestamp'] = str(int(now))
-                if self.app.pargs.batch_name:
-                    row['batchname'] = self.app.pargs.batch_name
-                json_data.append(row)
-
-            json.dump(
-                json_data,
-                sys.stdout,
-                default=json_util.default,
-                **kwargs
-            )
-        except IOError:
-            # Handle pipes that could close before output is done.
-            # See http://stackoverflow.com/questions/15793886/
-            try:
-                sys.stdout.close()
-            except IOError:
-                pass
+        with timings.stage('render') as stage:
+            stage.count = len(data)
             try:
-                sys.stderr.close()
+                from bson import json_util
+
+                kwargs = {}
+                if self.app.pargs.format_json:
+                    kwargs['sort_keys'] = True
+                    kwargs['indent'] = 4
+
+                columns, rows = get_rows(
+                    data,
+                    with_timestamp=self.app.pargs.with_timestamp,
+                    batch_name=self.app.pargs.batch_name
+                )
+                json_data = [OrderedDict(zip(columns, row)) for row in rows]
+
+                json.dump(
+                    json_data,
+                    out,
+                    default=json_util.default,
+                    **kwargs
+                )
             except IOError:
-                pass
+                # Files, e.g. those written by `elex bundle`, must not
+                # fail silently.
+                if out is not sys.stdout:
+                    raise
+                # Handle pipes that could close before output is done.
+                # See http://stackoverflow.com/questions/15793886/
+                try:
+                    out.close()
+                except IOError:
+                    pass
+                try:
+                    sys.stderr.close()
+                except IOError:
+                    pass
 
 
 def load(app):
@@ -1,5 +1,8 @@
+import json
 import logging
+import sys
 from elex.api import Election
+from elex.api import timings
 from elex.cli.constants import LOG_FORMAT
 from elex.api import maps
 
@@ -15,7 +18,9 @@ def add_election_hook(app):
         setzerocounts=app.pargs.set_zero_counts,
         is_test=False,
         raceids=[],
-        officeids=None
+        officeids=None,
+        statepostals=None,
+        levels=None
     )
 
     if app.pargs.data_file:
@@ -30,6 +35,19 @@ def add_election_hook(app):
     if app.pargs.raceids:
         app.election.raceids = [x.strip() for x in app.pargs.raceids.split(',')]
 
+    if app.pargs.states:
+        statepostals = [x.strip().upper() for x in app.pargs.states.split(',')]
+        invalid_statepostals = [x for x in statepostals if x not in maps.STATE_ABBR]
+        if invalid_statepostals:
+            text = '{0} is/are invalid state postal code(s).'
+            app.log.error(text.format(", ".join(invalid_statepostals)))
+            app.close(1)
+        else:
+            app.election.statepostals = statepostals
+
+    if app.pargs.levels:
+        app.election.levels = [x.strip() for x in app.pargs.levels.split(',')]
+
     if app.pargs.officeids:
         invalid_officeids = [x for x in app.pargs.officeids.split(',') if x not in maps.OFFICE_NAMES]
         if invalid_officeids:
@@ -45,7 +63,9 @@ def cachecontrol_logging_hook(app):
     """
     Reroute cachecontrol logger to use cement log handlers.
     """
-    from cachecontrol.controller import logger
+    # Look the logger up by name so cachecontrol (and requests) are only
+    # imported when a request is actually made.
+    logger = logging.getLogger('cachecontrol.controller')
     formatter = logging.Formatter(LOG_FORMAT)
 
     for handler in app.log.backend.handlers:
@@ -53,3 +73,29 @@ def cachecontrol_logging_hook(app):
         logger.addHandler(handler)
 
     logger.setLevel(logging.DEBUG)
+
+
+def timings_hook(app):
+    """
+    Start recording stage timings if `--timings` or `--timings-json` was
+    passed.
+    """
+    if app.pargs.timings or app.pargs.timings_json:
+        timings.enable()
+
+
+def print_timings_hook(app):
+    """
+    Print the recorded stage timings to stderr.
+    """
+    recorded = timings.get_timings()
+    pargs = getattr(app, 'pargs', None)
+    if recorded is None or pargs is None:
+        return
+
+    if pargs.timings_json:
+        json.dump(recorded.serialize(), sys.stderr)
+        sys.stderr.write('\n')
+    else:
+        sys.stderr.write(recorded.summary() + '\n')
+    timings.disable()
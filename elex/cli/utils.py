@@ -1,9 +1,46 @@
-from dateutil import parser as dateutil_parser
+import time
 
 
 def parse_date(datestring):
     """
     Parse many date formats into an AP friendly format.
     """
+    from dateutil import parser as dateutil_parser
+
     dateobj = dateutil_parser.parse(datestring)
     return dateobj.strftime('%Y-%m-%d')
+
+
+def get_rows(data, with_timestamp=False, batch_name=None):
+    """
+    Return the column names and an iterator of row tuples for a list of
+    objects to render, with `timestamp` and `batchname` added as
+    constant columns if requested.
+
+    Objects with a column schema (see :meth:`elex.api.APElection.row`)
+    are rendered without building a dict for each; others are serialized.
+
+    :param data:
+        A non-empty list of objects of one class.
+    :param with_timestamp:
+        Add a `timestamp` column with the current Unix time.
+    :param batch_name:
+        Add a `batchname` column with this value.
+    """
+    extra_columns = []
+    extra_values = []
+    if with_timestamp:
+        extra_columns.append('timestamp')
+        extra_values.append(str(int(time.time())))
+    if batch_name:
+        extra_columns.append('batchname')
+        extra_values.append(batch_name)
+    extra_values = tuple(extra_values)
+
+    columns = getattr(data[0], 'columns', None)
+    if columns:
+        rows = (obj.row() + extra_values for obj in data)
+    else:
+        columns = list(data[0].serialize().keys())
+        rows = (tuple(obj.serialize().values()) + extra_values for obj in data)
+    return list(columns) + extra_columns, rows
@@ -0,0 +1,295 @@
+"""
+A local stand-in for the Associated Press Elections API, for testing and
+benchmarking the HTTP path (caching, ETags, quotas, concurrency) without
+an API key or network access.
+
+It serves ``/elections``, ``/elections/<date>``, ``/reports`` and
+``/reports/<id>`` from the ``tests/data`` fixtures, or election results
+from a directory of recordings, with or without a ``/v2`` style version
+prefix. Responses carry an ETag and ``Cache-Control: max-age``, and a
+matching ``If-None-Match`` gets a 304. An optional per-minute quota
+answers 403 once exceeded, like the AP API, and an optional latency is
+added to every response.
+
+Run it with ``elex serve``, or from Python::
+
+    server = StandInServer(quota=10, latency=0.1)
+    server.start()
+    elex.BASE_URL = server.base_url
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import urlparse
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import urlparse
+
+DEFAULT_DATA_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'tests',
+    'data'
+)
+ELECTIONS_FIXTURE = '00000000_elections.json'
+REPORT_FIXTURES = [
+    ('Delegates / delsum', 'delsum', '20160118_delsum.json'),
+    ('Delegates / delsuper', 'delsuper', '20160118_delsuper.json'),
+    ('Trend / g / US', 'gov', '20160818_gov_trends.json'),
+    ('Trend / h / US', 'house', '20160818_house_trends.json'),
+    ('Trend / s / US', 'senate', '20160818_senate_trends.json'),
+]
+QUOTA_WINDOW = 60
+VERSION_PREFIX = re.compile(r'^/v\d+(?=/|$)')
+ELECTION_FIXTURE = re.compile(r'^(\d{4})(\d{2})(\d{2})_.*\.json$')
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Answers AP Elections API requests from the server's routes.
+    """
+    def do_GET(self):
+        server = self.server
+        server.enter()
+        try:
+            if server.latency:
+                time.sleep(server.latency)
+
+            path = VERSION_PREFIX.sub('', urlparse(self.path).path)
+            path = path.rstrip('/') or '/'
+
+            if not server.take_quota():
+                self.respond(403, b'Over quota limit.', 'text/plain')
+                return
+
+            body = server.get_body(path, self.headers.get('Host'))
+            if body is None:
+                self.respond(404, b'Not found.', 'text/plain')
+                return
+
+            etag = '"{0}"'.format(hashlib.sha1(body).hexdigest())
+            if self.headers.get('If-None-Match') == etag:
+                self.respond(304, headers={'ETag': etag})
+                return
+            self.respond(200, body, headers={'ETag': etag})
+        finally:
+            server.leave()
+
+    def respond(self, status, body=b'', content_type='application/json',
+                headers=None):
+        self.server.log_request_status(self.path, status)
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+        if status in (200, 304):
+            self.send_header(
+                'Cache-Control',
+                'public, max-age={0}'.format(self.server.max_age)
+            )
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """
+    Threaded stand-in AP Elections API server.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address=('127.0.0.1', 0),
+                 data_dir=DEFAULT_DATA_DIRECTORY, recording_dir=None,
+                 quota=None, latency=0, max_age=30,
+                 quota_window=QUOTA_WINDOW):
+        """
+        :param address:
+            `(host, port)` to listen on; port 0 picks a free port.
+        :param data_dir:
+            Directory of fixtures, laid out like ``tests/data``. The
+            default is the repository's ``tests/data``, which isn't
+            installed with the package. Pass None to serve recordings
+            only.
+        :param recording_dir:
+            Optional directory of flat file recordings. Each request for
+            an election date serves that date's next recording, then keeps
+            serving the last one.
+        :param quota:
+            Optional maximum number of requests per minute; later requests
+            get a 403.
+        :param quota_window:
+            Length of the quota window in seconds, if not a minute.
+        :param latency:
+            Seconds to wait before answering each request.
+        :param max_age:
+            ``Cache-Control: max-age`` to send, in seconds.
+        """
+        if data_dir and not os.path.isdir(data_dir):
+            raise IOError(
+                'Fixture directory {0} not found; the tests/data fixtures '
+                'are only available from a checkout of the elex '
+                'repository.'.format(data_dir)
+            )
+
+        HTTPServer.__init__(self, address, StandInHandler)
+        self.quota = quota
+        self.quota_window = quota_window
+        self.latency = latency
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.thread = None
+        self.reset()
+
+        self.routes = {}
+        self.reports = []
+        if data_dir:
+            self.load_fixtures(data_dir)
+        if recording_dir:
+            self.load_recordings(recording_dir)
+
+    @property
+    def base_url(self):
+        """
+        URL to use as `elex.BASE_URL` (or `AP_API_BASE_URL`).
+        """
+        return 'http://{0}:{1}/v2'.format(*self.server_address[:2])
+
+    def start(self):
+        """
+        Serve requests from a background thread.
+        """
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and close the socket.
+        """
+        if self.thread is not None:
+            self.shutdown()
+            self.thread = None
+        self.server_close()
+
+    def reset(self):
+        """
+        Clear the request log, concurrency counters and quota window.
+        """
+        with self.lock:
+            self.requests = []
+            self.quota_requests = deque()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+    def load_fixtures(self, data_dir):
+        """
+        Route ``/elections``, one ``/elections/<date>`` per date (the
+        first fixture for that date, by name) and the delegate and trend
+        reports to the fixtures in `data_dir`.
+        """
+        report_names = set(fixture[2] for fixture in REPORT_FIXTURES)
+        for name in sorted(os.listdir(data_dir)):
+            path = os.path.join(data_dir, name)
+            if name == ELECTIONS_FIXTURE:
+                self.routes['/elections'] = path
+                continue
+            if name in report_names:
+                continue
+            match = ELECTION_FIXTURE.match(name)
+            if match and match.group(1) != '0000':
+                route = '/elections/{0}-{1}-{2}'.format(*match.groups())
+                self.routes.setdefault(route, path)
+
+        for title, report_id, name in REPORT_FIXTURES:
+            path = os.path.join(data_dir, name)
+            if os.path.exists(path):
+                self.routes['/reports/{0}'.format(report_id)] = path
+                self.reports.append((title, report_id))
+
+    def load_recordings(self, recording_dir):
+        """
+        Route each election date in a directory of recordings to its
+        sequence of recordings. Each recording is read when it is served,
+        and served as the bytes that were recorded.
+        """
+        from elex.api.recording import iter_recordings, recording_election_date
+
+        sequences = {}
+        for timestamp, path in iter_recordings(recording_dir):
+            electiondate = recording_election_date(path)
+            if electiondate is not None:
+                route = '/elections/{0}'.format(electiondate)
+                sequences.setdefault(route, []).append(path)
+        for route, paths in sequences.items():
+            self.routes[route] = deque(paths)
+
+    def get_body(self, path, host=None):
+        """
+        Return the response body for `path`, or None if there isn't one.
+        """
+        if path == '/reports':
+            return self.reports_listing(host)
+
+        route = self.routes.get(path)
+        if route is None:
+            return None
+        if isinstance(route, deque):
+            from elex.api.recording import read_recording_content
+
+            with self.lock:
+                path = route[0]
+                if len(route) > 1:
+                    route.popleft()
+            return read_recording_content(path)
+        with open(route, 'rb') as readfile:
+            return readfile.read()
+
+    def reports_listing(self, host=None):
+        host = host or '{0}:{1}'.format(*self.server_address[:2])
+        return json.dumps({'reports': [
+            {
+                'title': title,
+                'id': 'http://{0}/v2/reports/{1}'.format(host, report_id),
+            }
+            for title, report_id in self.reports
+        ]}).encode('utf-8')
+
+    def take_quota(self):
+        """
+        Count a request against the per-minute quota; returns False if the
+        quota is used up.
+        """
+        now = time.time()
+        with self.lock:
+            while self.quota_requests and self.quota_requests[0] <= now - self.quota_window:
+                self.quota_requests.popleft()
+            self.quota_requests.append(now)
+            return self.quota is None or len(self.quota_requests) <= self.quota
+
+    def enter(self):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def log_request_status(self, path, status):
+        with self.lock:
+            self.requests.append((path, status))
@@ -31,6 +31,9 @@ setup(
         "requests==2.20.*",
         "ujson==1.35",
     ],
+    extras_require={
+        "zstd": ["zstandard"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -1,5 +1,6 @@
 import unittest
 
+import elex
 from elex.api import Election, DelegateReport, USGovernorTrendReport, USHouseTrendReport, USSenateTrendReport, utils
 from time import sleep
 
@@ -107,3 +108,41 @@ class NetworkTestCase(unittest.TestCase):
         response = utils.api_request(*args, **kwargs)
         sleep(10)
         return response
+
+
+class StandInAPITestCase(unittest.TestCase):
+    """
+    Points elex at a local stand-in AP API server (see `elex.server`),
+    with a fresh in-memory response cache for each test.
+    """
+    server_options = {}
+
+    @classmethod
+    def setUpClass(cls):
+        from elex.server import StandInServer
+        cls.server = StandInServer(**cls.server_options).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        import requests
+        from cachecontrol import CacheControl
+        from elex.cachecontrol_caches import MemoryCache
+        from elex.cachecontrol_heuristics import EtagOnlyCache
+
+        self.server.reset()
+        self.previous = (elex.BASE_URL, elex.API_KEY, elex._cache)
+        elex.BASE_URL = self.server.base_url
+        elex.API_KEY = 'stand-in'
+        elex._cache = CacheControl(
+            requests.session(),
+            cache=MemoryCache(),
+            heuristic=EtagOnlyCache()
+        )
+        utils.clear_reports_cache()
+
+    def tearDown(self):
+        elex.BASE_URL, elex.API_KEY, elex._cache = self.previous
+        utils.clear_reports_cache()
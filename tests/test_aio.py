@@ -0,0 +1,89 @@
+import sys
+import unittest
+
+try:
+    from urllib.parse import urlparse, parse_qsl
+except ImportError:
+    from urlparse import urlparse, parse_qsl
+
+import elex
+from elex.api import DelegateReport, Election, USGovernorTrendReport
+from elex.server import StandInServer
+
+PY3_MESSAGE = 'The asyncio client requires Python 3.'
+
+FIXTURES = {
+    'election': 'tests/data/20151103_national.json',
+    'delsum': 'tests/data/20160118_delsum.json',
+    'delsuper': 'tests/data/20160118_delsuper.json',
+}
+
+
+@unittest.skipIf(sys.version_info < (3, 5), PY3_MESSAGE)
+class AsyncClientTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StandInServer(latency=0.2).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        import asyncio
+        from elex.api import aio
+
+        self.asyncio = asyncio
+        self.aio = aio
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server.reset()
+        self.base_url = elex.BASE_URL
+        self.api_key = elex.API_KEY
+        elex.API_KEY = 'key'
+        elex.BASE_URL = self.server.base_url
+
+    def tearDown(self):
+        elex.BASE_URL = self.base_url
+        elex.API_KEY = self.api_key
+        self.asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def run_async(self, *awaitables):
+        return self.loop.run_until_complete(self.asyncio.gather(*awaitables))
+
+    def test_api_request_params(self):
+        response, = self.run_async(
+            self.aio.api_request('/reports', test=True)
+        )
+        self.assertEqual(response.json()['reports'][0]['title'], 'Delegates / delsum')
+        query = dict(parse_qsl(urlparse(self.server.requests[-1][0]).query))
+        self.assertEqual(query, {'apiKey': 'key', 'format': 'json', 'test': 'True'})
+
+    def test_requests_run_concurrently(self):
+        self.run_async(*[
+            self.aio.api_request('/reports', n=n)
+            for n in range(4)
+        ])
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    def test_gather_election_and_reports(self):
+        election = Election(electiondate='2015-11-03')
+        results, delegates, governors = self.run_async(
+            election.results_async(),
+            DelegateReport.fetch_async(),
+            USGovernorTrendReport.fetch_async(),
+        )
+        expected = Election(datafile=FIXTURES['election'])
+        self.assertEqual(
+            [r.serialize() for r in results],
+            [r.serialize() for r in expected.results]
+        )
+        self.assertEqual(len(delegates.candidate_objects), len(
+            DelegateReport(
+                delsum_datafile=FIXTURES['delsum'],
+                delsuper_datafile=FIXTURES['delsuper']
+            ).candidate_objects
+        ))
+        self.assertEqual(governors.parties[0].office, 'Governor')
@@ -0,0 +1,389 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+import elex
+import requests
+from cachecontrol import CacheControl
+from cachecontrol.caches import FileCache
+from elex.cachecontrol_caches import (MEMORY_CACHE_MAX_ENTRIES, BoundedFileCache,
+                                      CacheStats, MemoryCache, SQLiteCache,
+                                      get_cache_backend)
+from elex.api import utils
+from elex.cachecontrol_heuristics import EtagOnlyCache
+
+ETAG = '"abc123"'
+BODY = b'{"races": []}'
+
+
+class EtagHandler(BaseHTTPRequestHandler):
+    """
+    Answers with an ETag and max-age, and 304 on a matching If-None-Match.
+    """
+    def do_GET(self):
+        self.server.requests.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.send_header('Cache-Control', 'max-age=300')
+        self.send_header('ETag', ETAG)
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class CacheBackendTestMixin(object):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = self.make_cache()
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.directory)
+
+    def test_get_missing(self):
+        self.assertEqual(self.cache.get('missing'), None)
+
+    def test_set_get(self):
+        self.cache.set('key', b'value')
+        self.assertEqual(self.cache.get('key'), b'value')
+
+    def test_set_replaces(self):
+        self.cache.set('key', b'value')
+        self.cache.set('key', b'other', expires=300)
+        self.assertEqual(self.cache.get('key'), b'other')
+
+    def test_delete(self):
+        self.cache.set('key', b'value')
+        self.cache.delete('key')
+        self.assertEqual(self.cache.get('key'), None)
+
+    def test_clear(self):
+        self.cache.set('one', b'1')
+        self.cache.set('two', b'2')
+        self.assertEqual(self.cache.clear(), 2)
+        self.assertEqual(self.cache.get('one'), None)
+        self.assertEqual(self.cache.clear(), 0)
+
+    def test_etag_revalidation(self):
+        server = HTTPServer(('127.0.0.1', 0), EtagHandler)
+        server.requests = []
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        try:
+            session = CacheControl(
+                requests.session(),
+                cache=self.cache,
+                heuristic=EtagOnlyCache()
+            )
+            url = 'http://127.0.0.1:{0}/'.format(server.server_address[1])
+            first = session.get(url)
+            second = session.get(url)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(server.requests, [None, ETAG])
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.content, BODY)
+
+
+class BoundedCacheTestMixin(object):
+    """
+    Size and age bounds and usage counters, shared by every backend.
+    """
+    def test_max_size_evicts_least_recently_used(self):
+        cache = self.make_bounded_cache(max_size=10)
+        cache.set('one', b'1111')
+        cache.set('two', b'2222')
+        cache.get('one')
+        cache.set('three', b'3333')
+        self.assertEqual(cache.get('two'), None)
+        self.assertEqual(cache.get('one'), b'1111')
+        self.assertEqual(cache.get('three'), b'3333')
+        self.assertEqual(cache.stats()['bytes'], 8)
+
+    def test_max_age_evicts_expired(self):
+        cache = self.make_bounded_cache(max_age=60)
+        cache.set('old', b'old')
+        self.backdate(cache, 'old', 120)
+        cache.set('new', b'new')
+        self.assertEqual(cache.get('old'), None)
+        self.assertEqual(cache.get('new'), b'new')
+
+    def test_unbounded_keeps_everything(self):
+        cache = self.make_bounded_cache()
+        for i in range(5):
+            cache.set('key{0}'.format(i), b'x' * 100)
+        self.assertEqual(cache.stats()['entries'], 5)
+
+    def test_stats(self):
+        cache = self.make_bounded_cache()
+        stats = cache.stats()
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['oldest'], None)
+
+        before = time.time()
+        cache.set('one', b'12345')
+        cache.incr_stat('hits')
+        cache.incr_stat('hits')
+        cache.incr_stat('misses')
+        cache.incr_stat('not_modified')
+        stats = cache.stats()
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['bytes'], 5)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['not_modified'], 1)
+        self.assertTrue(stats['oldest'] >= before - 1)
+
+    def test_cache_stats_serialize(self):
+        cache = self.make_bounded_cache()
+        cache.set('one', b'12345')
+        row = CacheStats('test', cache).serialize()
+        self.assertEqual(list(row.keys()), [
+            'backend', 'location', 'entries', 'bytes', 'hits', 'misses',
+            'not_modified', 'oldest_entry'
+        ])
+        self.assertEqual(row['backend'], 'test')
+        self.assertEqual(row['location'], str(cache))
+        self.assertTrue(row['oldest_entry'].endswith('Z'))
+
+    def test_session_counters(self):
+        server = HTTPServer(('127.0.0.1', 0), EtagHandler)
+        server.requests = []
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        cache = self.make_bounded_cache()
+        session = CacheControl(
+            requests.session(),
+            cache=cache,
+            heuristic=EtagOnlyCache()
+        )
+        try:
+            with patched_session(session):
+                url = 'http://127.0.0.1:{0}/'.format(server.server_address[1])
+                for i in range(3):
+                    utils.record_cache_stat(session.get(url))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        stats = cache.stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['not_modified'], 2)
+        self.assertEqual(stats['hits'], 0)
+
+
+@contextmanager
+def patched_session(session):
+    """
+    Temporarily make `session` the shared elex session.
+    """
+    previous = elex._cache
+    elex._cache = session
+    try:
+        yield session
+    finally:
+        elex._cache = previous
+
+
+class TestSQLiteCache(CacheBackendTestMixin, BoundedCacheTestMixin, unittest.TestCase):
+
+    def make_cache(self):
+        return SQLiteCache(os.path.join(self.directory, 'cache.sqlite3'))
+
+    def make_bounded_cache(self, **kwargs):
+        self.cache.close()
+        self.cache = SQLiteCache(
+            os.path.join(self.directory, 'bounded.sqlite3'),
+            **kwargs
+        )
+        return self.cache
+
+    def backdate(self, cache, key, seconds):
+        cache.connection.execute(
+            'UPDATE responses SET created = created - ? WHERE key = ?',
+            (seconds, key)
+        )
+
+    def test_clear_resets_stats(self):
+        self.cache.incr_stat('hits')
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()['hits'], 0)
+
+    def test_persists(self):
+        self.cache.set('key', b'value')
+        self.cache.close()
+        self.cache = self.make_cache()
+        self.assertEqual(self.cache.get('key'), b'value')
+
+    def test_wal_mode(self):
+        mode = self.cache.connection.execute('PRAGMA journal_mode').fetchone()[0]
+        self.assertEqual(mode, 'wal')
+
+
+class TestMemoryCache(CacheBackendTestMixin, BoundedCacheTestMixin, unittest.TestCase):
+
+    def make_cache(self):
+        return MemoryCache(max_entries=2)
+
+    def make_bounded_cache(self, **kwargs):
+        self.cache = MemoryCache(**kwargs)
+        return self.cache
+
+    def backdate(self, cache, key, seconds):
+        value, created = cache.data[key]
+        cache.data[key] = (value, created - seconds)
+
+    def test_least_recently_used_evicted(self):
+        self.cache.set('one', b'1')
+        self.cache.set('two', b'2')
+        self.cache.get('one')
+        self.cache.set('three', b'3')
+        self.assertEqual(self.cache.get('two'), None)
+        self.assertEqual(self.cache.get('one'), b'1')
+        self.assertEqual(self.cache.get('three'), b'3')
+
+
+class TestBoundedFileCache(BoundedCacheTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_bounded_cache(self, **kwargs):
+        return BoundedFileCache(os.path.join(self.directory, 'cache'), **kwargs)
+
+    def backdate(self, cache, key, seconds):
+        name = cache._fn(key)
+        written = os.path.getmtime(name) - seconds
+        os.utime(name, (written, written))
+        if cache.oldest is not None:
+            cache.oldest = min(cache.oldest, written)
+
+    def test_stats_file_not_counted(self):
+        cache = self.make_bounded_cache(max_size=4)
+        cache.incr_stat('misses')
+        cache.save_counters()
+        cache.set('one', b'1234')
+        self.assertEqual(cache.stats()['entries'], 1)
+        self.assertEqual(cache.get('one'), b'1234')
+
+    def test_scans_only_when_needed(self):
+        scans = []
+
+        class CountingCache(BoundedFileCache):
+            def _entries(self):
+                scans.append(1)
+                return super(CountingCache, self)._entries()
+
+        cache = CountingCache(os.path.join(self.directory, 'cache'), max_size=10)
+        cache.set('one', b'1111')
+        cache.set('two', b'2222')
+        cache.set('two', b'22')
+        self.assertEqual(len(scans), 1)
+        self.assertEqual(cache.size, 6)
+        cache.delete('one')
+        self.assertEqual(cache.size, 2)
+        cache.set('three', b'3333')
+        cache.set('four', b'4444444')
+        self.assertEqual(len(scans), 2)
+        self.assertEqual(cache.get('two'), None)
+        self.assertEqual(cache.get('three'), None)
+        self.assertEqual(cache.size, 7)
+
+    def test_concurrent_first_writes(self):
+        cache = self.make_bounded_cache(max_size=1000)
+        errors = []
+        start = threading.Event()
+
+        def write(i):
+            start.wait()
+            try:
+                cache.set('key{0}'.format(i), b'x' * 10)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(cache.stats()['entries'], 8)
+        self.assertEqual(cache.size, 80)
+
+    def test_unbounded_does_not_scan(self):
+        cache = self.make_bounded_cache()
+        cache.set('one', b'1111')
+        self.assertEqual(cache.size, None)
+
+    def test_counters_saved_in_batches(self):
+        cache = self.make_bounded_cache()
+        cache.incr_stat('hits')
+        cache.incr_stat('misses')
+        self.assertFalse(os.path.exists(cache.stats_path))
+        cache.save_counters()
+        cache.incr_stat('hits')
+        other = self.make_bounded_cache()
+        self.assertEqual(other.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['hits'], 2)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+
+class TestGetCacheBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_backends(self):
+        self.assertIsInstance(get_cache_backend('file', self.directory), FileCache)
+        self.assertIsInstance(get_cache_backend('file', self.directory), BoundedFileCache)
+        self.assertIsInstance(get_cache_backend('memory', self.directory), MemoryCache)
+        sqlite_cache = get_cache_backend('sqlite', self.directory)
+        self.assertIsInstance(sqlite_cache, SQLiteCache)
+        sqlite_cache.close()
+
+    def test_bounds(self):
+        cache = get_cache_backend('memory', self.directory, max_size=100, max_age=60)
+        self.assertEqual(cache.max_entries, MEMORY_CACHE_MAX_ENTRIES)
+        self.assertEqual(cache.max_size, 100)
+        self.assertEqual(cache.max_age, 60)
+
+    def test_max_entries(self):
+        cache = get_cache_backend('memory', self.directory, max_entries=2)
+        self.assertEqual(cache.max_entries, 2)
+        for key in ('one', 'two', 'three'):
+            cache.set(key, b'1')
+        self.assertEqual(cache.stats()['entries'], 2)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_cache_backend('redis', self.directory)
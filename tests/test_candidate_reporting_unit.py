@@ -1,4 +1,7 @@
+import pickle
+
 import tests
+from elex.api.models import CandidateReportingUnit
 
 
 class TestCandidateReportingUnit(tests.ElectionResultsTestCase):
@@ -262,3 +265,82 @@ class TestCandidateReportingUnit(tests.ElectionResultsTestCase):
         all_ids = list([b.id for b in self.candidate_reporting_units])
         unique_ids = set(all_ids)
         self.assertEqual(len(all_ids), len(unique_ids))
+
+    def test_slots(self):
+        for obj in (self.candidate_reporting_units[0],
+                    self.reporting_units[0],
+                    self.races[0]):
+            self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_attributes(self):
+        cru = self.candidate_reporting_units[0]
+        attributes = cru.attributes()
+        self.assertEqual(attributes['raceid'], cru.raceid)
+        self.assertEqual(attributes['votecount'], cru.votecount)
+        self.assertEqual(set(cru.serialize()) - set(attributes), set())
+        self.assertNotIn('_context', attributes)
+
+    def test_attributes_skip_deleted(self):
+        self.assertNotIn('candidates', self.reporting_units[0].attributes())
+
+    def test_pickle(self):
+        for obj in (self.candidate_reporting_units[0],
+                    self.reporting_units[0],
+                    self.races[0]):
+            copy = pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+            self.assertEqual(copy.serialize(), obj.serialize())
+
+    def test_pickle_keeps_shared_context(self):
+        results = pickle.loads(pickle.dumps(
+            self.candidate_reporting_units,
+            pickle.HIGHEST_PROTOCOL
+        ))
+        self.assertIs(results[0]._context, results[1]._context)
+        self.assertEqual(
+            [c.serialize() for c in results],
+            [c.serialize() for c in self.candidate_reporting_units]
+        )
+
+
+class TestCandidateReportingUnitContext(tests.ElectionResultsTestCase):
+
+    def test_shares_reporting_unit(self):
+        first, second = self.candidate_reporting_units[:2]
+        self.assertEqual(first.reportingunitid, second.reportingunitid)
+        self.assertIs(first._context, second._context)
+        self.assertEqual(first._overrides, None)
+
+    def test_race_fields_from_race(self):
+        cru = self.candidate_reporting_units[0]
+        race = cru._context._context
+        self.assertEqual(cru.raceid, race.raceid)
+        self.assertEqual(cru.officename, race.officename)
+        self.assertEqual(cru.electiondate, '2015-11-03')
+
+    def test_set_field_only_affects_candidate(self):
+        first, second = self.candidate_reporting_units[:2]
+        first.level = 'precinct'
+        self.assertEqual(first.level, 'precinct')
+        self.assertEqual(second.level, first._context.level)
+        self.assertEqual(first.serialize()['level'], 'precinct')
+
+        first.level = first._context.level
+        self.assertEqual(first._overrides, {})
+
+    def test_without_context(self):
+        cru = CandidateReportingUnit(
+            raceid='123',
+            reportingunitid='state-1',
+            polid='456',
+            precinctstotal=10
+        )
+        self.assertEqual(cru.id, '123-polid-456-state-1')
+        self.assertEqual(cru.precinctstotal, 10)
+        self.assertEqual(cru.precinctsreporting, 0)
+        self.assertEqual(cru.serialize()['raceid'], '123')
+
+    def test_kwargs_override_context(self):
+        unit = self.reporting_units[0]
+        cru = CandidateReportingUnit(context=unit, level='township')
+        self.assertEqual(cru.level, 'township')
+        self.assertEqual(cru.raceid, unit.raceid)
@@ -1,12 +1,18 @@
 import csv
+import os
 import sys
 import json
+import shutil
+import tempfile
+import time
+import unittest
 import tests
 try:
     from cStringIO import StringIO
 except ImportError:
     from io import StringIO
 from six import with_metaclass
+from elex.api import Election
 from elex.cli.app import ElexApp
 from collections import OrderedDict
 
@@ -17,6 +23,14 @@ DELSUPER_DATA_FILE = 'tests/data/20160118_delsuper.json'
 ELECTIONS_DATA_FILE = 'tests/data/00000000_elections.json'
 DISTRICT_DATA_FILE = 'tests/data/20160201_district_results.json'
 
+BUNDLE_FILES = [
+    'races',
+    'reporting_units',
+    'results',
+    'candidates',
+    'ballot_measures',
+]
+
 TEST_COMMANDS = [
     'races',
     'candidates',
@@ -26,6 +40,37 @@ TEST_COMMANDS = [
 ]
 
 
+def run_bundle(output_format, datafile=DATA_FILE):
+    """
+    Execute `elex bundle` into a temporary directory; returns parsed rows
+    keyed by file name
+    """
+    bundle_dir = tempfile.mkdtemp()
+    try:
+        argv = ['bundle', DATA_ELECTION_DATE, '--data-file', datafile,
+                '--bundle-dir', bundle_dir, '-o', output_format]
+        app = ElexApp(argv=argv)
+        app.setup()
+        app.log.set_level('FATAL')
+        app.run()
+
+        bundle = OrderedDict()
+        for name in BUNDLE_FILES:
+            path = os.path.join(
+                bundle_dir,
+                '{0}.{1}'.format(name, output_format)
+            )
+            with open(path) as readfile:
+                if output_format == 'json':
+                    contents = readfile.read()
+                    bundle[name] = json.loads(contents) if contents else []
+                else:
+                    bundle[name] = list(csv.DictReader(readfile))
+        return bundle
+    finally:
+        shutil.rmtree(bundle_dir)
+
+
 class ElexCLICSVTestMeta(type):
     def __new__(mcs, name, bases, dict):
         def gen_fields_test(command):
@@ -244,6 +289,18 @@ class ElexCLICSVTestCase(
         )
         self.assertEqual(58, len(number_of_states))
 
+    def test_csv_bundle_lengths(self):
+        bundle = run_bundle('csv')
+        for name in BUNDLE_FILES:
+            self.assertEqual(len(bundle[name]), len(getattr(self, name)))
+
+    def test_csv_bundle_results_data(self):
+        bundle = run_bundle('csv')
+        self.assertEqual(
+            [r['id'] for r in bundle['results']],
+            [r.id for r in self.results]
+        )
+
     def test_csv_results_resultslevel(self):
         fields, data = self._test_command(
             command='results',
@@ -516,6 +573,18 @@ class ElexCLIJSONTestCase(
         )
         self.assertEqual(58, len(number_of_states))
 
+    def test_json_bundle_lengths(self):
+        bundle = run_bundle('json')
+        for name in BUNDLE_FILES:
+            self.assertEqual(len(bundle[name]), len(getattr(self, name)))
+
+    def test_json_bundle_results_data(self):
+        bundle = run_bundle('json')
+        self.assertEqual(
+            [r['id'] for r in bundle['results']],
+            [r.id for r in self.results]
+        )
+
     def test_json_results_resultslevel(self):
         fields, data = self._test_command(
             command='results',
@@ -569,3 +638,162 @@ class ElexCLIJSONTestCase(
         sys.stdout = stdout_backup
 
         return list(data[0].keys()), data
+
+
+@unittest.skipUnless(os.path.exists('/dev/full'), 'needs /dev/full')
+class ElexCLIBundleErrorTestCase(unittest.TestCase):
+    """
+    `elex bundle` fails when a file can't be written.
+    """
+    def setUp(self):
+        self.bundle_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.bundle_dir)
+
+    def _bundle(self, output_format):
+        # Writes to /dev/full fail with ENOSPC, like a full disk.
+        os.symlink('/dev/full', os.path.join(
+            self.bundle_dir,
+            'results.{0}'.format(output_format)
+        ))
+        argv = ['bundle', DATA_ELECTION_DATE, '--data-file', DATA_FILE,
+                '--bundle-dir', self.bundle_dir, '-o', output_format]
+        app = ElexApp(argv=argv)
+        app.setup()
+        app.log.set_level('FATAL')
+        app.run()
+
+    def test_csv_write_error(self):
+        self.assertRaises(IOError, self._bundle, 'csv')
+
+    def test_json_write_error(self):
+        self.assertRaises(IOError, self._bundle, 'json')
+
+
+class ElexCLIReplayTestCase(tests.ElectionResultsTestCase):
+    """
+    Replay a directory of flat file recordings.
+    """
+    def setUp(self):
+        super(ElexCLIReplayTestCase, self).setUp()
+        self.recording_dir = tempfile.mkdtemp()
+        recordings = [
+            (1000, DATA_FILE),
+            (1001, ELECTIONS_DATA_FILE),
+            (1002, DISTRICT_DATA_FILE),
+        ]
+        for timestamp, datafile in recordings:
+            shutil.copy(datafile, os.path.join(
+                self.recording_dir,
+                'ap_elections_loader_recording-{0}.json'.format(timestamp)
+            ))
+
+    def tearDown(self):
+        shutil.rmtree(self.recording_dir)
+
+    def _replay(self, speed):
+        stdout_backup = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            argv = ['replay', '--recording-dir', self.recording_dir,
+                    '--replay-speed', str(speed)]
+            app = ElexApp(argv=argv)
+            app.setup()
+            app.log.set_level('FATAL')
+            app.run()
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout_backup
+        return [row for row in csv.reader(output.splitlines()) if row[0] != 'id']
+
+    def test_replay_renders_every_snapshot(self):
+        rows = self._replay(0)
+        district_results = Election(datafile=DISTRICT_DATA_FILE).results
+        self.assertEqual(len(rows), len(self.results) + len(district_results))
+        self.assertEqual(rows[0][0], self.results[0].serialize()['id'])
+
+    def test_replay_speed(self):
+        start = time.time()
+        self._replay(10)
+        self.assertTrue(time.time() - start >= 0.2)
+
+    def test_replay_without_recordings(self):
+        empty_dir = tempfile.mkdtemp()
+        try:
+            app = ElexApp(argv=['replay', '--recording-dir', empty_dir])
+            app.setup()
+            app._meta.exit_on_close = False
+            app.log.set_level('FATAL')
+            app.run()
+        finally:
+            shutil.rmtree(empty_dir)
+        self.assertEqual(app.exit_code, 1)
+
+
+class ElexCLITimingsTestCase(tests.ElectionResultsTestCase):
+    """
+    Print stage timings with `--timings` and `--timings-json`.
+    """
+    def _run(self, flag):
+        stdout_backup, stderr_backup = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = StringIO(), StringIO()
+        try:
+            argv = ['results', DATA_ELECTION_DATE, '--data-file', DATA_FILE, flag]
+            app = ElexApp(argv=argv)
+            app.setup()
+            app._meta.exit_on_close = False
+            app.log.set_level('FATAL')
+            app.run()
+            app.close()
+            output = sys.stderr.getvalue()
+        finally:
+            sys.stdout, sys.stderr = stdout_backup, stderr_backup
+        return output
+
+    def test_timings_json(self):
+        timings = json.loads(self._run('--timings-json'))
+        self.assertEqual(
+            list(timings.keys()),
+            ['decode', 'races', 'tally', 'units', 'render']
+        )
+        self.assertEqual(timings['units']['count'], len(self.results))
+        self.assertEqual(timings['render']['count'], len(self.results))
+        self.assertEqual(timings['races']['calls'], 1)
+        self.assertTrue(timings['races']['wall_ms'] > 0)
+
+    def test_timings_summary(self):
+        lines = self._run('--timings').splitlines()
+        self.assertEqual(lines[0].split(), ['stage', 'calls', 'wall', 'ms', 'cpu', 'ms', 'count'])
+        self.assertEqual(lines[4].split()[0], 'units')
+        self.assertEqual(lines[4].split()[-1], str(len(self.results)))
+
+
+class ElexCLIFiltersTestCase(unittest.TestCase):
+    """
+    Filter races and reporting units with `--states` and `--levels`.
+    """
+    def _run(self, *args):
+        stdout_backup = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            argv = ['results', DATA_ELECTION_DATE, '--data-file', DATA_FILE] + list(args)
+            app = ElexApp(argv=argv)
+            app.setup()
+            app.log.set_level('FATAL')
+            app.run()
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout_backup
+        return list(csv.DictReader(output.splitlines()))
+
+    def test_states_and_levels(self):
+        rows = self._run('--states', 'ky,MS', '--levels', 'state')
+        expected = [
+            r.serialize() for r in Election(datafile=DATA_FILE).results
+            if r.statepostal in ('KY', 'MS') and r.level == 'state'
+        ]
+        self.assertTrue(rows)
+        self.assertEqual([row['id'] for row in rows], [r['id'] for r in expected])
@@ -0,0 +1,101 @@
+import json
+import unittest
+
+from elex.api import CandidateReportingUnit, Race, ReportingUnit
+from elex.api.fields import Field, FieldTable, from_percent
+
+
+class Thing(object):
+    pass
+
+
+class TestFieldTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = FieldTable((
+            Field('votecount', ('voteCount', 'votecount'), 0),
+            Field('pct', ('pctCamel', 'pct'), 0.0, from_percent),
+            Field('tags', 'tags', ('a',)),
+        ))
+
+    def build(self, **kwargs):
+        obj = Thing()
+        self.table.build(obj, kwargs)
+        return obj
+
+    def test_defaults(self):
+        obj = self.build()
+        self.assertEqual(obj.votecount, 0)
+        self.assertEqual(obj.pct, 0.0)
+        self.assertEqual(obj.tags, ('a',))
+
+    def test_first_key(self):
+        obj = self.build(voteCount=5, pctCamel=50)
+        self.assertEqual(obj.votecount, 5)
+        self.assertEqual(obj.pct, 0.5)
+
+    def test_truthy_override(self):
+        obj = self.build(voteCount=5, votecount=7, pctCamel=50, pct=0.25)
+        self.assertEqual(obj.votecount, 7)
+        self.assertEqual(obj.pct, 0.25)
+
+    def test_falsy_override_ignored(self):
+        obj = self.build(voteCount=5, votecount=0)
+        self.assertEqual(obj.votecount, 5)
+
+    def test_override_keys(self):
+        self.assertEqual(self.table.override_keys, frozenset(['votecount', 'pct']))
+
+
+class TestFromDict(unittest.TestCase):
+    data_url = 'tests/data/20160301_super_tuesday.json'
+
+    def setUp(self):
+        with open(self.data_url) as readfile:
+            self.race_dict = json.load(readfile)['races'][0]
+
+    def test_race(self):
+        race = Race.from_dict(json.loads(json.dumps(self.race_dict)))
+        expected = Race(**json.loads(json.dumps(self.race_dict)))
+        self.assertEqual(race.serialize(), expected.serialize())
+        self.assertEqual(
+            [u.serialize() for u in race.reportingunits],
+            [u.serialize() for u in expected.reportingunits]
+        )
+
+    def test_reporting_unit(self):
+        race = Race(**json.loads(json.dumps(self.race_dict)))
+        unit_dict = self.race_dict['reportingUnits'][-1]
+        unit = ReportingUnit.from_dict(json.loads(json.dumps(unit_dict)), race)
+        expected = ReportingUnit(context=race, **json.loads(json.dumps(unit_dict)))
+        self.assertEqual(unit.serialize(), expected.serialize())
+        self.assertEqual(
+            [c.serialize() for c in unit.candidates],
+            [c.serialize() for c in expected.candidates]
+        )
+
+    def test_defer_tally(self):
+        race = Race(**json.loads(json.dumps(self.race_dict)))
+        unit_dict = self.race_dict['reportingUnits'][-1]
+        unit = ReportingUnit.from_dict(
+            json.loads(json.dumps(unit_dict)), race, defer_tally=True
+        )
+        self.assertEqual(unit.votecount, 0)
+
+    def test_candidate_reporting_unit(self):
+        race = Race(**json.loads(json.dumps(self.race_dict)))
+        unit = race.reportingunits[-1]
+        candidate_dict = self.race_dict['reportingUnits'][-1]['candidates'][0]
+        candidate = CandidateReportingUnit.from_dict(dict(candidate_dict), unit)
+        expected = CandidateReportingUnit(context=unit, **candidate_dict)
+        self.assertEqual(candidate.serialize(), expected.serialize())
+        self.assertEqual(candidate.party, candidate_dict['party'])
+
+    def test_precinctsreportingpct(self):
+        unit = ReportingUnit.from_dict({'precinctsReportingPct': 50.0})
+        self.assertEqual(unit.precinctsreportingpct, 0.5)
+        unit = ReportingUnit.from_dict({
+            'precinctsReportingPct': 50.0,
+            'precinctsreportingpct': 0.25,
+        })
+        self.assertEqual(unit.precinctsreportingpct, 0.25)
@@ -0,0 +1,161 @@
+import unittest
+
+from elex.api import Election
+from elex.api.filters import RaceFilter
+
+CT_DATA_FILE = 'tests/data/20160426_ct_rollups.json'
+INITIALIZATION_DATA_FILE = 'tests/data/20151103_national_initialization.json'
+NATIONAL_DATA_FILE = 'tests/data/20151103_national.json'
+
+
+def serialize(objs):
+    return [obj.serialize() for obj in objs]
+
+
+class TestRaceFilter(unittest.TestCase):
+    def test_inactive(self):
+        race = {'raceID': '1', 'reportingUnits': []}
+        self.assertFalse(RaceFilter().active)
+        self.assertFalse(RaceFilter(raceids=[], officeids='').active)
+        self.assertIs(RaceFilter().filter_race(race), race)
+
+    def test_match_race(self):
+        race = {'raceID': '7583', 'officeID': 'G', 'national': True}
+        self.assertTrue(RaceFilter(raceids=['7583']).match_race(race))
+        self.assertFalse(RaceFilter(raceids=['7582']).match_race(race))
+        self.assertTrue(RaceFilter(officeids='G,S').match_race(race))
+        self.assertFalse(RaceFilter(officeids='H').match_race(race))
+        self.assertTrue(RaceFilter(national=True).match_race(race))
+        self.assertFalse(RaceFilter(national=False).match_race(race))
+        self.assertTrue(RaceFilter(national=False).match_race({'raceID': '1'}))
+
+    def test_match_unit_levels(self):
+        county = {'statePostal': 'PA', 'level': 'subunit'}
+        township = {'statePostal': 'CT', 'level': 'subunit'}
+        state = {'statePostal': 'CT', 'level': 'state'}
+        levels = RaceFilter(levels=['county'])
+        self.assertTrue(levels.match_unit(county))
+        self.assertTrue(levels.match_unit(township))
+        self.assertFalse(levels.match_unit(state))
+        levels = RaceFilter(levels='state')
+        self.assertFalse(levels.match_unit(county))
+        self.assertFalse(levels.match_unit(township))
+        self.assertTrue(levels.match_unit(state))
+
+    def test_match_unit_statepostals(self):
+        self.assertTrue(RaceFilter(statepostals='CT').match_unit({'statePostal': 'CT'}))
+        self.assertFalse(RaceFilter(statepostals='CT').match_unit({'statePostal': 'RI'}))
+
+    def test_filter_race_copies(self):
+        units = [
+            {'statePostal': 'PA', 'level': 'state'},
+            {'statePostal': 'PA', 'level': 'subunit'},
+        ]
+        race = {'raceID': '1', 'reportingUnits': units}
+        filtered = RaceFilter(levels=['state']).filter_race(race)
+        self.assertEqual(filtered['reportingUnits'], units[:1])
+        self.assertIs(race['reportingUnits'], units)
+        self.assertIsNone(RaceFilter(statepostals=['CT']).filter_race(race))
+
+    def test_key(self):
+        self.assertEqual(
+            RaceFilter(raceids=['2', '1']).key(),
+            RaceFilter(raceids=['1', '2']).key()
+        )
+        self.assertNotEqual(
+            RaceFilter(raceids=['1']).key(),
+            RaceFilter(officeids=['1']).key()
+        )
+
+
+class TestElectionFilters(unittest.TestCase):
+    def _units(self, **kwargs):
+        election = Election(datafile=CT_DATA_FILE, **kwargs)
+        return election.get_units(
+            election.get_race_objects(election.get_raw_races())
+        )
+
+    def test_initialization_data_raceids(self):
+        election = Election(datafile=INITIALIZATION_DATA_FILE, raceids=['25002'])
+        races = election.get_race_objects(election.get_raw_races())
+        self.assertEqual([r.raceid for r in races], ['25002'])
+        self.assertTrue(races[0].initialization_data)
+
+    def test_streamed_initialization_data_raceids(self):
+        election = Election(datafile=INITIALIZATION_DATA_FILE, raceids=['25002'])
+        races = list(election.iter_race_objects())
+        self.assertEqual([r.raceid for r in races], ['25002'])
+
+    def test_officeids(self):
+        races, units, results = self._units(officeids='P,H')
+        self.assertTrue(races)
+        self.assertEqual(set(r.officeid for r in races), set(['P', 'H']))
+
+    def test_national(self):
+        all_races = self._units()[0]
+        national = self._units(national=True)[0]
+        local = self._units(national=False)[0]
+        self.assertTrue(all(r.national for r in national))
+        self.assertFalse(any(r.national for r in local))
+        self.assertEqual(len(national) + len(local), len(all_races))
+
+    def test_statepostals(self):
+        all_results = self._units()[2]
+        races, units, results = self._units(statepostals=['CT', 'RI'])
+        self.assertEqual(set(r.statepostal for r in races), set(['CT', 'RI']))
+        self.assertEqual(set(u.statepostal for u in units), set(['CT', 'RI']))
+        self.assertEqual(
+            serialize(results),
+            serialize(r for r in all_results if r.statepostal in ('CT', 'RI'))
+        )
+
+    def test_state_level(self):
+        all_races, all_units, all_results = self._units()
+        races, units, results = self._units(levels=['state'])
+        self.assertEqual(serialize(races), serialize(all_races))
+        self.assertEqual(set(u.level for u in units), set(['state']))
+        self.assertEqual(
+            serialize(results),
+            serialize(r for r in all_results if r.level == 'state')
+        )
+
+    def test_new_england_counties(self):
+        all_results = self._units(statepostals=['CT'])[2]
+        races, units, results = self._units(statepostals=['CT'], levels=['county'])
+        self.assertTrue(results)
+        self.assertEqual(set(u.level for u in units), set(['county']))
+        self.assertEqual(
+            serialize(results),
+            serialize(r for r in all_results if r.level == 'county')
+        )
+
+    def test_new_england_townships(self):
+        all_results = self._units(statepostals=['CT'])[2]
+        results = self._units(statepostals=['CT'], levels=['township'])[2]
+        self.assertEqual(
+            serialize(results),
+            serialize(r for r in all_results if r.level == 'township')
+        )
+
+    def test_streamed_filters_match_parsed(self):
+        filters = dict(statepostals=['CT', 'PA'], levels=['state', 'county'])
+        expected = self._units(**filters)
+        election = Election(datafile=CT_DATA_FILE, **filters)
+        streamed = election.get_units(list(election.iter_race_objects()))
+        self.assertEqual(
+            [serialize(objs) for objs in streamed],
+            [serialize(objs) for objs in expected]
+        )
+
+    def test_results_table(self):
+        election = Election(datafile=NATIONAL_DATA_FILE, levels=['state'])
+        self.assertEqual(
+            list(election.results_table().rows()),
+            serialize(election.results)
+        )
+
+    def test_cache_keys(self):
+        election = Election(datafile=NATIONAL_DATA_FILE)
+        all_results = election.results
+        election.levels = ['state']
+        self.assertLess(len(election.results), len(all_results))
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+import unittest
+
+import elex
+
+
+def imported_modules(code):
+    """
+    Run `code` in a fresh interpreter; returns the names in sys.modules.
+    """
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        code + '\nimport sys\nprint("\\n".join(sys.modules))'
+    ])
+    return set(output.decode('utf-8').split())
+
+
+class TestLazyCache(unittest.TestCase):
+
+    def test_import_does_not_build_session(self):
+        modules = imported_modules('import elex')
+        self.assertNotIn('requests', modules)
+        self.assertNotIn('cachecontrol', modules)
+
+    def test_get_cache_is_shared(self):
+        self.assertIs(elex.get_cache(), elex.get_cache())
+
+    def test_compatibility_names(self):
+        self.assertNotIn('requests', imported_modules('import elex\nelex.cache'))
+        for name in ('cache', 'session'):
+            proxy = getattr(elex, name)
+            self.assertEqual(proxy.headers, elex.get_cache().headers)
+            self.assertEqual(
+                proxy.get_adapter('http://').cache.directory,
+                elex.CACHE_DIRECTORY
+            )
+
+    def test_cache_directory(self):
+        adapter = elex.get_cache().get_adapter('http://')
+        self.assertEqual(adapter.cache.directory, elex.CACHE_DIRECTORY)
+
+
+class TestDeferredImports(unittest.TestCase):
+
+    def test_cli_import_defers_optional_dependencies(self):
+        modules = imported_modules('import elex.cli.app')
+        for module in ('pymongo', 'bson', 'requests', 'dateutil'):
+            self.assertNotIn(module, modules)
+
+    def test_datafile_run_defers_optional_dependencies(self):
+        modules = imported_modules(
+            'import sys\n'
+            'from elex.cli.app import ElexApp\n'
+            'app = ElexApp(argv=["races", "--data-file", '
+            '"tests/data/20151103_national.json"])\n'
+            'app.setup()\n'
+            'app.run()'
+        )
+        for module in ('pymongo', 'bson', 'requests'):
+            self.assertNotIn(module, modules)
@@ -55,6 +55,26 @@ class TestConnecticutRollups(tests.ElectionResultsTestCase):
                 ]
                 self.assertEqual(county.precinctstotal, sum(townships))
 
+    def test_ct_county_candidates_match_townships(self):
+        county_results = [
+            c for c in self.candidate_reporting_units if
+            c.statepostal == "CT" and
+            c.level == "county"
+        ]
+        self.assertNotEqual(len(county_results), 0)
+
+        township_votes = {}
+        for c in self.candidate_reporting_units:
+            if c.statepostal == "CT" and c.level == "township":
+                key = (c.raceid, c.fipscode, c.unique_id)
+                township_votes[key] = township_votes.get(key, 0) + c.votecount
+
+        for c in county_results:
+            self.assertEqual(
+                c.votecount,
+                township_votes[(c.raceid, c.fipscode, c.unique_id)]
+            )
+
 
 class TestRhodeIslandEdgeCaseReportingUnits(tests.ElectionResultsTestCase):
     """
@@ -89,6 +109,19 @@ class TestRhodeIslandEdgeCaseReportingUnits(tests.ElectionResultsTestCase):
             except TypeError:
                 pass
 
+    def test_counties_exclude_mail_ballots(self):
+        for county in self.reporting_units:
+            if county.statepostal != "RI" or county.level != "county":
+                continue
+            townships = [
+                r.votecount for r in self.reporting_units if
+                r.raceid == county.raceid and
+                r.level == "township" and
+                r.fipscode == county.fipscode and
+                "Mail Ballots C.D." not in r.reportingunitname
+            ]
+            self.assertEqual(county.votecount, sum(townships))
+
 
 class TestMaineEdgeCaseReportingUnits(tests.ElectionResultsTestCase):
     """
@@ -0,0 +1,126 @@
+import shutil
+import tempfile
+import tests
+import unittest
+
+from elex.api import Election, parsed_cache
+from elex.api.parsed_cache import ParsedCache, parsed_cache_key
+
+
+class CountingElection(Election):
+    parses = 0
+
+    def get_race_objects(self, parsed_json):
+        CountingElection.parses += 1
+        return super(CountingElection, self).get_race_objects(parsed_json)
+
+
+class FakeResponse(object):
+
+    def __init__(self, url, etag):
+        self.url = url
+        self.headers = {'ETag': etag} if etag else {}
+
+
+class ParsedCacheElectionTestCase(tests.StandInAPITestCase):
+
+    def setUp(self):
+        super(ParsedCacheElectionTestCase, self).setUp()
+        self.previous_cache = parsed_cache._parsed_cache
+        parsed_cache._parsed_cache = ParsedCache()
+        CountingElection.parses = 0
+
+    def tearDown(self):
+        parsed_cache._parsed_cache = self.previous_cache
+        super(ParsedCacheElectionTestCase, self).tearDown()
+
+    def test_304_reuses_parsed_results(self):
+        first = CountingElection(electiondate='2015-11-03').results
+        election = CountingElection(electiondate='2015-11-03')
+        second = election.results
+        self.assertTrue(election._response.from_cache)
+        self.assertEqual(CountingElection.parses, 1)
+        self.assertEqual(len(first), len(second))
+        self.assertIs(first[0], second[0])
+
+    def test_refresh_reuses_parsed_results(self):
+        election = CountingElection(electiondate='2015-11-03')
+        first = election.results
+        election.refresh()
+        second = election.results
+        self.assertEqual(CountingElection.parses, 1)
+        self.assertIs(first[0], second[0])
+        self.assertEqual(
+            [status for path, status in self.server.requests],
+            [200, 304]
+        )
+
+    def test_matches_uncached_results(self):
+        CountingElection(electiondate='2015-11-03').results
+        cached = CountingElection(electiondate='2015-11-03').results
+        expected = Election(datafile='tests/data/20151103_national.json').results
+        self.assertEqual(
+            [r.serialize() for r in cached],
+            [r.serialize() for r in expected]
+        )
+
+    def test_raceids_not_shared(self):
+        CountingElection(electiondate='2015-11-03').results
+        results = CountingElection(electiondate='2015-11-03', raceids=['7583']).results
+        self.assertEqual(CountingElection.parses, 2)
+        self.assertEqual(set(r.raceid for r in results), set(['7583']))
+
+    def test_disabled(self):
+        parsed_cache._parsed_cache = ParsedCache(max_entries=0)
+        CountingElection(electiondate='2015-11-03').results
+        CountingElection(electiondate='2015-11-03').results
+        self.assertEqual(CountingElection.parses, 2)
+
+
+class ParsedCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_least_recently_used_evicted(self):
+        cache = ParsedCache(max_entries=2)
+        cache.set('one', 1)
+        cache.set('two', 2)
+        cache.get('one')
+        cache.set('three', 3)
+        self.assertEqual(cache.get('two'), None)
+        self.assertEqual(cache.get('one'), 1)
+        self.assertEqual(cache.get('three'), 3)
+
+    def test_persisted(self):
+        election = Election(datafile='tests/data/20151103_national.json')
+        units = election.get_units(election.get_race_objects(election.get_raw_races()))
+        ParsedCache(directory=self.directory).set(('key', '"etag"'), units)
+
+        loaded = ParsedCache(directory=self.directory).get(('key', '"etag"'))
+        self.assertEqual(
+            [r.serialize() for r in loaded[2]],
+            [r.serialize() for r in units[2]]
+        )
+        self.assertEqual(ParsedCache(directory=self.directory).get(('key', '"other"')), None)
+
+    def test_persisted_bounded(self):
+        cache = ParsedCache(max_entries=2, directory=self.directory)
+        for i in range(4):
+            cache.set(('key', i), i)
+        self.assertEqual(len(cache._paths()), 2)
+        cache.clear()
+        self.assertEqual(cache._paths(), [])
+
+    def test_key(self):
+        key = parsed_cache_key(
+            FakeResponse('http://localhost/v2/elections/2016-03-01?level=ru&apiKey=secret', '"a"'),
+            '2016-03-01'
+        )
+        self.assertEqual(key[0], 'http://localhost/v2/elections/2016-03-01?level=ru')
+        self.assertEqual(key[1], '"a"')
+        self.assertEqual(key[-1], '2016-03-01')
+        self.assertEqual(parsed_cache_key(FakeResponse('http://localhost/', None)), None)
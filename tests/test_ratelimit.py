@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import tests
+import unittest
+
+from elex.api import ratelimit, utils
+from elex.api.ratelimit import REPORTS, RESULTS, TokenBucket
+
+
+class TokenBucketTestCase(unittest.TestCase):
+
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(2, period=0.5)
+        start = time.time()
+        for i in range(3):
+            self.assertTrue(bucket.acquire())
+        self.assertTrue(time.time() - start >= 0.5)
+
+    def test_never_over_quota_in_a_period(self):
+        bucket = TokenBucket(3, period=0.3)
+        times = []
+        for i in range(9):
+            bucket.acquire()
+            times.append(time.time())
+        for i in range(len(times) - 3):
+            self.assertTrue(times[i + 3] - times[i] >= 0.3)
+
+    def test_timeout(self):
+        bucket = TokenBucket(1, period=10)
+        self.assertTrue(bucket.acquire())
+        self.assertFalse(bucket.acquire(timeout=0.05))
+
+    def test_results_before_reports(self):
+        bucket = TokenBucket(1, period=0.5)
+        bucket.acquire()
+        order = []
+
+        def acquire(priority):
+            bucket.acquire(priority)
+            order.append(priority)
+
+        reports = threading.Thread(target=acquire, args=(REPORTS,))
+        results = threading.Thread(target=acquire, args=(RESULTS,))
+        reports.start()
+        time.sleep(0.05)
+        results.start()
+        reports.join()
+        results.join()
+        self.assertEqual(order, [RESULTS, REPORTS])
+
+    def test_budget(self):
+        bucket = TokenBucket(10)
+        bucket.acquire()
+        bucket.acquire(REPORTS)
+        self.assertEqual(bucket.budget(), {
+            'quota': 10,
+            'available': 8,
+            'waiting_results': 0,
+            'waiting_reports': 0,
+        })
+        bucket.drain()
+        self.assertEqual(bucket.budget()['available'], 0)
+
+    def test_request_priority(self):
+        self.assertEqual(ratelimit.request_priority('/reports/123'), REPORTS)
+        self.assertEqual(ratelimit.request_priority('/elections/2016-03-01'), RESULTS)
+
+
+class SharedTokenBucketTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.directory, 'quota.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_shared_between_buckets(self):
+        first = TokenBucket(2, period=60, state_file=self.state_file)
+        second = TokenBucket(2, period=60, state_file=self.state_file)
+        self.assertTrue(first.acquire())
+        self.assertTrue(second.acquire())
+        self.assertEqual(first.budget()['available'], 0)
+        self.assertFalse(second.acquire(timeout=0.05))
+
+
+class RateLimitedRequestTestCase(tests.StandInAPITestCase):
+    server_options = {'quota': 3, 'quota_window': 1}
+
+    def setUp(self):
+        super(RateLimitedRequestTestCase, self).setUp()
+        self.previous_limiter = ratelimit._limiter
+
+    def tearDown(self):
+        ratelimit._limiter = self.previous_limiter
+        super(RateLimitedRequestTestCase, self).tearDown()
+
+    def test_without_limiter_over_quota_fails(self):
+        ratelimit._limiter = None
+        with self.assertRaises(Exception):
+            for i in range(4):
+                utils.api_request('/elections')
+
+    def test_limiter_delays_instead_of_failing(self):
+        ratelimit._limiter = TokenBucket(3, period=1.1)
+        start = time.time()
+        for i in range(5):
+            utils.api_request('/elections')
+        self.assertTrue(time.time() - start >= 1.1)
+        self.assertEqual(
+            [status for path, status in self.server.requests],
+            [200] + [304] * 4
+        )
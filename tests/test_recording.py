@@ -0,0 +1,392 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+try:
+    import mongomock
+except ImportError:
+    mongomock = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from elex.api import recording
+from elex.api import utils
+
+PAYLOAD = b'{"electionDate": "2016-03-15", "races": []}'
+
+
+class FakeStreamResponse(object):
+
+    def __init__(self, content):
+        self.content = content
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+
+class RecordingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.environ = dict(os.environ)
+        os.environ['ELEX_RECORDING'] = 'flat'
+        os.environ['ELEX_RECORDING_DIR'] = self.directory
+
+    def tearDown(self):
+        recording.get_recorder().flush()
+        os.environ.clear()
+        os.environ.update(self.environ)
+        shutil.rmtree(self.directory)
+
+    def recordings(self):
+        recordings = []
+        for name in sorted(os.listdir(self.directory)):
+            with open(os.path.join(self.directory, name), 'rb') as readfile:
+                recordings.append(readfile.read())
+        return recordings
+
+
+class TestRecorder(RecordingTestCase):
+
+    def test_writes_raw_bytes(self):
+        recorder = recording.Recorder()
+        recorder.record(PAYLOAD, timestamp=1)
+        recorder.flush()
+        self.assertEqual(self.recordings(), [PAYLOAD])
+        path = os.path.join(
+            self.directory,
+            'ap_elections_loader_recording-1.json'
+        )
+        self.assertTrue(os.path.exists(path))
+
+    def test_disabled(self):
+        del os.environ['ELEX_RECORDING']
+        recorder = recording.Recorder()
+        recorder.record(PAYLOAD, timestamp=1)
+        recorder.flush()
+        self.assertEqual(recorder.thread, None)
+        self.assertEqual(self.recordings(), [])
+
+    def test_full_queue_drops(self):
+        writing = threading.Event()
+        release = threading.Event()
+
+        class SlowRecorder(recording.Recorder):
+            def write(self, *args):
+                writing.set()
+                release.wait()
+                super(SlowRecorder, self).write(*args)
+
+        recorder = SlowRecorder(queue_size=1)
+        recorder.record(PAYLOAD, timestamp=1)
+        writing.wait()
+        recorder.record(PAYLOAD, timestamp=2)
+        recorder.record(PAYLOAD, timestamp=3)
+        self.assertEqual(recorder.dropped, 1)
+
+        release.set()
+        recorder.flush()
+        self.assertEqual(len(self.recordings()), 2)
+
+    def test_write_errors_do_not_stop_writer(self):
+        os.environ['ELEX_RECORDING_DIR'] = os.path.join(self.directory, 'missing')
+        recorder = recording.Recorder()
+        recorder.record(PAYLOAD, timestamp=1)
+        recorder.flush()
+        os.environ['ELEX_RECORDING_DIR'] = self.directory
+        recorder.record(PAYLOAD, timestamp=2)
+        recorder.flush()
+        self.assertEqual(self.recordings(), [PAYLOAD])
+
+
+class TestWriteRecording(RecordingTestCase):
+
+    def test_bytes(self):
+        utils.write_recording(PAYLOAD)
+        recording.get_recorder().flush()
+        self.assertEqual(self.recordings(), [PAYLOAD])
+
+    def test_decoded_payload(self):
+        utils.write_recording({'races': []})
+        recording.get_recorder().flush()
+        self.assertEqual(self.recordings(), [b'{"races":[]}'])
+
+    def test_streamed_response(self):
+        chunks = utils.iter_response_chunks(FakeStreamResponse(PAYLOAD), 7)
+        self.assertEqual(''.join(chunks), PAYLOAD.decode('utf-8'))
+        recording.get_recorder().flush()
+        self.assertEqual(self.recordings(), [PAYLOAD])
+
+
+class TestFlatFormats(RecordingTestCase):
+
+    def setUp(self):
+        super(TestFlatFormats, self).setUp()
+        with open('tests/data/20160301_super_tuesday.json', 'rb') as readfile:
+            self.content = readfile.read()
+        self.payload = json.loads(self.content.decode('utf-8'))
+        self.flat_state = {}
+
+    def record(self, timestamp, content=None):
+        recorder = recording.Recorder()
+        recorder.flat_state = self.flat_state
+        recorder.write_flat(timestamp, content or self.content)
+
+    def changed(self, votecount):
+        payload = json.loads(self.content.decode('utf-8'))
+        payload['races'][0]['reportingUnits'][0]['candidates'][0]['voteCount'] = votecount
+        return payload, json.dumps(payload).encode('utf-8')
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def files(self, directory=None):
+        return sorted(os.listdir(directory or self.directory))
+
+    def test_uncompressed(self):
+        self.record(1)
+        self.assertEqual(self.recordings(), [self.content])
+
+    def test_gzip(self):
+        os.environ['ELEX_RECORDING_COMPRESSION'] = 'gzip'
+        self.record(1)
+        self.assertEqual(self.files(), ['ap_elections_loader_recording-1.json.gz'])
+        self.assertTrue(
+            os.path.getsize(self.path('ap_elections_loader_recording-1.json.gz')) <
+            len(self.content) / 5
+        )
+        self.assertEqual(
+            recording.read_recording(self.path('ap_elections_loader_recording-1.json.gz')),
+            self.payload
+        )
+
+    @unittest.skipIf(zstandard is None, 'zstandard is not installed')
+    def test_zstd(self):
+        os.environ['ELEX_RECORDING_COMPRESSION'] = 'zstd'
+        self.record(1)
+        self.assertEqual(
+            recording.read_recording(self.path('ap_elections_loader_recording-1.json.zst')),
+            self.payload
+        )
+
+    def test_dedupe(self):
+        os.environ['ELEX_RECORDING_COMPRESSION'] = 'gzip'
+        os.environ['ELEX_RECORDING_DEDUPE'] = '1'
+        changed, changed_content = self.changed(12345)
+        self.record(1)
+        self.record(2)
+        self.record(3, changed_content)
+        self.record(4)
+
+        self.assertEqual(self.files(), [
+            'ap_elections_loader_recording-1.ref',
+            'ap_elections_loader_recording-2.ref',
+            'ap_elections_loader_recording-3.ref',
+            'ap_elections_loader_recording-4.ref',
+            'objects',
+        ])
+        self.assertEqual(len(self.files(self.path('objects'))), 2)
+        for timestamp, payload in ((1, self.payload), (2, self.payload), (3, changed), (4, self.payload)):
+            path = self.path('ap_elections_loader_recording-{0}.ref'.format(timestamp))
+            self.assertEqual(recording.read_recording(path), payload)
+
+    def test_deltas(self):
+        os.environ['ELEX_RECORDING_COMPRESSION'] = 'gzip'
+        os.environ['ELEX_RECORDING_DEDUPE'] = '1'
+        os.environ['ELEX_RECORDING_DELTAS'] = '2'
+        payloads = [self.payload]
+        self.record(1)
+        for timestamp in (2, 3, 4):
+            payload, content = self.changed(timestamp)
+            payloads.append(payload)
+            self.record(timestamp, content)
+        self.record(5, content)
+
+        self.assertEqual(self.files(), [
+            'ap_elections_loader_recording-1.ref',
+            'ap_elections_loader_recording-2.delta.json.gz',
+            'ap_elections_loader_recording-3.delta.json.gz',
+            'ap_elections_loader_recording-4.ref',
+            'ap_elections_loader_recording-5.ref',
+            'objects',
+            'recording_state.json',
+        ])
+        self.assertEqual(
+            recording.read_recording(self.path('ap_elections_loader_recording-3.delta.json.gz')),
+            payloads[2]
+        )
+        self.assertTrue(
+            os.path.getsize(self.path('ap_elections_loader_recording-3.delta.json.gz')) < 200
+        )
+        for timestamp in (1, 4, 5):
+            path = self.path('ap_elections_loader_recording-{0}.ref'.format(timestamp))
+            self.assertEqual(
+                recording.read_recording(path),
+                payloads[min(timestamp, 4) - 1]
+            )
+
+    def test_deltas_across_recorders(self):
+        # One recorder per process, as when elex is run for each poll.
+        os.environ['ELEX_RECORDING_COMPRESSION'] = 'gzip'
+        os.environ['ELEX_RECORDING_DELTAS'] = '2'
+        payloads = [self.payload]
+        recording.Recorder().write_flat(1, self.content)
+        for timestamp in (2, 3, 4):
+            payload, content = self.changed(timestamp)
+            payloads.append(payload)
+            recording.Recorder().write_flat(timestamp, content)
+
+        self.assertEqual(self.files(), [
+            'ap_elections_loader_recording-1.json.gz',
+            'ap_elections_loader_recording-2.delta.json.gz',
+            'ap_elections_loader_recording-3.delta.json.gz',
+            'ap_elections_loader_recording-4.json.gz',
+            'recording_state.json',
+        ])
+        for timestamp, path in recording.iter_recordings(self.directory):
+            self.assertEqual(recording.read_recording(path), payloads[timestamp - 1])
+
+    def test_deltas_missing_base(self):
+        os.environ['ELEX_RECORDING_DELTAS'] = '2'
+        recording.Recorder().write_flat(1, self.content)
+        os.remove(self.path('ap_elections_loader_recording-1.json'))
+        recording.Recorder().write_flat(2, self.changed(2)[1])
+        self.assertEqual(self.files(), [
+            'ap_elections_loader_recording-2.json',
+            'recording_state.json',
+        ])
+
+    def test_read_recording_content(self):
+        os.environ['ELEX_RECORDING_COMPRESSION'] = 'gzip'
+        os.environ['ELEX_RECORDING_DEDUPE'] = '1'
+        self.record(1)
+        self.record(2)
+        for name in ('ap_elections_loader_recording-1.ref', 'ap_elections_loader_recording-2.ref'):
+            self.assertEqual(
+                recording.read_recording_content(self.path(name)),
+                self.content
+            )
+
+    def test_recording_election_date(self):
+        os.environ['ELEX_RECORDING_COMPRESSION'] = 'gzip'
+        os.environ['ELEX_RECORDING_DELTAS'] = '1'
+        self.record(1)
+        self.record(2, self.changed(2)[1])
+        for name in ('ap_elections_loader_recording-1.json.gz', 'ap_elections_loader_recording-2.delta.json.gz'):
+            self.assertEqual(
+                recording.recording_election_date(self.path(name)),
+                '2016-03-01'
+            )
+
+        with open('tests/data/00000000_elections.json', 'rb') as readfile:
+            self.record(3, readfile.read())
+        self.assertIsNone(
+            recording.recording_election_date(self.path('ap_elections_loader_recording-3.json.gz'))
+        )
+
+
+class TestIterRecordings(RecordingTestCase):
+
+    def test_timestamp_order(self):
+        for name in ('ap_elections_loader_recording-20.ref',
+                     'ap_elections_loader_recording-3.json.gz',
+                     'ap_elections_loader_recording-100.delta.json',
+                     'unrelated.json'):
+            open(os.path.join(self.directory, name), 'w').close()
+        os.mkdir(os.path.join(self.directory, 'objects'))
+        self.assertEqual(
+            [(t, os.path.basename(p)) for t, p in recording.iter_recordings(self.directory)],
+            [(3, 'ap_elections_loader_recording-3.json.gz'),
+             (20, 'ap_elections_loader_recording-20.ref'),
+             (100, 'ap_elections_loader_recording-100.delta.json')]
+        )
+
+
+class TestJSONDiff(unittest.TestCase):
+
+    def assertRoundTrip(self, old, new):
+        ops = recording.json_diff(old, new)
+        self.assertEqual(recording.apply_delta(json.loads(json.dumps(old)), ops), new)
+        return ops
+
+    def test_unchanged(self):
+        self.assertEqual(self.assertRoundTrip({'a': [1, 2]}, {'a': [1, 2]}), [])
+
+    def test_nested_change(self):
+        ops = self.assertRoundTrip(
+            {'races': [{'id': 1, 'votes': 10}, {'id': 2, 'votes': 20}]},
+            {'races': [{'id': 1, 'votes': 10}, {'id': 2, 'votes': 25}]}
+        )
+        self.assertEqual(ops, [['replace', ['races', 1, 'votes'], 25]])
+
+    def test_added_and_removed_keys(self):
+        self.assertRoundTrip({'a': 1, 'b': 2}, {'a': 1, 'c': 3})
+
+    def test_resized_list(self):
+        ops = self.assertRoundTrip({'a': [1, 2]}, {'a': [1, 2, 3]})
+        self.assertEqual(ops, [['replace', ['a'], [1, 2, 3]]])
+
+    def test_type_change(self):
+        ops = self.assertRoundTrip({'a': 1}, {'a': True})
+        self.assertEqual(ops, [['replace', ['a'], True]])
+
+    def test_root_replaced(self):
+        self.assertRoundTrip([1], {'a': 1})
+
+
+@unittest.skipIf(mongomock is None, 'mongomock is not installed')
+class TestMongoDBRecorder(RecordingTestCase):
+
+    def setUp(self):
+        super(TestMongoDBRecorder, self).setUp()
+        os.environ['ELEX_RECORDING'] = 'mongodb'
+        self.client = mongomock.MongoClient()
+        self.recorder = recording.Recorder(mongodb_client=self.client)
+
+    def collection(self):
+        return self.client['ap_elections_loader'].elex_recording
+
+    def test_batched_inserts(self):
+        for timestamp in range(5):
+            self.recorder.record(PAYLOAD, timestamp=timestamp)
+        self.recorder.flush()
+        documents = list(self.collection().find().sort('time'))
+        self.assertEqual([d['time'] for d in documents], list(range(5)))
+        self.assertEqual(documents[0]['data'], json.loads(PAYLOAD.decode('utf-8')))
+        self.assertIs(self.recorder.mongodb_client, self.client)
+
+    def test_write_batch_single_insert(self):
+        inserts = []
+        collection = self.recorder.get_mongodb_collection()
+        insert_many = collection.insert_many
+
+        def counting_insert_many(documents, **kwargs):
+            inserts.append((len(documents), kwargs))
+            return insert_many(documents, **kwargs)
+
+        collection.insert_many = counting_insert_many
+        self.recorder.write_batch([('mongodb', t, PAYLOAD) for t in range(3)])
+        self.assertEqual(inserts, [(3, {'ordered': False})])
+
+    def test_compressed_payload(self):
+        os.environ['ELEX_RECORDING_MONGO_COMPRESSION'] = 'gzip'
+        self.recorder.record(PAYLOAD, timestamp=1)
+        self.recorder.flush()
+        document = self.collection().find_one()
+        self.assertEqual(document['encoding'], 'gzip')
+        self.assertEqual(
+            recording.read_mongodb_recording(document),
+            json.loads(PAYLOAD.decode('utf-8'))
+        )
+
+    def test_write_concern(self):
+        os.environ['ELEX_RECORDING_MONGO_WRITE_CONCERN'] = 'majority'
+        collection = self.recorder.get_mongodb_collection()
+        self.assertEqual(collection.write_concern.document, {'w': 'majority'})
@@ -0,0 +1,141 @@
+import json
+import threading
+import unittest
+
+from elex.api import DelegateReport, USGovernorTrendReport, USSenateTrendReport, utils
+
+REPORTS = [
+    {'title': 'Trend / s / test / US', 'id': 'http://localhost/v2/reports/senate-test'},
+    {'title': 'Delegates / delsum', 'id': 'http://localhost/v2/reports/delsum'},
+    {'title': 'Delegates / delsuper', 'id': 'http://localhost/v2/reports/delsuper'},
+    {'title': 'Trend / g / US', 'id': 'http://localhost/v2/reports/gov'},
+    {'title': 'Trend / s / US', 'id': 'http://localhost/v2/reports/senate'},
+]
+
+REPORT_FILES = {
+    '/reports/delsum': 'tests/data/20160118_delsum.json',
+    '/reports/delsuper': 'tests/data/20160118_delsuper.json',
+    '/reports/gov': 'tests/data/20160818_gov_trends.json',
+    '/reports/senate': 'tests/data/20160818_senate_trends.json',
+    '/reports/senate-test': 'tests/data/20160818_senate_trends.json',
+}
+
+
+class FakeResponse(object):
+    ok = True
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class ReportsCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.params = []
+        self.fetching = threading.Event()
+        self.release = threading.Event()
+        self.api_request = utils.api_request
+        self.ttl = utils.REPORTS_CACHE_TTL
+        utils.api_request = self.fake_api_request
+        utils.clear_reports_cache()
+
+    def tearDown(self):
+        utils.api_request = self.api_request
+        utils.REPORTS_CACHE_TTL = self.ttl
+        utils.clear_reports_cache()
+
+    def fake_api_request(self, path, **params):
+        self.requests.append(path)
+        self.params.append(params)
+        if params.get('blocked'):
+            self.fetching.set()
+            self.release.wait(5)
+        if path == '/reports':
+            return FakeResponse({'reports': REPORTS})
+        with open(REPORT_FILES[path]) as readfile:
+            return FakeResponse(json.load(readfile))
+
+    def test_listing_fetched_once(self):
+        DelegateReport()
+        USGovernorTrendReport()
+        USSenateTrendReport()
+        self.assertEqual(self.requests.count('/reports'), 1)
+
+    def test_listing_refetched_after_ttl(self):
+        utils.REPORTS_CACHE_TTL = 0
+        utils.get_reports()
+        utils.get_reports()
+        self.assertEqual(self.requests.count('/reports'), 2)
+
+    def test_listing_cached_per_params(self):
+        utils.get_reports()
+        utils.get_reports(params={'test': True})
+        self.assertEqual(self.requests.count('/reports'), 2)
+
+    def test_test_false_not_sent(self):
+        utils.get_reports(params={'test': False})
+        utils.get_reports()
+        self.assertEqual(self.params, [{}])
+
+    def test_listings_fetched_independently(self):
+        thread = threading.Thread(
+            target=utils.get_reports, kwargs={'params': {'blocked': True}}
+        )
+        thread.start()
+        try:
+            self.assertTrue(self.fetching.wait(5))
+            # Not held up by the listing still being fetched.
+            self.assertEqual(utils.get_reports(), REPORTS)
+        finally:
+            self.release.set()
+            thread.join()
+        self.assertEqual(self.requests.count('/reports'), 2)
+
+    def test_concurrent_fetches_share_request(self):
+        params = {'blocked': True}
+        threads = [
+            threading.Thread(target=utils.get_reports, kwargs={'params': params})
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(self.fetching.wait(5))
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.requests.count('/reports'), 1)
+
+    def test_report_id(self):
+        self.assertEqual(utils.get_report_id('Delegates / delsum'), 'delsum')
+        self.assertEqual(utils.get_report_id('No such report'), None)
+
+    def test_first_listed_title_wins(self):
+        report_id = utils.get_report_id(['Trend / s / US', 'Trend / s / test / US'])
+        self.assertEqual(report_id, 'senate-test')
+
+    def test_report_id_from_listing(self):
+        self.assertEqual(utils.get_report_id('Trend / g / US', reports=REPORTS[:3]), None)
+        self.assertEqual(utils.get_report_id('Trend / g / US', reports=REPORTS), 'gov')
+        self.assertEqual(self.requests, [])
+
+    def test_report_get_report_id(self):
+        delegates = DelegateReport()
+        senate = USSenateTrendReport()
+        self.requests = []
+        self.assertEqual(delegates.get_report_id(REPORTS, 'delSuper'), 'delsuper')
+        self.assertEqual(delegates.get_report_id(REPORTS, 'delNone'), None)
+        self.assertEqual(senate.get_report_id(REPORTS, 's'), 'senate-test')
+        self.assertEqual(senate.get_report_id(REPORTS, 'g'), None)
+        self.assertEqual(self.requests, [])
+
+    def test_reports_resolved_through_cache(self):
+        DelegateReport()
+        USGovernorTrendReport()
+        self.assertEqual(
+            self.requests,
+            ['/reports', '/reports/delsum', '/reports/delsuper', '/reports/gov']
+        )
@@ -76,3 +76,43 @@ class TestGeneralElectionEdgeCases(tests.ElectionResultsTestCase):
             if r.officeid == 'P' and r.level == 'state' and r.last == 'Romney' and r.statepostal == 'AK'
         ][0]
         self.assertEqual(r.electtotal, 3)
+
+
+class TestElectionParseCache(tests.ElectionResultsTestCase):
+    """
+    Properties on a single Election should share one parsed payload.
+    """
+    def setUp(self, **kwargs):
+        super(TestElectionParseCache, self).setUp(**kwargs)
+        self.election.refresh()
+        self.fetches = []
+        get_raw_races = self.election.get_raw_races
+
+        def counting_get_raw_races(**params):
+            self.fetches.append(params)
+            return get_raw_races(**params)
+
+        self.election.get_raw_races = counting_get_raw_races
+
+    def test_properties_parse_once(self):
+        self.election.races
+        self.election.reporting_units
+        self.election.results
+        self.election.candidates
+        self.election.ballot_measures
+        self.assertEqual(len(self.fetches), 1)
+
+    def test_properties_share_objects(self):
+        results = self.election.results
+        candidate_reporting_units = self.election.candidate_reporting_units
+        self.assertIs(results[0], candidate_reporting_units[0])
+
+    def test_cached_lists_are_copies(self):
+        self.election.results.pop()
+        self.assertEqual(len(self.election.results), len(self.results))
+
+    def test_refresh_reparses(self):
+        self.election.results
+        self.election.refresh()
+        self.election.results
+        self.assertEqual(len(self.fetches), 2)
@@ -0,0 +1,69 @@
+from elex.api.models import CandidateReportingUnit
+from elex.cli.utils import get_rows
+import tests
+
+
+class TestRows(tests.ElectionResultsTestCase):
+    data_url = 'tests/data/20160426_ct_rollups.json'
+
+    def assertRowsMatchSerialize(self, objs):
+        self.assertNotEqual(len(objs), 0)
+        for obj in objs:
+            self.assertEqual(tuple(obj.serialize().keys()), obj.columns)
+            self.assertEqual(obj.row(), tuple(obj.serialize().values()))
+
+    def test_races(self):
+        self.assertRowsMatchSerialize(self.races)
+
+    def test_reporting_units(self):
+        self.assertRowsMatchSerialize(self.reporting_units)
+
+    def test_results(self):
+        self.assertRowsMatchSerialize(self.results)
+
+    def test_results_rows(self):
+        self.assertEqual(
+            CandidateReportingUnit.rows(self.results),
+            [r.row() for r in self.results]
+        )
+
+    def test_candidates(self):
+        self.assertRowsMatchSerialize(self.candidates)
+
+    def test_election(self):
+        self.assertRowsMatchSerialize([self.election])
+
+
+class TestBallotMeasureRows(TestRows):
+    data_url = 'tests/data/20151103_national.json'
+
+    def test_ballot_measures(self):
+        self.assertRowsMatchSerialize(self.ballot_measures)
+
+
+class TestGetRows(tests.ElectionResultsTestCase):
+
+    def test_rows(self):
+        columns, rows = get_rows(self.results)
+        self.assertEqual(columns, list(self.results[0].columns))
+        self.assertEqual(list(rows), [r.row() for r in self.results])
+
+    def test_extra_columns(self):
+        columns, rows = get_rows(self.results, with_timestamp=True, batch_name='batch-01')
+        self.assertEqual(columns[-2:], ['timestamp', 'batchname'])
+        row = next(rows)
+        self.assertEqual(row[:-2], self.results[0].row())
+        self.assertEqual(row[-1], 'batch-01')
+        self.assertTrue(row[-2].isdigit())
+
+
+class TestGetRowsSerialized(tests.TrendReportTestCase):
+
+    def test_objects_without_columns(self):
+        parties = self.governor_trends.parties
+        columns, rows = get_rows(parties, batch_name='batch-01')
+        self.assertEqual(columns, list(parties[0].serialize().keys()) + ['batchname'])
+        self.assertEqual(
+            list(rows),
+            [tuple(p.serialize().values()) + ('batch-01',) for p in parties]
+        )
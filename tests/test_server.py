@@ -0,0 +1,145 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import tests
+import unittest
+
+import requests
+from elex.api import DelegateReport, Election, Elections, USHouseTrendReport, utils
+from elex.cli.app import ElexApp
+from elex.server import StandInServer
+
+DATA_FILE = 'tests/data/20151103_national.json'
+
+
+class StandInServerTestCase(tests.StandInAPITestCase):
+
+    def test_election_results(self):
+        election = Election(electiondate='2015-11-03')
+        expected = Election(datafile=DATA_FILE)
+        self.assertEqual(
+            [r.serialize() for r in election.results],
+            [r.serialize() for r in expected.results]
+        )
+
+    def test_elections(self):
+        elections = Elections().get_elections()
+        self.assertTrue(len(elections) > 0)
+
+    def test_reports(self):
+        delegates = DelegateReport()
+        self.assertTrue(len(delegates.candidate_objects) > 0)
+        house = USHouseTrendReport()
+        self.assertEqual(house.parties[0].office, 'U.S. House')
+
+    def test_etag_revalidation(self):
+        first = utils.api_request('/elections/2015-11-03')
+        second = utils.api_request('/elections/2015-11-03')
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(
+            [status for path, status in self.server.requests],
+            [200, 304]
+        )
+        self.assertEqual(second.content, first.content)
+
+    def test_cache_headers(self):
+        response = requests.get(self.server.base_url + '/elections/2015-11-03')
+        self.assertIn('max-age=30', response.headers['Cache-Control'])
+        self.assertTrue(response.headers['ETag'])
+
+    def test_version_prefix_optional(self):
+        url = self.server.base_url.rsplit('/', 1)[0]
+        for path in ('/elections/2015-11-03', '/v2/elections/2015-11-03', '/v3/elections/2015-11-03/'):
+            self.assertEqual(requests.get(url + path).status_code, 200)
+
+    def test_not_found(self):
+        response = requests.get(self.server.base_url + '/elections/1999-01-01')
+        self.assertEqual(response.status_code, 404)
+
+
+class StandInServerQuotaTestCase(tests.StandInAPITestCase):
+    server_options = {'quota': 10}
+
+    def test_quota(self):
+        statuses = [
+            requests.get(self.server.base_url + '/elections').status_code
+            for i in range(11)
+        ]
+        self.assertEqual(statuses, [200] * 10 + [403])
+
+    def test_api_request_raises(self):
+        for i in range(10):
+            requests.get(self.server.base_url + '/elections')
+        with self.assertRaises(requests.exceptions.HTTPError) as context:
+            utils.api_request('/elections')
+        self.assertEqual(context.exception.response.status_code, 403)
+
+
+class StandInServerLatencyTestCase(tests.StandInAPITestCase):
+    server_options = {'latency': 0.1}
+
+    def test_latency(self):
+        start = time.time()
+        requests.get(self.server.base_url + '/elections')
+        self.assertTrue(time.time() - start >= 0.1)
+
+
+class StandInServerRecordingsTestCase(tests.StandInAPITestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.recording_dir = tempfile.mkdtemp()
+        with open(DATA_FILE) as readfile:
+            payload = json.load(readfile)
+        for timestamp, votecount in ((1, 100), (2, 200)):
+            payload['races'][0]['reportingUnits'][0]['candidates'][0]['voteCount'] = votecount
+            path = os.path.join(
+                cls.recording_dir,
+                'ap_elections_loader_recording-{0}.json'.format(timestamp)
+            )
+            with open(path, 'w') as writefile:
+                json.dump(payload, writefile, indent=2)
+        cls.server = StandInServer(recording_dir=cls.recording_dir).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        super(StandInServerRecordingsTestCase, cls).tearDownClass()
+        shutil.rmtree(cls.recording_dir)
+
+    def test_recordings_in_order(self):
+        votecounts = []
+        for i in range(3):
+            response = utils.api_request('/elections/2015-11-03')
+            if i == 0:
+                path = os.path.join(self.recording_dir, 'ap_elections_loader_recording-1.json')
+                with open(path, 'rb') as readfile:
+                    # Recordings are served as recorded.
+                    self.assertEqual(response.content, readfile.read())
+            payload = response.json()
+            votecounts.append(
+                payload['races'][0]['reportingUnits'][0]['candidates'][0]['voteCount']
+            )
+        self.assertEqual(votecounts, [100, 200, 200])
+        self.assertEqual(
+            [status for path, status in self.server.requests],
+            [200, 200, 304]
+        )
+
+
+class StandInServerDataDirTestCase(unittest.TestCase):
+
+    def test_missing_data_dir(self):
+        data_dir = os.path.join(tempfile.gettempdir(), 'elex-missing-fixtures')
+        self.assertRaises(IOError, StandInServer, data_dir=data_dir)
+
+    def test_serve_missing_data_dir(self):
+        data_dir = os.path.join(tempfile.gettempdir(), 'elex-missing-fixtures')
+        app = ElexApp(argv=['serve', '--data-dir', data_dir, '--port', '0'])
+        app.setup()
+        app.log.set_level('FATAL')
+        with self.assertRaises(SystemExit) as context:
+            app.run()
+        self.assertEqual(context.exception.code, 1)
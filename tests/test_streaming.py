@@ -0,0 +1,102 @@
+import json
+import unittest
+
+from elex.api import Election, utils
+
+DATA_FILES = [
+    'tests/data/20151103_national.json',
+    'tests/data/20151103_national_initialization.json',
+    'tests/data/20160301_super_tuesday.json',
+    'tests/data/20160426_ct_rollups.json',
+    'tests/data/20160426-ri_mail_ballots.json',
+]
+PRE_RESULTS_DATA_FILE = 'tests/data/20161100_national_pre_results.json'
+
+
+class TestStreamJSONArray(unittest.TestCase):
+    data_url = 'tests/data/20160426-ri_mail_ballots.json'
+
+    def setUp(self):
+        with open(self.data_url, 'r') as readfile:
+            self.text = readfile.read()
+        self.payload = json.loads(self.text)
+
+    def _stream(self, chunk_size):
+        chunks = [
+            self.text[i:i + chunk_size]
+            for i in range(0, len(self.text), chunk_size)
+        ]
+        meta = {}
+        races = list(utils.stream_json_array(chunks, 'races', meta))
+        return races, meta
+
+    def test_races_match_full_parse(self):
+        for chunk_size in [1, 13, 4096, len(self.text)]:
+            races, meta = self._stream(chunk_size)
+            self.assertEqual(races, self.payload['races'])
+
+    def test_meta_collected(self):
+        races, meta = self._stream(13)
+        self.assertEqual(meta['electionDate'], self.payload['electionDate'])
+        self.assertNotIn('races', meta)
+
+    def test_number_split_across_chunks(self):
+        chunks = ['{"a": 12', '3, "races": [1, 22', '2], "b": 4', '5}']
+        meta = {}
+        races = list(utils.stream_json_array(chunks, 'races', meta))
+        self.assertEqual(races, [1, 222])
+        self.assertEqual(meta, {'a': 123, 'b': 45})
+
+    def test_empty_array(self):
+        races = list(utils.stream_json_array(['{"races": [ ]}'], 'races'))
+        self.assertEqual(races, [])
+
+    def test_truncated_input(self):
+        with self.assertRaises(ValueError):
+            list(utils.stream_json_array(['{"races": [{"a": 1'], 'races'))
+
+
+class TestIterRaceObjects(unittest.TestCase):
+
+    def _serialize_units(self, election, race_objs):
+        return [
+            [obj.serialize() for obj in units]
+            for units in election.get_units(race_objs)
+        ]
+
+    def test_streamed_races_match_parsed_races(self):
+        for data_url in DATA_FILES:
+            election = Election(datafile=data_url)
+            expected = self._serialize_units(
+                election,
+                election.get_race_objects(election.get_raw_races())
+            )
+
+            election = Election(datafile=data_url)
+            streamed = self._serialize_units(
+                election,
+                list(election.iter_race_objects())
+            )
+            self.assertEqual(streamed, expected)
+
+    def test_streamed_electiondate(self):
+        election = Election(datafile=DATA_FILES[0])
+        next(election.iter_race_objects())
+        self.assertEqual(election.electiondate, '2015-11-03')
+
+    def test_streamed_electiondate_after_races(self):
+        # electionDate follows the races in this payload.
+        election = Election(datafile=PRE_RESULTS_DATA_FILE)
+        expected = self._serialize_units(
+            election,
+            election.get_race_objects(election.get_raw_races())
+        )
+        election = Election(datafile=PRE_RESULTS_DATA_FILE)
+        races = list(election.iter_race_objects())
+        self.assertEqual(election.electiondate, '2016-11-08')
+        self.assertEqual(self._serialize_units(election, races), expected)
+
+    def test_streamed_raceids(self):
+        election = Election(datafile=DATA_FILES[0], raceids=['7583'])
+        races = list(election.iter_race_objects())
+        self.assertEqual([r.raceid for r in races], ['7583'])
@@ -0,0 +1,110 @@
+from collections import OrderedDict
+import unittest
+
+from elex.api import Election
+from elex.api.table import ResultsTable
+
+DATA_FILES = [
+    'tests/data/20151103_national.json',
+    'tests/data/20151103_national_initialization.json',
+    'tests/data/20160426_ct_rollups.json',
+]
+
+
+class TestResultsTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = ResultsTable(types={'votecount': int, 'winner': bool, 'votepct': float})
+        self.table.extend([
+            OrderedDict((('party', 'Dem'), ('votecount', 10), ('winner', True), ('votepct', 0.5))),
+            OrderedDict((('party', 'GOP'), ('votecount', 2 ** 40), ('winner', False), ('votepct', 0.25))),
+            OrderedDict((('party', 'Dem'), ('votecount', None), ('winner', False), ('votepct', 0.25))),
+        ])
+
+    def test_columns(self):
+        self.assertEqual(self.table.columns, ['party', 'votecount', 'winner', 'votepct'])
+        self.assertEqual(len(self.table), 3)
+
+    def test_values_round_trip(self):
+        self.assertEqual(self.table.column('party'), ['Dem', 'GOP', 'Dem'])
+        self.assertEqual(self.table.column('votecount'), [10, 2 ** 40, None])
+        self.assertEqual(self.table.column('winner'), [True, False, False])
+        self.assertIs(self.table.column('winner')[0], True)
+        self.assertEqual(self.table.row(-1)['votepct'], 0.25)
+        self.assertIsNone(self.table.row(2)['votecount'])
+
+    def test_typed_columns(self):
+        self.assertEqual(self.table.array('votepct').typecode, 'd')
+        self.assertEqual(self.table.array('winner').tolist(), [1, 0, 0])
+        self.assertEqual(self.table.categories('winner'), None)
+
+    def test_null_mask(self):
+        # Missing values don't change a typed column's type.
+        self.assertEqual(self.table.array('votecount').tolist(), [10, 2 ** 40, 0])
+        self.assertEqual(self.table.mask('votecount').tolist(), [0, 0, 1])
+        self.assertIsNone(self.table.mask('winner'))
+        self.table.append(['Dem', 5, True, 0.1])
+        self.assertEqual(self.table.mask('votecount').tolist(), [0, 0, 1, 0])
+
+    def test_wrong_type(self):
+        with self.assertRaises(TypeError):
+            self.table.extend([['Dem', 1, True, 0.5], ['GOP', '2', False, 0.5]])
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.column('votecount'), [10, 2 ** 40, None])
+        self.assertEqual(self.table.column('party'), ['Dem', 'GOP', 'Dem'])
+
+    def test_wrong_length(self):
+        with self.assertRaises(ValueError):
+            self.table.append(['Dem', 1, True])
+
+    def test_dictionary_encoded_columns(self):
+        self.assertEqual(self.table.categories('party'), ['Dem', 'GOP'])
+        self.assertEqual(self.table.array('party').tolist(), [0, 1, 0])
+
+    def test_codes_widen(self):
+        table = ResultsTable(['id'])
+        table.extend([[str(i)] for i in range(300)])
+        table.compact()
+        table.append(['0'])
+        self.assertEqual(table.array('id').typecode, 'H')
+        self.assertEqual(table.column('id')[-2:], ['299', '0'])
+        self.assertEqual(len(table.categories('id')), 300)
+
+    def test_unknown_column(self):
+        with self.assertRaises(KeyError):
+            self.table.column('nope')
+
+    def test_empty(self):
+        table = ResultsTable(['party'])
+        self.assertEqual(table.column('party'), [])
+        self.assertEqual(list(table.rows()), [])
+
+
+class TestElectionResultsTable(unittest.TestCase):
+
+    def test_matches_results(self):
+        for datafile in DATA_FILES:
+            results = Election(electiondate='2015-11-03', datafile=datafile).results
+            table = Election(electiondate='2015-11-03', datafile=datafile).results_table()
+            self.assertEqual(len(table), len(results))
+            self.assertEqual(
+                list(table.rows()),
+                [r.serialize() for r in results]
+            )
+
+    def test_raceids(self):
+        election = Election(
+            electiondate='2015-11-03',
+            datafile='tests/data/20151103_national.json',
+            raceids=['7582']
+        )
+        table = election.results_table()
+        self.assertEqual(set(table.column('raceid')), set(['7582']))
+        self.assertEqual(len(table), len(election.results))
+
+    def test_schema(self):
+        table = Election(datafile=DATA_FILES[0]).results_table()
+        self.assertEqual(table.array('votecount').typecode, 'i')
+        self.assertEqual(table.array('votepct').typecode, 'd')
+        self.assertEqual(table.array('winner').typecode, 'b')
+        self.assertEqual(table.categories('votecount'), None)
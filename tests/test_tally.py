@@ -0,0 +1,70 @@
+import json
+import unittest
+
+from elex.api import Election, tally
+from elex.api.models import Race, ReportingUnit
+
+
+class TestTally(unittest.TestCase):
+
+    def unit(self, votes, **kwargs):
+        candidates = [
+            {'first': 'A', 'last': str(i), 'polID': str(i), 'voteCount': v}
+            for i, v in enumerate(votes)
+        ]
+        return ReportingUnit(candidates=candidates, defer_tally=True, **kwargs)
+
+    def test_defer_tally(self):
+        unit = self.unit([1, 3])
+        self.assertEqual(unit.votecount, 0)
+        self.assertEqual([c.votepct for c in unit.candidates], [0.0, 0.0])
+
+    def test_tally_units(self):
+        units = [
+            self.unit([1, 3]),
+            self.unit([0, 0]),
+            self.unit([5], uncontested=True),
+            self.unit([], votecount=7),
+        ]
+        tally.tally_units(units)
+        self.assertEqual([u.votecount for u in units], [4, 0, None, 7])
+        self.assertEqual([c.votepct for c in units[0].candidates], [0.25, 0.75])
+        self.assertEqual([c.votepct for c in units[1].candidates], [0.0, 0.0])
+        self.assertEqual(units[2].candidates[0].votepct, 0.0)
+
+    def test_matches_reporting_unit(self):
+        votes = [123457, 98765, 4321, 1]
+        deferred = self.unit(votes)
+        tally.tally_units([deferred])
+        tallied = ReportingUnit(candidates=[
+            {'first': 'A', 'last': str(i), 'polID': str(i), 'voteCount': v}
+            for i, v in enumerate(votes)
+        ])
+        self.assertEqual(deferred.votecount, tallied.votecount)
+        self.assertEqual(
+            [c.votepct for c in deferred.candidates],
+            [c.votepct for c in tallied.candidates]
+        )
+
+    def test_reporting_pct(self):
+        self.assertEqual(tally.reporting_pct(1, 4), 0.25)
+        self.assertEqual(tally.reporting_pct(0, 0), 0.0)
+
+    def test_election_matches_races(self):
+        with open('tests/data/20160426_ct_rollups.json') as readfile:
+            content = readfile.read()
+
+        election = Election(electiondate='2016-04-26')
+        batched = election.get_race_objects(json.loads(content))
+        separate = [Race(**r) for r in json.loads(content)['races']]
+
+        self.assertEqual(len(batched), len(separate))
+        for a, b in zip(batched, separate):
+            self.assertEqual(
+                [u.serialize() for u in a.reportingunits],
+                [u.serialize() for u in b.reportingunits]
+            )
+            self.assertEqual(
+                [c.serialize() for u in a.reportingunits for c in u.candidates],
+                [c.serialize() for u in b.reportingunits for c in u.candidates]
+            )
@@ -0,0 +1,67 @@
+import time
+import unittest
+
+import tests
+from elex.api import timings
+
+
+class TestTimings(unittest.TestCase):
+
+    def tearDown(self):
+        timings.disable()
+
+    def test_disabled(self):
+        stage = timings.stage('races')
+        self.assertIs(stage, timings.NULL_STAGE)
+        with stage:
+            stage.count = 10
+        self.assertEqual(stage.count, None)
+        self.assertEqual(timings.get_timings(), None)
+
+    def test_stage_totals(self):
+        recorded = timings.enable()
+        for count in (2, 3):
+            with timings.stage('races') as stage:
+                time.sleep(0.01)
+                stage.count = count
+        with timings.stage('fetch'):
+            pass
+
+        totals = recorded.serialize()
+        self.assertEqual(list(totals.keys()), ['races', 'fetch'])
+        self.assertEqual(totals['races']['calls'], 2)
+        self.assertEqual(totals['races']['count'], 5)
+        self.assertTrue(totals['races']['wall_ms'] >= 20)
+        self.assertEqual(totals['fetch']['count'], None)
+
+    def test_relabel(self):
+        recorded = timings.enable()
+        with timings.stage('fetch') as stage:
+            stage.name = 'fetch (cached)'
+        self.assertEqual(list(recorded.serialize().keys()), ['fetch (cached)'])
+
+    def test_enable_resets(self):
+        timings.enable()
+        with timings.stage('races'):
+            pass
+        self.assertEqual(timings.enable().serialize(), {})
+
+
+class TestFetchTimings(tests.StandInAPITestCase):
+
+    def tearDown(self):
+        timings.disable()
+        super(TestFetchTimings, self).tearDown()
+
+    def test_fetch_and_parse_stages(self):
+        from elex.api import Election
+
+        recorded = timings.enable()
+        for i in range(2):
+            Election(electiondate='2016-03-01').results
+
+        totals = recorded.serialize()
+        self.assertEqual(totals['fetch']['calls'], 1)
+        self.assertEqual(totals['fetch (cached)']['calls'], 1)
+        self.assertEqual(totals['decode']['calls'], 1)
+        self.assertEqual(totals['units']['calls'], 1)